@@ -1,9 +1,6 @@
 import asyncio
 import streamlit as st
 import pandas as pd
-import io
-import PyPDF2
-import docx
 from typing import List, Dict
 from dotenv import load_dotenv
 import os
@@ -13,7 +10,23 @@ load_dotenv()
 
 from semantic_kernel.contents.chat_message_content import ChatMessageContent
 from semantic_kernel.contents.utils.author_role import AuthorRole
-from src.mas import Orchestrator, MultiAgent
+from src.mas import Orchestrator, MultiAgent, track_stream
+from src.map_reduce import MapReduceScreening, reduce_verdicts, verdicts_from_report
+from src.progress import DONE, FIRST_TOKEN, STARTED, ProgressReporter, RunTimer
+from src.scheduler import get_scheduler
+from src.screening_ledger import get_screening_ledger
+from src.termination import has_verdict
+from src.structured import structured_output_enabled
+from src.extraction import (
+    SUPPORTED_TYPES,
+    ExtractionJob,
+    ExtractionStats,
+    extract_text_from_docx_bytes,
+    extract_text_from_pdf_bytes,
+    get_extraction_engine,
+)
+from src.resume_index import ResumeIndex, prefilter_resumes
+from src.corpus_store import StoredResume, get_corpus_store
 from src.usage_protection import UsageTracker, add_usage_monitoring, show_usage_stats
 
 st.set_page_config(
@@ -94,11 +107,7 @@ st.markdown(
 def extract_text_from_pdf(pdf_file) -> str:
     """Extract text from PDF file"""
     try:
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
-        return text
+        return extract_text_from_pdf_bytes(pdf_file.getvalue())
     except Exception as e:
         st.error(f"Error reading PDF: {str(e)}")
         return ""
@@ -106,45 +115,67 @@ def extract_text_from_pdf(pdf_file) -> str:
 def extract_text_from_docx(docx_file) -> str:
     """Extract text from DOCX file"""
     try:
-        doc = docx.Document(docx_file)
-        text = ""
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-        return text
+        return extract_text_from_docx_bytes(docx_file.getvalue())
     except Exception as e:
         st.error(f"Error reading DOCX: {str(e)}")
         return ""
 
 def process_resume_files(uploaded_files) -> List[Dict]:
-    """Process uploaded resume files and extract text"""
-    resumes = []
-    for uploaded_file in uploaded_files:
+    """Process uploaded resume files and extract text on the extraction worker pool"""
+    jobs = []
+    for index, uploaded_file in enumerate(uploaded_files):
         st.write(f"🔍 Processing: {uploaded_file.name} (Type: {uploaded_file.type})")
-        
-        if uploaded_file.type == "application/pdf":
-            text = extract_text_from_pdf(uploaded_file)
-        elif uploaded_file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-            text = extract_text_from_docx(uploaded_file)
-        elif uploaded_file.type == "text/plain":
-            text = str(uploaded_file.read(), "utf-8")
-        else:
+        if uploaded_file.type not in SUPPORTED_TYPES:
             st.warning(f"Unsupported file type: {uploaded_file.type}")
             continue
-            
-        if text.strip():
-            resumes.append({
-                "filename": uploaded_file.name,
-                "content": text
-            })
-            st.success(f"✅ Successfully extracted {len(text)} characters from {uploaded_file.name}")
+        jobs.append(ExtractionJob.from_uploaded_file(uploaded_file, index))
+
+    engine = get_extraction_engine()
+    stats = ExtractionStats()
+    progress = st.progress(0)
+    extracted = []
+    for done, result in enumerate(engine.extract_iter(jobs, stats=stats), start=1):
+        progress.progress(done / len(jobs))
+        if result.ok:
+            extracted.append(result)
+            source = " (cached)" if result.cached else ""
+            st.success(f"✅ Successfully extracted {len(result.text)} characters from {result.filename}{source}")
+            if result.truncated:
+                st.warning(f"✂️ {result.filename} exceeds the extraction budget - only the first part was kept")
+        elif result.error:
+            st.error(f"❌ Failed to extract text from {result.filename} - {result.error}")
         else:
-            st.error(f"❌ Failed to extract text from {uploaded_file.name} - file appears to be empty or corrupted")
-    
+            st.error(f"❌ Failed to extract text from {result.filename} - file appears to be empty or corrupted")
+    progress.empty()
+
+    # Keep the upload order regardless of which worker finished first
+    extracted.sort(key=lambda result: result.index)
+    if os.getenv("CORPUS_STORE", "true").lower() == "true":
+        # Keep the text in the shared memory-mapped corpus instead of per-session strings
+        store = get_corpus_store()
+        resumes = [store.add_resume(result.filename, result.text) for result in extracted]
+    else:
+        resumes = [{"filename": result.filename, "content": result.text, "chars": len(result.text)}
+                   for result in extracted]
+
     st.write(f"📊 Total processed resumes: {len(resumes)}")
+    if jobs:
+        st.caption(f"⚡ {stats.summary()}")
     return resumes
 
-async def run_resume_screening(job_profile, resumes, num_agents):
-    """Run the resume screening process"""
+def drop_missing_resumes():
+    """Remove resumes whose stored text another process compacted away and ask for a re-upload"""
+    kept = []
+    for resume in st.session_state.resumes:
+        if isinstance(resume, StoredResume) and not resume.available:
+            st.session_state.resume_index.remove(resume['filename'])
+            st.warning(f"⚠️ {resume['filename']} is no longer in the resume store - please upload it again")
+        else:
+            kept.append(resume)
+    st.session_state.resumes = kept
+
+async def plan_resume_screening(job_profile, resumes, num_agents):
+    """Get the agent roster for the job profile (from the roster cache when it was planned before) and the agents' model"""
     # Create screening context
     screening_context = {
         "job_profile": job_profile,
@@ -153,17 +184,105 @@ async def run_resume_screening(job_profile, resumes, num_agents):
     }
     
     orchestrator = Orchestrator(screening_context, num_agents)
-    dynamic_agents = orchestrator.run()
+    dynamic_agents = await orchestrator.run_async()
+    return dynamic_agents, f"{orchestrator.service_type}:{orchestrator.model}"
 
+def create_screening_agents(dynamic_agents):
+    """Create the expert agents of a roster"""
     mas = MultiAgent()
     expert_agents = mas.create_agents(dynamic_agents)
     expert_agents_names = [agent.name for agent in expert_agents]
 
     return expert_agents, expert_agents_names, mas
 
-async def main_screening(job_profile, resumes, num_agents, max_interactions=None):
+async def run_map_reduce_screening(job_profile, resumes, expert_agents, mas, reporter, timer):
+    """Score every resume independently with each agent, then merge the verdicts into a ranking"""
+    progress_bar = st.progress(0)
+    status_text = st.empty()
+
+    def on_verdict(verdict, done, total):
+        with timer.measure("ui"):
+            progress_bar.progress(done / total)
+            status_text.markdown(f"**{done}/{total} verdicts** | latest: **{verdict.agent}** on *{verdict.filename}*")
+
+    with st.spinner(f"🔍 Screening {len(resumes)} resume(s) independently..."):
+        screening = MapReduceScreening(expert_agents, mas.completion_client, mas.model)
+        with timer.measure("model"):
+            verdicts = await screening.screen(job_profile, resumes, on_verdict=on_verdict, reporter=reporter)
+
+    progress_bar.progress(1.0)
+    status_text.markdown("**✅ Resume screening completed!**")
+    return verdicts
+
+def rank_screening(ledger, requisition, screened, verdicts, stored, resumes, agents=()):
+    """Record the new verdicts of resumes every agent scored in the ledger and rank the whole pool with the stored ones"""
+    if ledger is not None and verdicts:
+        ledger.record(requisition, screened, verdicts, agents)
+    if not verdicts and not stored:
+        return None
+    return reduce_verdicts(stored + verdicts, resumes)
+
+# Screening modes offered in the UI; SCREENING_MODE picks the default
+SCREENING_MODES = {
+    "chat": "Agent group chat",
+    "map_reduce": "Score each resume independently (map/reduce)",
+}
+
+def default_screening_mode():
+    """SCREENING_MODE from the environment, or "chat" when it is not a known mode"""
+    mode = os.getenv("SCREENING_MODE", "chat").strip().lower()
+    return mode if mode in SCREENING_MODES else "chat"
+
+# Define agent specializations for better user understanding
+AGENT_SPECIALIZATIONS = {
+    "Skills_Analysis_Agent": "🔧 Technical Skills & Expertise",
+    "Experience_Evaluation_Agent": "📈 Work Experience & Career",
+    "Education_Assessment_Agent": "🎓 Educational Background",
+    "Cultural_Fit_Agent": "🤝 Team & Cultural Alignment",
+    "Leadership_Assessment_Agent": "👑 Leadership & Management",
+    "Technical_Depth_Agent": "🔬 Deep Technical Analysis"
+}
+
+def render_agent_status(placeholder, agent_name, status):
+    """Draw one agent's card in the sidebar"""
+    specialization = AGENT_SPECIALIZATIONS.get(agent_name, "🔍 General Analysis")
+    placeholder.markdown(
+        f'<div class="agent-status">👤 <strong>{agent_name}</strong><br><small>{specialization}</small><br>{status}</div>', 
+        unsafe_allow_html=True
+    )
+
+def agent_event_status(event):
+    """Sidebar status line for an agent lifecycle event"""
+    if event.kind == STARTED:
+        return f"🔍 Reviewing {event.detail}" if event.detail else "🔍 Analyzing..."
+    if event.kind == FIRST_TOKEN:
+        return "💬 Responding..."
+    if event.kind == DONE:
+        return f"✅ Done<br><small>{event.detail}</small>" if event.detail else "✅ Done"
+    return f"❌ Error<br><small>{event.detail[:120]}</small>"
+
+async def main_screening(job_profile, resumes, num_agents, max_interactions=None, mode="chat"):
     """Main screening process"""
-    expert_agents, expert_agents_names, mas = await run_resume_screening(job_profile, resumes, num_agents)
+    timer = RunTimer()
+    with timer.measure("setup"):
+        dynamic_agents, model = await plan_resume_screening(job_profile, resumes, num_agents)
+
+    # Resumes already scored for this requisition come from the ledger; only new or changed ones are screened
+    all_resumes, stored, requisition = resumes, [], None
+    ledger = get_screening_ledger()
+    if ledger is not None:
+        requisition = ledger.requisition_key(job_profile, dynamic_agents, model)
+        stored, resumes = ledger.lookup(requisition, all_resumes)
+        if len(resumes) < len(all_resumes):
+            st.info(f"♻️ Reusing stored verdicts for {len(all_resumes) - len(resumes)} of {len(all_resumes)} resume(s); "
+                    f"screening {len(resumes)} new or changed")
+    st.session_state.resumes_screened = len(resumes)
+    if not resumes:
+        # Nothing changed since the last run: no agents are created and no model is called
+        return rank_screening(ledger, requisition, [], [], stored, all_resumes)
+
+    with timer.measure("setup"):
+        expert_agents, expert_agents_names, mas = create_screening_agents(dynamic_agents)
     
     # Set max_interactions based on number of agents if not specified
     if max_interactions is None:
@@ -172,36 +291,35 @@ async def main_screening(job_profile, resumes, num_agents, max_interactions=None
     with st.sidebar:
         st.title("🤖 Expert Screening Agents")
         agent_placeholders = {name: st.empty() for name in expert_agents_names}
-        agent_status = {name: "⏳ Initializing..." for name in expert_agents_names}
-        
-        # Define agent specializations for better user understanding
-        agent_specializations = {
-            "Skills_Analysis_Agent": "🔧 Technical Skills & Expertise",
-            "Experience_Evaluation_Agent": "📈 Work Experience & Career",
-            "Education_Assessment_Agent": "🎓 Educational Background",
-            "Cultural_Fit_Agent": "🤝 Team & Cultural Alignment",
-            "Leadership_Assessment_Agent": "👑 Leadership & Management",
-            "Technical_Depth_Agent": "🔬 Deep Technical Analysis"
-        }
-        
         for agent_name in expert_agents_names:
-            specialization = agent_specializations.get(agent_name, "🔍 General Analysis")
-            agent_placeholders[agent_name].markdown(
-                f'<div class="agent-status">👤 <strong>{agent_name}</strong><br><small>{specialization}</small><br>⏳ Initializing...</div>', 
-                unsafe_allow_html=True
-            )
-            await asyncio.sleep(1)
+            render_agent_status(agent_placeholders[agent_name], agent_name, "⏳ Waiting...")
 
-    selection_function = mas.create_selection_function(expert_agents)
-    termination_keyword = 'yes'
-    termination_function = mas.create_termination_function(termination_keyword)
+    # The sidebar follows the agents' actual lifecycle events
+    def on_agent_event(event):
+        if event.agent in agent_placeholders:
+            render_agent_status(agent_placeholders[event.agent], event.agent, agent_event_status(event))
 
-    group = mas.create_chat_group(
-        expert_agents,
-        selection_function,
-        termination_function,
-        termination_keyword
-    )
+    reporter = ProgressReporter(on_agent_event, timer)
+
+    if mode == "map_reduce":
+        verdicts = await run_map_reduce_screening(job_profile, resumes, expert_agents, mas, reporter, timer)
+        st.caption(f"⏱️ {timer.summary()} · 🚦 {get_scheduler(mas.service_type).summary()}")
+        return rank_screening(ledger, requisition, resumes, verdicts, stored, all_resumes, expert_agents_names)
+
+    with timer.measure("setup"):
+        selection_function = mas.create_selection_function(expert_agents)
+        termination_keyword = 'yes'
+        termination_function = mas.create_termination_function(termination_keyword)
+
+        group = mas.create_chat_group(
+            expert_agents,
+            selection_function,
+            termination_function,
+            termination_keyword,
+            candidates=[resume["filename"] for resume in resumes]
+        )
+        if hasattr(group, "reporter"):
+            group.reporter = reporter
 
     interactions: int = 0
     is_complete: bool = False
@@ -275,52 +393,67 @@ async def main_screening(job_profile, resumes, num_agents, max_interactions=None
     progress_bar = st.progress(0)
     status_text = st.empty()
     detailed_status = st.empty()
+    live_output = st.empty()
+    stream_metrics = {}
+    # Latest structured scores reported by each agent, merged into the ranking at the end
+    agent_verdicts = {}
     
-    with st.spinner("🔍 Screening resumes..."):
+    with st.spinner("🔍 Screening resumes..."), timer.measure("model"):
         while not is_complete and interactions < max_interactions:
-            # Update agent status with detailed activity
             current_agent = expert_agents_names[interactions % len(expert_agents_names)]
             current_round = interactions + 1
             
             # Get detailed activity for this agent
             current_activity = get_agent_activity(current_agent, current_round, len(resumes))
             
-            agent_status[current_agent] = f"🔍 {current_activity.split(' ', 1)[1]}"  # Remove emoji from activity
-            specialization = agent_specializations.get(current_agent, "🔍 General Analysis")
-            agent_placeholders[current_agent].markdown(
-                f'<div class="agent-status">👤 <strong>{current_agent}</strong><br><small>{specialization}</small><br>🔍 {current_activity.split(" ", 1)[1]}</div>', 
-                unsafe_allow_html=True
-            )
-            
             # Update main status with detailed information
-            phase = "Initial Analysis" if current_round <= max_interactions // 2 else "Deep Analysis & Validation"
-            status_text.markdown(f"**Round {current_round}/{max_interactions}** | **{current_agent}** | {len(expert_agents)} agents total | *{phase}*")
-            detailed_status.info(f"🎯 {current_activity}")
-            progress_bar.progress(current_round / max_interactions)
+            with timer.measure("ui"):
+                phase = "Initial Analysis" if current_round <= max_interactions // 2 else "Deep Analysis & Validation"
+                status_text.markdown(f"**Round {current_round}/{max_interactions}** | **{current_agent}** | {len(expert_agents)} agents total | *{phase}*")
+                detailed_status.info(f"🎯 {current_activity}")
+                progress_bar.progress(current_round / max_interactions)
             
             await group.add_chat_message(ChatMessageContent(role=AuthorRole.USER, content=screening_input))
+            # The repeated input is kept once and older turns are folded into a summary
+            if hasattr(group, "reduce_history"):
+                await group.reduce_history()
 
-            async for response in group.invoke_stream():
-                # Check if the response contains termination keyword
-                if termination_keyword.lower() in response.content.lower():
-                    is_complete = True
-                    break
+            # Show each agent's response as it streams in
+            stream = group.invoke_stream()
+            if not hasattr(group, "stream_metrics"):
+                stream = track_stream(stream, stream_metrics, reporter, group)
+            agent_outputs = {}
+            async for chunk in stream:
+                if not chunk.content:
+                    continue
+                agent_outputs[chunk.name] = agent_outputs.get(chunk.name, "") + chunk.content
+                with timer.measure("ui"):
+                    live_output.markdown(f"**💬 {chunk.name}:** {agent_outputs[chunk.name][-600:]}")
+            # Only finished messages are checked, a partial one may end mid-sentence or mid-JSON
+            is_complete = group.is_complete or any(
+                has_verdict(output, termination_keyword) for output in agent_outputs.values())
+            stream_metrics.update(getattr(group, "stream_metrics", {}))
+            for agent_name, output in agent_outputs.items():
+                verdicts = verdicts_from_report(agent_name, output, resumes)
+                if verdicts:
+                    agent_verdicts[agent_name] = verdicts
 
             interactions += 1
-            await asyncio.sleep(1)
     
     # Update final status with completion summary
     for agent_name in expert_agents_names:
-        agent_status[agent_name] = "✅ Analysis Complete - Ready for results compilation"
-        specialization = agent_specializations.get(agent_name, "🔍 General Analysis")
-        agent_placeholders[agent_name].markdown(
-            f'<div class="agent-status">👤 <strong>{agent_name}</strong><br><small>{specialization}</small><br>✅ Analysis Complete</div>', 
-            unsafe_allow_html=True
-        )
+        metrics = stream_metrics.get(agent_name)
+        timing = f"<br><small>⚡ {metrics.summary()}</small>" if metrics else ""
+        render_agent_status(agent_placeholders[agent_name], agent_name, f"✅ Analysis Complete{timing}")
     
+    live_output.empty()
     progress_bar.progress(1.0)
     status_text.markdown("**✅ Resume screening completed!**")
     detailed_status.success(f"🎉 All {len(expert_agents)} agents have completed their analysis of {len(resumes)} resume(s). Compiling final results...")
+    st.caption(f"⏱️ {timer.summary()} · 🚦 {get_scheduler(mas.service_type).summary()}")
+    verdicts = [verdict for verdicts in agent_verdicts.values() for verdict in verdicts]
+    return rank_screening(ledger, requisition, resumes, verdicts, stored, all_resumes, expert_agents_names)
+
 # Streamlit UI for Resume Screening
 def app():
     # Initialize session state variables
@@ -328,6 +461,11 @@ def app():
         st.session_state.job_profile = ""
     if 'resumes' not in st.session_state:
         st.session_state.resumes = []
+    if 'resume_index' not in st.session_state:
+        st.session_state.resume_index = ResumeIndex()
+    drop_missing_resumes()
+    if 'prefilter_top_k' not in st.session_state:
+        st.session_state.prefilter_top_k = int(os.getenv("RESUME_PREFILTER_TOP_K", "30"))
     if 'num_agents' not in st.session_state:
         st.session_state.num_agents = 4
     if 'analysis_depth' not in st.session_state:
@@ -336,6 +474,8 @@ def app():
         st.session_state.running = False
     if 'screening_results' not in st.session_state:
         st.session_state.screening_results = None
+    if 'screening_mode' not in st.session_state:
+        st.session_state.screening_mode = default_screening_mode()
 
     st.title("📋 AI Resume Screening & Matching System 📋")
     st.subheader("Intelligent resume screening with AI expert agents")
@@ -496,6 +636,7 @@ def app():
                 for res in newly_processed_resumes:
                     if res['filename'] not in existing_filenames:
                         st.session_state.resumes.append(res)
+                        st.session_state.resume_index.add(res['filename'], res['content'])
                         existing_filenames.add(res['filename'])
                         added_count += 1
                     else:
@@ -511,12 +652,13 @@ def app():
             with st.expander("🔍 Debug Information", expanded=False):
                 st.write("**Current resumes in session state:**")
                 for i, resume in enumerate(st.session_state.resumes):
-                    st.write(f"{i+1}. {resume['filename']} ({len(resume['content'])} chars)")
+                    st.write(f"{i+1}. {resume['filename']} ({resume['chars']} chars)")
             
             col_clear, col_space = st.columns([1, 3])
             with col_clear:
                 if st.button("🗑️ Clear All Resumes", help="Remove all uploaded files and start over", key="clear_resumes_button"):
                     st.session_state.resumes = []
+                    st.session_state.resume_index.clear()
                     st.rerun()
             
             # Enhanced resume preview with file info
@@ -524,18 +666,24 @@ def app():
                 for i, resume in enumerate(st.session_state.resumes):
                     # File info header
                     file_extension = resume['filename'].split('.')[-1].upper()
-                    file_size = f"{len(resume['content'])} chars"
+                    file_size = f"{resume['chars']} chars"
                     
                     col_info, col_remove = st.columns([4, 1])
                     with col_info:
                         st.markdown(f"**📄 {i+1}. {resume['filename']}** (`{file_extension}` • {file_size})")
                     with col_remove:
                         if st.button("❌", key=f"remove_{i}", help=f"Remove {resume['filename']}"):
-                            st.session_state.resumes.pop(i)
+                            removed = st.session_state.resumes.pop(i)
+                            st.session_state.resume_index.remove(removed['filename'])
                             st.rerun()
                     
                     # Content preview
-                    preview_text = resume['content'][:300] + "..." if len(resume['content']) > 300 else resume['content']
+                    try:
+                        content = resume['content']
+                    except KeyError:
+                        st.warning("⚠️ This resume is no longer in the resume store - please upload it again")
+                        continue
+                    preview_text = content[:300] + "..." if len(content) > 300 else content
                     st.text_area(
                         f"Content preview:",
                         value=preview_text,
@@ -596,6 +744,27 @@ def app():
             }
             st.info(depth_descriptions[analysis_depth])
 
+            st.markdown("**🎯 Pre-filter**")
+            prefilter_top_k = st.number_input(
+                "Send only the best matching resumes to the agents",
+                min_value=0,
+                value=st.session_state.prefilter_top_k,
+                step=5,
+                help="💡 Resumes are ranked locally against the job profile (BM25) before screening. 0 sends every resume."
+            )
+            st.session_state.prefilter_top_k = prefilter_top_k
+
+            st.markdown("**🧩 Screening Mode**")
+            screening_mode = st.radio(
+                "How agents review the resumes",
+                list(SCREENING_MODES),
+                index=list(SCREENING_MODES).index(st.session_state.screening_mode),
+                format_func=SCREENING_MODES.get,
+                help="💡 Map/reduce sends every full resume to each agent separately and merges their scores, which scales to large pools"
+            )
+            st.session_state.screening_mode = screening_mode
+
+    results_displayed = False
     with tab4:
         # Review inputs and final Start Screening button
         st.markdown("### 🚀 Review & Start Screening")
@@ -604,6 +773,7 @@ def app():
         resumes_tab4 = st.session_state.get('resumes', []) # Get from session_state or default
 
         can_start = job_profile_tab4.strip() and resumes_tab4
+        prefilter_top_k = st.session_state.get('prefilter_top_k', 0)
         
         # Display a summary of what will be screened
         if job_profile_tab4.strip():
@@ -615,8 +785,10 @@ def app():
         if resumes_tab4:
             with st.expander(f"Review Resumes ({len(resumes_tab4)})", expanded=False):
                 st.write(f"**Total resumes to be screened: {len(resumes_tab4)}**")
+                if 0 < prefilter_top_k < len(resumes_tab4):
+                    st.info(f"🎯 Only the {prefilter_top_k} best matching resume(s) will be sent to the agents")
                 for i, resume in enumerate(resumes_tab4):
-                    st.markdown(f"**{i+1}. {resume['filename']}** ({len(resume['content'])} characters)")
+                    st.markdown(f"**{i+1}. {resume['filename']}** ({resume['chars']} characters)")
                     
                 # Debug section
                 st.write("---")
@@ -634,8 +806,15 @@ def app():
             key="start_screening_button_tab4" # Added key
         ):
             if can_start:
+                # Pre-filter the pool locally so only the most promising resumes reach the agents
+                resumes_to_screen = prefilter_resumes(
+                    st.session_state.resume_index, resumes_tab4, job_profile_tab4, prefilter_top_k
+                )
+                if len(resumes_to_screen) < len(resumes_tab4):
+                    st.info(f"🎯 Pre-filtered {len(resumes_to_screen)} of {len(resumes_tab4)} resume(s) for screening")
+
                 # Check usage limits before proceeding
-                if not add_usage_monitoring():
+                if not add_usage_monitoring(len(resumes_to_screen)):
                     st.stop()  # Stop execution if limits exceeded
                 
                 st.session_state.running = True
@@ -646,7 +825,7 @@ def app():
                 
                 # Assuming job_profile and resumes are updated in session_state from their respective tabs
                 job_profile_to_screen = st.session_state.get('job_profile', "")
-                resumes_to_screen = st.session_state.get('resumes', [])
+                st.session_state.screened_resumes = resumes_to_screen
 
                 with st.container():
                     st.markdown("---")
@@ -654,46 +833,51 @@ def app():
                     
                     try:
                         screening_results = asyncio.run(
-                            main_screening(job_profile_to_screen, resumes_to_screen, st.session_state.get('num_agents', 4)) # Ensure num_agents is also available
+                            main_screening(job_profile_to_screen, resumes_to_screen, st.session_state.get('num_agents', 4), # Ensure num_agents is also available
+                                           mode=st.session_state.get('screening_mode', "chat"))
                         )
                         st.session_state.screening_results = screening_results
                         st.session_state.running = False
                         
                         # Record usage after successful processing
                         tracker = UsageTracker()
-                        total_cost = len(resumes_to_screen) * tracker.cost_per_resume
-                        usage = tracker.record_usage(num_resumes=len(resumes_to_screen), actual_cost=total_cost)
+                        # Resumes reused from the screening ledger cost nothing
+                        num_screened = st.session_state.get('resumes_screened', len(resumes_to_screen))
+                        total_cost = num_screened * tracker.cost_per_resume
+                        usage = tracker.record_usage(num_resumes=num_screened, actual_cost=total_cost)
                         
                         st.success(f"✅ Screening completed! Daily usage: ${usage['daily_cost']:.2f}")
                         
                         # Display results
                         display_screening_results(screening_results, resumes_to_screen)
+                        results_displayed = True
                         
                     except Exception as e:
                         st.error(f"❌ An error occurred during screening: {str(e)}")
                         st.session_state.running = False
     
     # Display previous results if available
-    if st.session_state.get('screening_results') and not st.session_state.get('running', False):
+    if st.session_state.get('screening_results') and not st.session_state.get('running', False) and not results_displayed:
         st.markdown("---")
         st.markdown("### 📊 Latest Screening Results")
-        display_screening_results(st.session_state.screening_results, st.session_state.get('resumes', []))
+        display_screening_results(
+            st.session_state.screening_results,
+            st.session_state.get('screened_resumes', st.session_state.get('resumes', []))
+        )
 
 def display_screening_results(results, resumes):
     """Display the screening results in an organized format"""
     st.markdown("### 🎯 Matching Results")
     
-    # Mock results for demonstration (replace with actual agent results)
-    sample_results = []
-    for i, resume in enumerate(resumes):
-        score = 85 - (i * 5)  # Mock decreasing scores
-        sample_results.append({
-            "filename": resume["filename"],
-            "score": score,
-            "explanation": f"Strong match with {score}% compatibility. Candidate shows excellent technical skills and relevant experience.",
-            "strengths": ["Technical expertise", "Industry experience", "Education background"],
-            "concerns": ["Limited experience in specific domain", "Skill gap in emerging technologies"]
-        })
+    if not isinstance(results, list):
+        if structured_output_enabled():
+            st.warning("⚠️ None of the agents' replies could be read as candidate scores for this run, so there is no ranking.")
+        else:
+            st.info("ℹ️ The agents did not report structured scores for this run. Enable STRUCTURED_OUTPUT to rank the candidates.")
+        return
+    # Ranked results merged from the agents' structured verdicts
+    sample_results = [result for result in results if result["score"] is not None]
+    unscored_results = [result for result in results if result["score"] is None]
     
     # Sort by score
     sample_results.sort(key=lambda x: x["score"], reverse=True)
@@ -724,11 +908,18 @@ def display_screening_results(results, resumes):
                 st.markdown("**⚠️ Areas of Concern:**")
                 for concern in result["concerns"]:
                     st.write(f"• {concern}")
+
+    # Resumes every agent failed on are listed apart instead of ranked as a zero
+    for result in unscored_results:
+        with st.expander(f"⚠️ {result['filename']} - Not scored / error", expanded=False):
+            st.write(result["explanation"])
+            for error in result.get("errors", []):
+                st.write(f"• {error}")
     
     # Download report button
     if st.button("📥 Download Detailed Report", type="secondary"):
         # Generate and download report
-        report_data = generate_report(sample_results)
+        report_data = generate_report(sample_results + unscored_results)
         st.download_button(
             label="📄 Download CSV Report",
             data=report_data,
@@ -744,6 +935,9 @@ def generate_report(results):
     # Create CSV content
     output.write("Rank,Filename,Score,Status,Summary\n")
     for i, result in enumerate(results):
+        if result["score"] is None:
+            output.write(f",{result['filename']},,Not scored / error,\"{result['explanation']}\"\n")
+            continue
         status = "Excellent" if result["score"] >= 80 else "Good" if result["score"] >= 60 else "Poor"
         output.write(f"{i+1},{result['filename']},{result['score']}%,{status},\"{result['explanation']}\"\n")
     
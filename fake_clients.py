@@ -0,0 +1,51 @@
+"""
+OpenAI-style client stand-ins shared by the test scripts (no API calls)
+"""
+
+import asyncio
+
+
+def chat_message(content, **fields):
+    return type("Message", (), {"content": content, **fields})()
+
+
+def chat_response(text, finish_reason="stop"):
+    """A non-streaming chat completion carrying one choice"""
+    choice = type("Choice", (), {"message": chat_message(text), "finish_reason": finish_reason})()
+    return type("Response", (), {"choices": [choice]})()
+
+
+def stream_chunk(text, finish_reason=None):
+    """One streamed delta of a chat completion"""
+    delta = type("Delta", (), {"content": text})()
+    choice = type("Choice", (), {"delta": delta, "finish_reason": finish_reason})()
+    return type("Chunk", (), {"choices": [choice]})()
+
+
+def chat_client(completions):
+    """A client whose chat.completions is the given object, or wraps a bare create function"""
+    if not hasattr(completions, "create"):
+        completions = type("Completions", (), {"create": staticmethod(completions)})()
+    return type("Client", (), {"chat": type("Chat", (), {"completions": completions})()})()
+
+
+def fake_agent(name, instructions="Review resumes"):
+    return type("Agent", (), {"name": name, "instructions": instructions})()
+
+
+class FakeCompletions:
+    """Async chat completions that record every request; subclasses decide the reply text"""
+
+    delay = 0.0
+
+    def __init__(self):
+        self.requests = []
+
+    def reply(self, messages) -> str:
+        raise NotImplementedError
+
+    async def create(self, model, messages, **kwargs):
+        self.requests.append(messages)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return chat_response(self.reply(messages))
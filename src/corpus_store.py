@@ -0,0 +1,342 @@
+"""
+Persistent resume corpus store.
+
+Extracted resume text is appended to segment files on disk and located through an
+append-only offset/length index. Reads go through `mmap`, so every Streamlit session
+and worker process on the machine shares one page-cached copy of the corpus instead
+of holding its own Python strings. Documents are content addressed, so the same
+resume uploaded by several recruiters is stored once. Whole segments are dropped,
+oldest first, once the store outgrows its size budget or a segment outlives its TTL,
+except segments that a live `StoredResume` handle in this process still points to.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import threading
+import time
+import weakref
+from typing import Dict, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends are still serialized within the process
+    fcntl = None
+
+
+class _Location:
+    __slots__ = ("segment", "offset", "length")
+
+    def __init__(self, segment: int, offset: int, length: int):
+        self.segment = segment
+        self.offset = offset
+        self.length = length
+
+
+class CorpusStore:
+    """Append-only, memory-mapped store of resume texts keyed by content hash"""
+
+    def __init__(self, root: Optional[str] = None, segment_max_bytes: Optional[int] = None,
+                 max_bytes: Optional[int] = None, ttl_seconds: Optional[float] = None):
+        self.root = root or os.getenv("CORPUS_STORE_DIR", ".cache/corpus")
+        if segment_max_bytes is None:
+            segment_max_bytes = int(float(os.getenv("CORPUS_SEGMENT_MAX_MB", "64")) * 1024 * 1024)
+        self.segment_max_bytes = segment_max_bytes
+        if max_bytes is None:
+            max_bytes = int(float(os.getenv("CORPUS_STORE_MAX_MB", "1024")) * 1024 * 1024)
+        self.max_bytes = max_bytes
+        if ttl_seconds is None:
+            ttl_seconds = float(os.getenv("CORPUS_STORE_TTL_DAYS", "30")) * 86400
+        self.ttl_seconds = ttl_seconds
+        self.evicted_segments = 0
+        os.makedirs(self.root, exist_ok=True)
+        self._index_path = os.path.join(self.root, "index.jsonl")
+        self._lock_path = os.path.join(self.root, ".lock")
+        self._locations: Dict[str, _Location] = {}
+        self._index_offset = 0
+        self._index_inode = None
+        self._maps = {}  # segment -> (mmap, mapped size)
+        self._lock = threading.RLock()
+        # Live StoredResume handles by id(); their segments are never compacted away
+        self._handles = weakref.WeakValueDictionary()
+        self._refresh()
+        self.compact()
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self.root, f"segment-{segment:06d}.dat")
+
+    def _refresh(self):
+        """Read index entries appended since the last refresh, including by other processes"""
+        if not os.path.exists(self._index_path):
+            return
+        with open(self._index_path, "rb") as f:
+            inode = os.fstat(f.fileno()).st_ino
+            if inode != self._index_inode:
+                # The index was rewritten by a compaction, possibly in another process
+                self._index_inode = inode
+                self._index_offset = 0
+                self._locations.clear()
+            f.seek(self._index_offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # another process is mid-write, pick it up next time
+                self._index_offset += len(line)
+                entry = json.loads(line)
+                self._locations[entry["id"]] = _Location(entry["segment"], entry["offset"], entry["length"])
+
+    def _file_lock(self):
+        return _FileLock(self._lock_path)
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._locations
+
+    @staticmethod
+    def doc_id_for(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def put(self, text: str) -> str:
+        """Store a document if it is not already present and return its id"""
+        doc_id = self.doc_id_for(text)
+        if doc_id in self._locations:
+            return doc_id
+        data = text.encode("utf-8")
+        with self._lock, self._file_lock():
+            self._refresh()
+            if doc_id in self._locations:
+                return doc_id
+            segment = max((location.segment for location in self._locations.values()), default=1)
+            path = self._segment_path(segment)
+            rolled_over = os.path.exists(path) and os.path.getsize(path) + len(data) > self.segment_max_bytes
+            if rolled_over:
+                segment += 1
+                path = self._segment_path(segment)
+            with open(path, "ab") as f:
+                offset = f.tell()
+                f.write(data)
+            with open(self._index_path, "ab") as f:
+                f.write(json.dumps({"id": doc_id, "segment": segment, "offset": offset,
+                                    "length": len(data)}).encode("utf-8") + b"\n")
+            self._refresh()
+            if rolled_over:
+                self._compact_locked()
+        return doc_id
+
+    def compact(self) -> int:
+        """Drop expired segments and the oldest ones past the size budget; returns how many were dropped"""
+        with self._lock, self._file_lock():
+            self._refresh()
+            return self._compact_locked()
+
+    def _compact_locked(self) -> int:
+        """
+        Compaction with both locks held. The segment being appended to is always kept, and
+        so are segments holding documents that sessions in this process still reference.
+        """
+        segments = sorted(int(name[8:14]) for name in os.listdir(self.root)
+                          if name.startswith("segment-") and name.endswith(".dat"))
+        if len(segments) < 2:
+            return 0
+        sizes = {segment: os.stat(self._segment_path(segment)) for segment in segments}
+        total = sum(stat.st_size for stat in sizes.values())
+        expired_before = time.time() - self.ttl_seconds if self.ttl_seconds > 0 else float("-inf")
+        pinned = self._pinned_segments()
+        dropped = set()
+        for segment in segments[:-1]:
+            over_budget = self.max_bytes > 0 and total > self.max_bytes
+            if not over_budget and sizes[segment].st_mtime >= expired_before:
+                break
+            if segment in pinned:
+                continue
+            dropped.add(segment)
+            total -= sizes[segment].st_size
+        if not dropped:
+            return 0
+
+        # Rewrite the index without the dropped documents, then swap it in atomically
+        kept = {doc_id: location for doc_id, location in self._locations.items() if location.segment not in dropped}
+        temp_path = self._index_path + ".tmp"
+        with open(temp_path, "wb") as f:
+            for doc_id, location in kept.items():
+                f.write(json.dumps({"id": doc_id, "segment": location.segment, "offset": location.offset,
+                                    "length": location.length}).encode("utf-8") + b"\n")
+        os.replace(temp_path, self._index_path)
+        for segment in dropped:
+            mapped = self._maps.pop(segment, None)
+            if mapped is not None:
+                mapped[0].close()
+            os.remove(self._segment_path(segment))
+        self._refresh()
+        self.evicted_segments += len(dropped)
+        return len(dropped)
+
+    def _pinned_segments(self) -> set:
+        locations = (self._locations.get(handle.doc_id) for handle in list(self._handles.values()))
+        return {location.segment for location in locations if location is not None}
+
+    def _register(self, handle: "StoredResume"):
+        with self._lock:
+            self._handles[id(handle)] = handle
+
+    def available(self, doc_id: str) -> bool:
+        """Whether a document can still be read, i.e. no compaction in any process dropped it"""
+        with self._lock:
+            self._refresh()
+            location = self._locations.get(doc_id)
+            return location is not None and os.path.exists(self._segment_path(location.segment))
+
+    def get(self, doc_id: str) -> str:
+        """Read a document through the memory-mapped segment"""
+        location = self._locations.get(doc_id)
+        if location is None:
+            with self._lock:
+                self._refresh()
+            location = self._locations.get(doc_id)
+            if location is None:
+                raise KeyError(doc_id)
+        if location.length == 0:
+            return ""
+        end = location.offset + location.length
+        with self._lock:
+            try:
+                mapped = self._map_segment(location.segment, end)
+            except FileNotFoundError:
+                raise KeyError(doc_id) from None  # dropped by a compaction in another process
+            # Decode straight from the shared mapping, the only copy made is the str itself
+            with memoryview(mapped)[location.offset:end] as view:
+                return str(view, "utf-8")
+
+    def _map_segment(self, segment: int, min_size: int) -> mmap.mmap:
+        mapped = self._maps.get(segment)
+        if mapped is None or mapped[1] < min_size:
+            if mapped is not None:
+                mapped[0].close()
+            with open(self._segment_path(segment), "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                mapped = (mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ), size)
+            self._maps[segment] = mapped
+        return mapped[0]
+
+    def ids(self) -> Iterator[str]:
+        return iter(list(self._locations))
+
+    def add_resume(self, filename: str, text: str) -> "StoredResume":
+        """Store a resume's text and return a lightweight handle to it"""
+        return StoredResume(self, filename, self.put(text), len(text))
+
+    def close(self):
+        with self._lock:
+            for mapped, _size in self._maps.values():
+                mapped.close()
+            self._maps.clear()
+
+
+class _FileLock:
+    """Exclusive lock on a file, used to serialize appends across processes"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self.path, "a+b")
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        self._file.close()
+        self._file = None
+
+
+class StoredResume(dict):
+    """
+    A resume whose text lives in the corpus store. It is a real dict holding
+    "filename", "doc_id" and "chars", and resolves "content" from the shared
+    memory map only when it is read, so `dict(resume)`, `{**resume}` and
+    `json.dumps(resume)` all see the full {"filename", "content"} resume.
+    Use "chars" for the text length instead of decoding the content. While a handle
+    is alive the store will not compact away the segment holding its text.
+    """
+
+    def __init__(self, store: CorpusStore, filename: str, doc_id: str, chars: int):
+        super().__init__(filename=filename, doc_id=doc_id, chars=chars)
+        self.store = store
+        store._register(self)
+
+    @property
+    def filename(self) -> str:
+        return dict.__getitem__(self, "filename")
+
+    @property
+    def doc_id(self) -> str:
+        return dict.__getitem__(self, "doc_id")
+
+    @property
+    def chars(self) -> int:
+        return dict.__getitem__(self, "chars")
+
+    @property
+    def available(self) -> bool:
+        """False once another process compacted the text away; the file must be uploaded again"""
+        return self.store.available(self.doc_id)
+
+    def __getitem__(self, key: str):
+        if key == "content":
+            return self.store.get(self.doc_id)
+        return dict.__getitem__(self, key)
+
+    def get(self, key: str, default=None):
+        return self[key] if key in self else default
+
+    def __contains__(self, key) -> bool:
+        return key == "content" or dict.__contains__(self, key)
+
+    def __iter__(self):
+        yield "filename"
+        yield "content"
+        yield from (key for key in dict.__iter__(self) if key != "filename")
+
+    def __len__(self) -> int:
+        return dict.__len__(self) + 1
+
+    def keys(self):
+        return list(self)
+
+    def values(self):
+        return [self[key] for key in self]
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+    def copy(self) -> "StoredResume":
+        return StoredResume(self.store, self.filename, self.doc_id, self.chars)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, dict) and dict(self.items()) == dict(other.items())
+
+    def __ne__(self, other) -> bool:
+        return not self == other
+
+    def __reduce__(self):
+        # Pickles (e.g. to a worker process) carry the plain resume dict
+        return dict, (self.items(),)
+
+    def __repr__(self) -> str:
+        return f"StoredResume(filename={self.filename!r}, doc_id={self.doc_id[:12]!r}, chars={self.chars})"
+
+
+_store = None
+
+
+def get_corpus_store() -> CorpusStore:
+    """Return the process-wide corpus store shared by all sessions"""
+    global _store
+    if _store is None:
+        _store = CorpusStore()
+    return _store
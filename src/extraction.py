@@ -0,0 +1,542 @@
+"""
+Resume text extraction engine.
+
+Parses PDF, DOCX and TXT uploads on a bounded process pool so bulk uploads do not
+block the Streamlit script thread. Can also be run headless:
+
+    python -m src.extraction resumes/ --workers 8 --output extracted.jsonl
+"""
+
+import argparse
+import io
+import itertools
+import json
+import multiprocessing
+import os
+import queue
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterable, Iterator, List, Optional
+
+import PyPDF2
+import docx
+
+
+# Bump whenever extraction output changes so cached text is not reused
+EXTRACTOR_VERSION = "1"
+
+PDF_TYPE = "application/pdf"
+DOCX_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+TXT_TYPE = "text/plain"
+
+SUPPORTED_TYPES = (PDF_TYPE, DOCX_TYPE, TXT_TYPE)
+
+EXTENSION_TYPES = {
+    ".pdf": PDF_TYPE,
+    ".docx": DOCX_TYPE,
+    ".txt": TXT_TYPE,
+}
+
+
+class PageText:
+    """Text of a single PDF page or DOCX paragraph and how long it took to decode"""
+
+    def __init__(self, index: int, text: str, seconds: float):
+        self.index = index
+        self.text = text
+        self.seconds = seconds
+
+
+class ExtractedDocument:
+    """Joined text of a document plus per-page timings"""
+
+    def __init__(self, text: str, page_timings: List[float], truncated: bool, seconds: float):
+        self.text = text
+        self.page_timings = page_timings
+        self.truncated = truncated
+        self.seconds = seconds
+
+
+def iter_pdf_pages(data: bytes) -> Iterator[PageText]:
+    """Yield PDF pages one at a time as they are decoded"""
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(data))
+    for index, page in enumerate(pdf_reader.pages):
+        started = time.perf_counter()
+        text = page.extract_text()
+        yield PageText(index, text, time.perf_counter() - started)
+
+
+def iter_docx_paragraphs(data: bytes) -> Iterator[PageText]:
+    """Yield DOCX paragraphs one at a time"""
+    doc = docx.Document(io.BytesIO(data))
+    for index, paragraph in enumerate(doc.paragraphs):
+        started = time.perf_counter()
+        text = paragraph.text
+        yield PageText(index, text, time.perf_counter() - started)
+
+
+def join_pages(pages: Iterable[PageText], max_pages: Optional[int] = None,
+               max_chars: Optional[int] = None) -> ExtractedDocument:
+    """
+    Join page texts through a buffer, stopping early once the page or character
+    budget is spent. At most one page past the page budget is decoded, to tell
+    whether the document was truncated.
+    """
+    started = time.perf_counter()
+    buffer = []
+    page_timings = []
+    length = 0
+    truncated = False
+    for page in pages:
+        if max_pages and page.index >= max_pages:
+            truncated = True
+            break
+        chunk = page.text + "\n"
+        page_timings.append(page.seconds)
+        if max_chars and length + len(chunk) > max_chars:
+            buffer.append(chunk[:max_chars - length])
+            truncated = True
+            break
+        buffer.append(chunk)
+        length += len(chunk)
+    return ExtractedDocument("".join(buffer), page_timings, truncated, time.perf_counter() - started)
+
+
+def extract_text_from_pdf_bytes(data: bytes, max_pages: Optional[int] = None,
+                                max_chars: Optional[int] = None) -> str:
+    """Extract text from raw PDF bytes"""
+    return join_pages(iter_pdf_pages(data), max_pages, max_chars).text
+
+
+def extract_text_from_docx_bytes(data: bytes, max_pages: Optional[int] = None,
+                                 max_chars: Optional[int] = None) -> str:
+    """Extract text from raw DOCX bytes"""
+    return join_pages(iter_docx_paragraphs(data), max_pages, max_chars).text
+
+
+def extract_text_from_txt_bytes(data: bytes) -> str:
+    """Decode a plain text upload"""
+    return str(data, "utf-8")
+
+
+def extract_document(content_type: str, data: bytes, max_pages: Optional[int] = None,
+                     max_chars: Optional[int] = None) -> ExtractedDocument:
+    """
+    Extract a document from raw file bytes based on the MIME type. For DOCX files,
+    which have no pages, `max_pages` caps the number of paragraphs.
+    """
+    if content_type == PDF_TYPE:
+        return join_pages(iter_pdf_pages(data), max_pages, max_chars)
+    if content_type == DOCX_TYPE:
+        return join_pages(iter_docx_paragraphs(data), max_pages, max_chars)
+    if content_type == TXT_TYPE:
+        started = time.perf_counter()
+        text = extract_text_from_txt_bytes(data)
+        truncated = bool(max_chars) and len(text) > max_chars
+        if truncated:
+            text = text[:max_chars]
+        return ExtractedDocument(text, [], truncated, time.perf_counter() - started)
+    raise ValueError(f"Unsupported file type: {content_type}")
+
+
+def extract_text(content_type: str, data: bytes, max_pages: Optional[int] = None,
+                 max_chars: Optional[int] = None) -> str:
+    """Extract text from raw file bytes based on the MIME type"""
+    return extract_document(content_type, data, max_pages, max_chars).text
+
+
+# Queue on which pool workers announce (token, pid, wall time) as they start a job
+_started_queue = None
+
+
+def _init_worker(started_queue):
+    global _started_queue
+    _started_queue = started_queue
+
+
+def _extract_worker(content_type: str, data: bytes, max_pages: Optional[int] = None,
+                    max_chars: Optional[int] = None, token: Optional[int] = None) -> ExtractedDocument:
+    """Process pool entry point"""
+    if token is not None and _started_queue is not None:
+        _started_queue.put((token, os.getpid(), time.time()))
+    return extract_document(content_type, data, max_pages, max_chars)
+
+
+class ExtractionJob:
+    """A single file waiting to be parsed"""
+
+    def __init__(self, filename: str, content_type: str, data: bytes, index: int = 0):
+        self.filename = filename
+        self.content_type = content_type
+        self.data = data
+        self.index = index
+        self.cache_key = None
+
+    @property
+    def size(self) -> int:
+        return len(self.data)
+
+    @classmethod
+    def from_uploaded_file(cls, uploaded_file, index: int = 0) -> "ExtractionJob":
+        """Build a job from a Streamlit UploadedFile (or any file-like object with a name)"""
+        if hasattr(uploaded_file, "getvalue"):
+            data = uploaded_file.getvalue()
+        else:
+            data = uploaded_file.read()
+        content_type = getattr(uploaded_file, "type", None) or guess_content_type(uploaded_file.name)
+        return cls(uploaded_file.name, content_type, data, index)
+
+    @classmethod
+    def from_path(cls, path: str, index: int = 0) -> "ExtractionJob":
+        """Build a job from a file on disk"""
+        with open(path, "rb") as f:
+            data = f.read()
+        return cls(os.path.basename(path), guess_content_type(path), data, index)
+
+
+class ExtractionResult:
+    """Outcome of parsing a single file"""
+
+    def __init__(self, job: ExtractionJob, text: str = "", error: Optional[str] = None,
+                 seconds: float = 0.0, timed_out: bool = False, cached: bool = False,
+                 page_timings: Optional[List[float]] = None, truncated: bool = False):
+        self.filename = job.filename
+        self.content_type = job.content_type
+        self.index = job.index
+        self.cache_key = job.cache_key
+        self.size = job.size
+        self.text = text
+        self.error = error
+        self.seconds = seconds
+        self.timed_out = timed_out
+        self.cached = cached
+        self.page_timings = page_timings or []
+        self.truncated = truncated
+
+    @classmethod
+    def from_document(cls, job: ExtractionJob, document: ExtractedDocument) -> "ExtractionResult":
+        return cls(job, text=document.text, seconds=document.seconds,
+                   page_timings=document.page_timings, truncated=document.truncated)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and bool(self.text.strip())
+
+
+class ExtractionStats:
+    """Throughput counters for one extraction run"""
+
+    def __init__(self):
+        self.files = 0
+        self.failed = 0
+        self.timed_out = 0
+        self.cached = 0
+        self.bytes = 0
+        self.started = time.perf_counter()
+        self.finished = None
+
+    def record(self, result: ExtractionResult):
+        self.files += 1
+        self.bytes += result.size
+        if result.cached:
+            self.cached += 1
+        if result.timed_out:
+            self.timed_out += 1
+        elif result.error is not None:
+            self.failed += 1
+
+    def finish(self):
+        self.finished = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        end = self.finished if self.finished is not None else time.perf_counter()
+        return max(end - self.started, 1e-9)
+
+    @property
+    def files_per_second(self) -> float:
+        return self.files / self.elapsed
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes / self.elapsed
+
+    def summary(self) -> str:
+        return (f"{self.files} file(s), {self.bytes / 1024:.0f} KiB in {self.elapsed:.2f}s "
+                f"({self.files_per_second:.1f} files/s, {self.bytes_per_second / 1024:.0f} KiB/s, "
+                f"{self.cached} cached, {self.failed} failed, {self.timed_out} timed out)")
+
+
+def guess_content_type(filename: str) -> str:
+    """Guess the MIME type of a resume from its file extension"""
+    return EXTENSION_TYPES.get(os.path.splitext(filename)[1].lower(), "application/octet-stream")
+
+
+class ExtractionEngine:
+    """Fans resume parsing out over a bounded process pool"""
+
+    def __init__(self, max_workers: Optional[int] = None, timeout: Optional[float] = None,
+                 cache=None, max_pages: Optional[int] = None, max_chars: Optional[int] = None):
+        if max_workers is None:
+            max_workers = int(os.getenv("EXTRACTION_WORKERS", "0")) or os.cpu_count() or 1
+        if timeout is None:
+            timeout = float(os.getenv("EXTRACTION_TIMEOUT", "60"))
+        if max_pages is None:
+            max_pages = int(os.getenv("EXTRACTION_MAX_PAGES", "0"))
+        if max_chars is None:
+            max_chars = int(os.getenv("EXTRACTION_MAX_CHARS", "0"))
+        self.max_workers = max(1, max_workers)
+        self.max_pages = max_pages or None
+        self.max_chars = max_chars or None
+        self.timeout = timeout
+        self.cache = cache
+        self._executor = None
+        self._started_queue = None
+        # token -> (worker pid, wall time the worker started the job), shared by concurrent runs
+        self._started = {}
+        self._tokens = itertools.count()
+        self._lock = threading.Lock()
+
+    @property
+    def cache_variant(self) -> str:
+        """Extraction options that change the output, folded into cache keys"""
+        return f"pages={self.max_pages or 0};chars={self.max_chars or 0}"
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                context = multiprocessing.get_context()
+                self._started_queue = context.Queue()
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context,
+                                                     initializer=_init_worker, initargs=(self._started_queue,))
+            return self._executor
+
+    def _reset_executor(self, executor: ProcessPoolExecutor, stuck_pids: Iterable[int] = ()):
+        """
+        Replace a pool, terminating the workers stuck on timed out files so they stop
+        holding slots. Jobs still running on the old pool fail with BrokenProcessPool
+        and are resubmitted by the run that owns them.
+        """
+        with self._lock:
+            if executor is not self._executor:
+                return  # another run already replaced it
+            self._executor = None
+        for pid in stuck_pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except OSError:
+                pass
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _drain_started(self):
+        """Record the jobs pool workers have started since the last call"""
+        started_queue = self._started_queue
+        while started_queue is not None:
+            try:
+                token, pid, started = started_queue.get_nowait()
+            except (queue.Empty, OSError, ValueError):
+                return
+            self._started[token] = (pid, started)
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def extract(self, jobs: Iterable[ExtractionJob], stats: Optional[ExtractionStats] = None) -> List[ExtractionResult]:
+        """Parse all jobs and return the results in submission order"""
+        results = list(self.extract_iter(jobs, stats=stats))
+        results.sort(key=lambda result: result.index)
+        return results
+
+    def extract_iter(self, jobs: Iterable[ExtractionJob], cache=None,
+                     stats: Optional[ExtractionStats] = None) -> Iterator[ExtractionResult]:
+        """
+        Parse all jobs, yielding each result as soon as it finishes. Pass an
+        ExtractionStats to collect this run's throughput; the engine is shared by
+        every session, so it keeps no per-run counters itself.
+        """
+        cache = cache if cache is not None else self.cache
+        stats = stats if stats is not None else ExtractionStats()
+        try:
+            to_parse = []
+            for job in jobs:
+                if cache is not None:
+                    job.cache_key = cache.key_for(job.data, self.cache_variant)
+                    text = cache.get(job.cache_key)
+                    if text is not None:
+                        result = ExtractionResult(job, text=text, cached=True)
+                        stats.record(result)
+                        yield result
+                        continue
+                to_parse.append(job)
+
+            # Even a single upload goes to the pool so a pathological file can be timed out
+            # and killed; only without a timeout is parsing done on the calling thread
+            if self.timeout > 0:
+                results = self._extract_parallel(to_parse)
+            else:
+                results = self._extract_inline(to_parse)
+            for result in results:
+                if cache is not None and result.ok:
+                    cache.put(result.cache_key, result.text)
+                stats.record(result)
+                yield result
+        finally:
+            stats.finish()
+
+    def _extract_inline(self, jobs: List[ExtractionJob]) -> Iterator[ExtractionResult]:
+        for job in jobs:
+            try:
+                document = _extract_worker(job.content_type, job.data, self.max_pages, self.max_chars)
+                yield ExtractionResult.from_document(job, document)
+            except Exception as e:
+                yield ExtractionResult(job, error=str(e))
+
+    def _extract_parallel(self, jobs: List[ExtractionJob]) -> Iterator[ExtractionResult]:
+        remaining = iter(jobs)
+        pending = {}  # future -> (job, token, executor)
+        retried = set()
+
+        def submit(job) -> None:
+            token = next(self._tokens)
+            args = (job.content_type, job.data, self.max_pages, self.max_chars, token)
+            executor = self._get_executor()
+            try:
+                future = executor.submit(_extract_worker, *args)
+            except BrokenProcessPool:
+                self._reset_executor(executor)
+                executor = self._get_executor()
+                future = executor.submit(_extract_worker, *args)
+            pending[future] = (job, token, executor)
+
+        def submit_next() -> bool:
+            job = next(remaining, None)
+            if job is None:
+                return False
+            submit(job)
+            return True
+
+        # Only keep as many files in flight as there are workers
+        while len(pending) < self.max_workers and submit_next():
+            pass
+
+        try:
+            while pending:
+                done, _ = wait(pending, timeout=min(self.timeout, 0.5), return_when=FIRST_COMPLETED)
+                self._drain_started()
+                for future in done:
+                    job, token, executor = pending.pop(future)
+                    self._started.pop(token, None)
+                    try:
+                        yield ExtractionResult.from_document(job, future.result())
+                    except BrokenProcessPool as e:
+                        self._reset_executor(executor)
+                        # The pool was torn down under the job, possibly by another run's timeout
+                        if id(job) not in retried:
+                            retried.add(id(job))
+                            submit(job)
+                        else:
+                            yield ExtractionResult(job, error=f"Extraction worker crashed: {e}")
+                    except Exception as e:
+                        yield ExtractionResult(job, error=str(e))
+
+                # The timeout runs from the moment a worker starts the file, not from submission
+                now = time.time()
+                stuck = {}
+                for future, (job, token, executor) in list(pending.items()):
+                    pid, started = self._started.get(token, (None, None))
+                    if started is not None and now - started > self.timeout:
+                        del pending[future]
+                        self._started.pop(token, None)
+                        stuck.setdefault(executor, []).append(pid)
+                        yield ExtractionResult(job, error=f"Timed out after {self.timeout:.0f}s",
+                                               seconds=now - started, timed_out=True)
+                for executor, pids in stuck.items():
+                    self._reset_executor(executor, pids)
+
+                while len(pending) < self.max_workers and submit_next():
+                    pass
+        finally:
+            for _job, token, _executor in pending.values():
+                self._started.pop(token, None)
+
+
+_engine = None
+
+
+def get_extraction_engine() -> ExtractionEngine:
+    """Return the process-wide extraction engine so the worker pool is reused across reruns"""
+    global _engine
+    if _engine is None:
+        from src.extraction_cache import get_extraction_cache
+
+        _engine = ExtractionEngine(cache=get_extraction_cache())
+    return _engine
+
+
+def collect_resume_paths(paths: List[str]) -> List[str]:
+    """Expand files and directories into the list of supported resume files"""
+    collected = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _dirs, files in os.walk(path):
+                for name in sorted(files):
+                    if os.path.splitext(name)[1].lower() in EXTENSION_TYPES:
+                        collected.append(os.path.join(root, name))
+        else:
+            collected.append(path)
+    return collected
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Extract text from resume files in bulk.")
+    parser.add_argument("paths", nargs="+", help="Resume files or directories to extract")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes")
+    parser.add_argument("--timeout", type=float, default=None, help="Per-file timeout in seconds")
+    parser.add_argument("--output", default=None, help="Write results as JSON lines to this file")
+    parser.add_argument("--max-pages", type=int, default=None, help="Stop after this many pages per file")
+    parser.add_argument("--max-chars", type=int, default=None, help="Stop after this many characters per file")
+    parser.add_argument("--no-cache", action="store_true", help="Do not read or fill the extraction cache")
+    args = parser.parse_args(argv)
+
+    cache = None
+    if not args.no_cache:
+        from src.extraction_cache import get_extraction_cache
+
+        cache = get_extraction_cache()
+    engine = ExtractionEngine(max_workers=args.workers, timeout=args.timeout, cache=cache,
+                              max_pages=args.max_pages, max_chars=args.max_chars)
+    stats = ExtractionStats()
+    jobs = [ExtractionJob.from_path(path, index) for index, path in enumerate(collect_resume_paths(args.paths))]
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else None
+    try:
+        for result in engine.extract_iter(jobs, stats=stats):
+            status = "✅" if result.ok else "❌"
+            truncated = ", truncated" if result.truncated else ""
+            print(f"{status} {result.filename} ({len(result.text)} chars, {result.seconds:.2f}s{truncated})"
+                  + (f" - {result.error}" if result.error else ""))
+            if output:
+                output.write(json.dumps({
+                    "filename": result.filename,
+                    "content": result.text,
+                    "error": result.error,
+                    "seconds": round(result.seconds, 4),
+                }) + "\n")
+    finally:
+        if output:
+            output.close()
+        engine.shutdown()
+
+    print(f"📊 {stats.summary()}")
+    return 0 if stats.failed == 0 and stats.timed_out == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+"""
+Content-addressed on-disk cache of extracted resume text.
+
+Entries are keyed by a SHA-256 of the raw upload bytes plus the extractor version,
+so re-uploading the same candidate pool skips parsing entirely. The cache is bounded
+by total size and evicts the least recently used entries first.
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from src.extraction import EXTRACTOR_VERSION
+
+
+class ExtractionCache:
+    """Size-bounded LRU cache of extracted text stored as one file per entry"""
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: Optional[int] = None):
+        self.cache_dir = cache_dir or os.getenv("EXTRACTION_CACHE_DIR", ".cache/extraction")
+        if max_bytes is None:
+            max_bytes = int(float(os.getenv("EXTRACTION_CACHE_MAX_MB", "256")) * 1024 * 1024)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # key -> size on disk, least recently used first
+        self._size = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        """Rebuild the LRU order from the files already on disk"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        found = []
+        for root, _dirs, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith(".txt"):
+                    continue
+                stat = os.stat(os.path.join(root, name))
+                found.append((stat.st_mtime, name[:-4], stat.st_size))
+        for _mtime, key, size in sorted(found):
+            self._entries[key] = size
+            self._size += size
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.txt")
+
+    @staticmethod
+    def key_for(data: bytes, variant: str = "") -> str:
+        """Cache key for raw upload bytes; `variant` distinguishes extraction options"""
+        digest = hashlib.sha256()
+        digest.update(f"{EXTRACTOR_VERSION}:{variant}\0".encode("utf-8"))
+        digest.update(data)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached text for a key, or None on a miss"""
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                text = f.read()
+            # Touch the file so the LRU order survives restarts and is shared across processes
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                self._size -= self._entries.pop(key, 0)
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return text
+
+    def put(self, key: str, text: str):
+        """Store extracted text under a key, evicting old entries if over budget"""
+        encoded = text.encode("utf-8")
+        if len(encoded) > self.max_bytes:
+            return
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(encoded)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._size -= self._entries.pop(key, 0)
+            self._entries[key] = len(encoded)
+            self._size += len(encoded)
+            evicted = []
+            while self._size > self.max_bytes and self._entries:
+                old_key, old_size = self._entries.popitem(last=False)
+                self._size -= old_size
+                self.evictions += 1
+                evicted.append(old_key)
+        for old_key in evicted:
+            try:
+                os.remove(self._path(old_key))
+            except OSError:
+                pass
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            keys = list(self._entries)
+            self._entries.clear()
+            self._size = 0
+        for key in keys:
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    def warm(self, directory: str, engine=None, stats=None) -> int:
+        """Extract every resume under a directory into the cache, returns the number added"""
+        from src.extraction import ExtractionEngine, ExtractionJob, collect_resume_paths
+
+        owns_engine = engine is None
+        if owns_engine:
+            engine = ExtractionEngine()
+        try:
+            jobs = []
+            for index, path in enumerate(collect_resume_paths([directory])):
+                job = ExtractionJob.from_path(path, index)
+                if self.key_for(job.data, engine.cache_variant) not in self:
+                    jobs.append(job)
+
+            added = 0
+            for result in engine.extract_iter(jobs, cache=self, stats=stats):
+                if result.ok:
+                    added += 1
+            return added
+        finally:
+            # An engine created here owns a process pool nobody else can shut down
+            if owns_engine:
+                engine.shutdown()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "size_bytes": self._size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+_cache = None
+
+
+def get_extraction_cache() -> Optional[ExtractionCache]:
+    """Return the process-wide extraction cache, or None when disabled via EXTRACTION_CACHE"""
+    global _cache
+    if os.getenv("EXTRACTION_CACHE", "true").lower() != "true":
+        return None
+    if _cache is None:
+        _cache = ExtractionCache()
+    return _cache
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage the extracted resume text cache.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    warm_parser = subparsers.add_parser("warm", help="Extract a directory of resumes into the cache")
+    warm_parser.add_argument("directory")
+    warm_parser.add_argument("--workers", type=int, default=None, help="Number of worker processes")
+    subparsers.add_parser("stats", help="Show cache size and entry count")
+    subparsers.add_parser("clear", help="Remove every cached entry")
+    args = parser.parse_args(argv)
+
+    cache = ExtractionCache()
+    if args.command == "warm":
+        from src.extraction import ExtractionEngine, ExtractionStats
+
+        engine = ExtractionEngine(max_workers=args.workers)
+        run_stats = ExtractionStats()
+        try:
+            added = cache.warm(args.directory, engine, run_stats)
+        finally:
+            engine.shutdown()
+        print(f"✅ Added {added} resume(s) to the cache - {run_stats.summary()}")
+    elif args.command == "clear":
+        cache.clear()
+        print("🗑️ Extraction cache cleared")
+
+    stats = cache.stats()
+    print(f"📊 {stats['entries']} entries, {stats['size_bytes'] / 1024 / 1024:.1f} MiB "
+          f"of {stats['max_bytes'] / 1024 / 1024:.0f} MiB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""
+Bounded history for agent group chats.
+
+Group chats used to keep every message, and the screening input was added again
+every round, so prompt tokens grew quadratically with the number of rounds.
+ScreeningHistory is a Semantic Kernel chat history reducer that keeps only the
+latest copy of a repeated user input, a sliding window of recent messages and, in
+place of older turns, one compact summary message with the latest score per agent
+and candidate plus a short note per folded turn. Prompt size stays roughly flat as
+rounds increase.
+"""
+
+import os
+import re
+from typing import Dict, List
+
+from pydantic import Field
+from semantic_kernel.contents.chat_message_content import ChatMessageContent
+from semantic_kernel.contents.history_reducer.chat_history_reducer import ChatHistoryReducer
+from semantic_kernel.contents.utils.author_role import AuthorRole
+
+from src.termination import extract_scores
+
+
+# Name of the message that stands in for the turns dropped from the window
+SUMMARY_NAME = "history_summary"
+
+# Characters kept from each folded agent turn
+NOTE_CHARS = 200
+
+
+def _is_user(message) -> bool:
+    return getattr(message, "role", AuthorRole.USER) == AuthorRole.USER and getattr(message, "name", None) != SUMMARY_NAME
+
+
+def dedupe_inputs(messages: List) -> List:
+    """Keep only the latest copy of each repeated user input"""
+    latest = {message.content: index for index, message in enumerate(messages) if _is_user(message)}
+    return [message for index, message in enumerate(messages)
+            if not _is_user(message) or latest[message.content] == index]
+
+
+class ScreeningHistory(ChatHistoryReducer):
+    """Chat history reduced to the task, a rolling summary and a window of recent messages"""
+
+    target_count: int = Field(default_factory=lambda: int(os.getenv("HISTORY_WINDOW", "8")), gt=0)
+    candidates: List[str] = Field(default_factory=list)
+    max_notes: int = Field(default_factory=lambda: int(os.getenv("HISTORY_SUMMARY_NOTES", "12")))
+    scores: Dict[str, Dict[str, float]] = Field(default_factory=dict)
+    notes: List[str] = Field(default_factory=list)
+    summarized: int = 0
+
+    def _fold(self, message: ChatMessageContent):
+        """Add an agent turn that leaves the window to the rolling summary"""
+        if message.role != AuthorRole.ASSISTANT or not message.content:
+            return
+        name = message.name or "agent"
+        self.scores.setdefault(name, {}).update(extract_scores(message.content, self.candidates))
+        note = re.sub(r"\s+", " ", message.content).strip()
+        self.notes = (self.notes + [f"{name}: {note[:NOTE_CHARS]}"])[-self.max_notes:] if self.max_notes > 0 else []
+        self.summarized += 1
+
+    def summary_message(self) -> ChatMessageContent:
+        lines = [f"Summary of {self.summarized} earlier agent turns no longer shown in full."]
+        scored = {name: scores for name, scores in self.scores.items() if scores}
+        if scored:
+            lines.append("Latest scores so far:")
+            lines += [f"- {name}: " + ", ".join(f"{candidate} {score:g}" for candidate, score in scores.items())
+                      for name, scores in scored.items()]
+        if self.notes:
+            lines.append("Notes:")
+            lines += [f"- {note}" for note in self.notes]
+        return ChatMessageContent(role=AuthorRole.USER, name=SUMMARY_NAME, content="\n".join(lines))
+
+    async def reduce(self):
+        """Return self if the history was reduced, None if it already fits"""
+        messages = dedupe_inputs(self.messages)
+        changed = len(messages) != len(self.messages)
+        body = [message for message in messages if message.name != SUMMARY_NAME]
+        cut = len(body) - self.target_count
+        # Tool results stay with the call that produced them
+        while cut > 0 and body[cut].role == AuthorRole.TOOL:
+            cut -= 1
+        if cut > 0:
+            older, recent = body[:cut], body[cut:]
+            # The latest task stays in the chat even when it falls out of the window
+            pinned = [] if any(_is_user(message) for message in recent) else \
+                [message for message in older if _is_user(message)][-1:]
+            dropped = [message for message in older if not any(message is task for task in pinned)]
+            if dropped:
+                for message in dropped:
+                    self._fold(message)
+                messages = pinned + [self.summary_message()] + recent
+                changed = True
+        if not changed:
+            return None
+        self.messages = messages
+        return self
@@ -0,0 +1,215 @@
+"""
+Map/reduce resume screening.
+
+Instead of packing every (truncated) resume into one group-chat prompt, each resume
+is scored on its own by every expert agent (map), with a bounded number of model
+calls in flight. Each call returns a compact JSON verdict; the verdicts are merged
+locally into a ranked shortlist (reduce), so no further model call is needed and
+latency scales with concurrency rather than with prompt length. Group chat agents'
+structured reports are merged the same way.
+"""
+
+import asyncio
+import os
+from typing import Callable, Dict, List, Optional
+
+from src.mas import create_chat_completion
+from src.progress import DONE, ERROR, STARTED
+from src.structured import (CandidateScoreSchema, ScreeningReport, StructuredOutputError, parse_structured,
+                            response_format, structured_output_enabled)
+
+
+VERDICT_PROMPT = """
+You are {name}. Your role: {instructions}
+
+Score how well the candidate's resume matches the job profile from your perspective.
+Respond with only a JSON object, no other text:
+{{"filename": "<resume filename>", "score": <integer 0-100>, "summary": "<one or two sentences>", "strengths": ["..."], "concerns": ["..."]}}
+"""
+
+CANDIDATE_PROMPT = """
+Job Profile:
+{job_profile}
+
+Resume ({filename}):
+{content}
+"""
+
+# Strengths and concerns kept per candidate after merging all agents' verdicts
+MAX_POINTS = 5
+
+
+class AgentVerdict:
+    """One agent's compact verdict on one resume"""
+
+    __slots__ = ("agent", "filename", "score", "summary", "strengths", "concerns", "error")
+
+    def __init__(self, agent: str, filename: str, score: Optional[float] = None, summary: str = "",
+                 strengths: Optional[List[str]] = None, concerns: Optional[List[str]] = None,
+                 error: Optional[str] = None):
+        self.agent = agent
+        self.filename = filename
+        self.score = score
+        self.summary = summary
+        self.strengths = strengths or []
+        self.concerns = concerns or []
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @classmethod
+    def from_record(cls, agent: str, filename: str, record: CandidateScoreSchema) -> "AgentVerdict":
+        return cls(agent, filename, score=record.score, summary=record.summary,
+                   strengths=record.strengths, concerns=record.concerns)
+
+    @classmethod
+    def from_text(cls, agent: str, filename: str, text: str) -> "AgentVerdict":
+        """Validate a model reply into a verdict, tolerating code fences or text around the JSON object"""
+        try:
+            record = parse_structured(CandidateScoreSchema, text)
+        except StructuredOutputError:
+            return cls(agent, filename, error=f"Unparseable verdict: {(text or '')[:200]}")
+        return cls.from_record(agent, filename, record)
+
+
+def _match_filename(name: str, filenames: List[str]) -> Optional[str]:
+    """The resume a reported filename refers to, ignoring case and the extension"""
+    name = name.strip().lower()
+    for filename in filenames:
+        if name in (filename.lower(), os.path.splitext(filename)[0].lower()):
+            return filename
+    return None
+
+
+def verdicts_from_report(agent: str, text: str, resumes: List[Dict]) -> List[AgentVerdict]:
+    """
+    Verdicts from a group chat agent's structured report, one per known candidate it
+    scored; empty if the reply is not a report. Scores for unknown files are dropped.
+    """
+    try:
+        report = parse_structured(ScreeningReport, text)
+    except StructuredOutputError:
+        return []
+    filenames = [resume["filename"] for resume in resumes]
+    verdicts = {}
+    for record in report.candidates:
+        filename = _match_filename(record.filename, filenames)
+        if filename is not None:
+            verdicts[filename] = AgentVerdict.from_record(agent, filename, record)
+    return list(verdicts.values())
+
+
+def _merge_points(lists: List[List[str]]) -> List[str]:
+    points = dict.fromkeys(point.strip() for points in lists for point in points if point.strip())
+    return list(points)[:MAX_POINTS]
+
+
+def reduce_verdicts(verdicts: List[AgentVerdict], resumes: List[Dict]) -> List[Dict]:
+    """
+    Merge per-agent verdicts into one ranked result per candidate, best first.
+    The candidate score is the mean of the agents' scores; ties keep pool order.
+    Resumes no agent could score get a score of None and follow the ranking
+    instead of being ranked as a zero.
+    """
+    by_filename: Dict[str, List[AgentVerdict]] = {resume["filename"]: [] for resume in resumes}
+    for verdict in verdicts:
+        by_filename.setdefault(verdict.filename, []).append(verdict)
+
+    ranked, unscored = [], []
+    for filename, candidate_verdicts in by_filename.items():
+        scored = [verdict for verdict in candidate_verdicts if verdict.ok]
+        result = {
+            "filename": filename,
+            "score": round(sum(verdict.score for verdict in scored) / len(scored)) if scored else None,
+            "explanation": " ".join(f"{verdict.agent}: {verdict.summary}" for verdict in scored if verdict.summary)
+                           or "No agent returned a usable verdict for this resume.",
+            "strengths": _merge_points([verdict.strengths for verdict in scored]),
+            "concerns": _merge_points([verdict.concerns for verdict in scored]),
+            "agent_scores": {verdict.agent: verdict.score for verdict in scored},
+            "errors": [verdict.error for verdict in candidate_verdicts if not verdict.ok],
+        }
+        (ranked if scored else unscored).append(result)
+    ranked.sort(key=lambda result: result["score"], reverse=True)
+    return ranked + unscored
+
+
+class MapReduceScreening:
+    """Score each resume independently with every agent, then merge the verdicts into a ranking"""
+
+    def __init__(self, agents: List, client, model: str, concurrency: Optional[int] = None,
+                 max_chars: Optional[int] = None):
+        self.agents = agents
+        self.client = client
+        self.model = model
+        if concurrency is None:
+            concurrency = int(os.getenv("SCREENING_CONCURRENCY", "8"))
+        if max_chars is None:
+            max_chars = int(os.getenv("SCREENING_MAX_CHARS", "20000"))
+        self.concurrency = max(concurrency, 1)
+        self.max_chars = max_chars
+
+    def _get_request(self, agent, job_profile: str, resume: Dict) -> Dict:
+        content = resume["content"]
+        if self.max_chars > 0:
+            content = content[:self.max_chars]
+        return dict(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": VERDICT_PROMPT.format(name=agent.name, instructions=agent.instructions)},
+                {"role": "user", "content": CANDIDATE_PROMPT.format(
+                    job_profile=job_profile, filename=resume["filename"], content=content
+                )},
+            ],
+            max_completion_tokens=400,
+            **({"response_format": response_format(CandidateScoreSchema)} if structured_output_enabled() else {})
+        )
+
+    async def score(self, agent, job_profile: str, resume: Dict) -> AgentVerdict:
+        """Map step: one agent's verdict on one resume"""
+        try:
+            response = await create_chat_completion(self.client, **self._get_request(agent, job_profile, resume))
+        except Exception as e:
+            return AgentVerdict(agent.name, resume["filename"], error=str(e))
+        return AgentVerdict.from_text(agent.name, resume["filename"], response.choices[0].message.content)
+
+    async def screen(self, job_profile: str, resumes: List[Dict],
+                     on_verdict: Optional[Callable[[AgentVerdict, int, int], None]] = None,
+                     reporter=None) -> List[AgentVerdict]:
+        """
+        Screen every resume with every agent, at most `concurrency` calls at a time,
+        and return the verdicts. `on_verdict(verdict, done, total)` is called as each
+        verdict arrives; the optional ProgressReporter gets each call's lifecycle
+        events with the resume filename as detail.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def bounded(agent, resume):
+            async with semaphore:
+                if reporter is not None:
+                    reporter.emit(agent.name, STARTED, resume["filename"])
+                verdict = await self.score(agent, job_profile, resume)
+                if reporter is not None:
+                    reporter.emit(agent.name, DONE if verdict.ok else ERROR, verdict.error or resume["filename"])
+                return verdict
+
+        tasks = [asyncio.create_task(bounded(agent, resume)) for resume in resumes for agent in self.agents]
+        verdicts = []
+        try:
+            for next_verdict in asyncio.as_completed(tasks):
+                verdict = await next_verdict
+                verdicts.append(verdict)
+                if on_verdict is not None:
+                    on_verdict(verdict, len(verdicts), len(tasks))
+        finally:
+            for task in tasks:
+                task.cancel()
+        return verdicts
+
+    async def run(self, job_profile: str, resumes: List[Dict],
+                  on_verdict: Optional[Callable[[AgentVerdict, int, int], None]] = None,
+                  reporter=None) -> List[Dict]:
+        """Screen every resume with every agent and return the ranked results"""
+        verdicts = await self.screen(job_profile, resumes, on_verdict=on_verdict, reporter=reporter)
+        return reduce_verdicts(verdicts, resumes)
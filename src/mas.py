@@ -1,9 +1,20 @@
+import asyncio
+import concurrent.futures
 import datetime
+import hashlib
+import inspect
 import os, json, re
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, ClassVar
 from jinja2 import Environment, FileSystemLoader
-from openai import AzureOpenAI, OpenAI
+from openai import AsyncAzureOpenAI, AsyncOpenAI, AzureOpenAI, OpenAI
 import google.generativeai as genai
+from google.generativeai import client as genai_client
 from dotenv import load_dotenv
+from pydantic import Field
 
 # Load environment variables from .env file
 load_dotenv()
@@ -12,6 +23,11 @@ from semantic_kernel.kernel import Kernel
 from semantic_kernel.connectors.ai.open_ai.services.azure_chat_completion import AzureChatCompletion
 from semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion import OpenAIChatCompletion
 from semantic_kernel.agents import AgentGroupChat, ChatCompletionAgent
+from semantic_kernel.contents.chat_history import ChatHistory
+from semantic_kernel.contents.streaming_chat_message_content import StreamingChatMessageContent
+from semantic_kernel.contents.utils.author_role import AuthorRole
+from semantic_kernel.exceptions.agent_exceptions import AgentChatException
+from semantic_kernel.agents.strategies.selection.selection_strategy import SelectionStrategy
 from semantic_kernel.agents.strategies.selection.kernel_function_selection_strategy import (
     KernelFunctionSelectionStrategy,
 )
@@ -28,58 +44,251 @@ from azure.core.exceptions import ClientAuthenticationError
 from azure.identity import DefaultAzureCredential
 from semantic_kernel.exceptions.function_exceptions import FunctionExecutionException
 from semantic_kernel.functions import KernelArguments
+from semantic_kernel.functions.kernel_plugin import KernelPlugin
 
+from src.history import ScreeningHistory, dedupe_inputs
 from src.plugins.resume_screening import ResumeScreeningPlugin
+from src.progress import DONE, ERROR, FIRST_TOKEN, STARTED
+from src.roster_cache import RosterCache, get_roster_cache
+from src.response_cache import CachedChatCompletionMixin, cache_client
+from src.selection import (COVERAGE, LLM as SELECTION_LLM, PARALLEL, CoverageSelectionStrategy,
+                           RoundRobinSelectionStrategy, selection_mode)
+from src.termination import LLM, LocalTerminationStrategy, TerminationPolicy, termination_mode
+from src.scheduler import AGENT, ORCHESTRATOR, ScheduledChatCompletionMixin, schedule_client
+from src.structured import (AgentRoster, ScreeningReport, gemini_schema, parse_structured, response_format,
+                            structured_output_enabled)
+
+
+_gemini_api_key = None
+_gemini_lock = threading.Lock()
+
+
+def configure_gemini(api_key):
+    """Configure the genai module, only when the API key changes"""
+    global _gemini_api_key
+    with _gemini_lock:
+        if api_key != _gemini_api_key:
+            genai.configure(api_key=api_key)
+            _gemini_api_key = api_key
 
 
 class GeminiWrapper:
     """Wrapper class to make Gemini API compatible with OpenAI interface"""
     
     def __init__(self, api_key):
-        genai.configure(api_key=api_key)
+        configure_gemini(api_key)
         self.chat = GeminiChatCompletions()
 
 
+class AsyncGeminiWrapper:
+    """Wrapper class to make Gemini's async API compatible with the AsyncOpenAI interface"""
+    
+    def __init__(self, api_key):
+        configure_gemini(api_key)
+        self.chat = AsyncGeminiChatCompletions()
+
+
+def _to_gemini_request(messages):
+    """
+    Convert OpenAI messages format to a Gemini (system_instruction, prompt) pair.
+    The system message is passed to Gemini natively rather than prepended to the prompt.
+    """
+    # Extract the user message (assuming simple user message for now)
+    user_message = ""
+    system_message = None
+    
+    for message in messages:
+        if message["role"] == "user":
+            user_message = message["content"]
+        elif message["role"] == "system":
+            system_message = message["content"]
+    
+    return system_message or None, user_message
+
+
+def _generation_config(max_tokens=None, max_completion_tokens=None, temperature=None, response_format=None,
+                       **kwargs):
+    """Map OpenAI-style generation parameters to a Gemini generation config"""
+    config = {}
+    if max_completion_tokens or max_tokens:
+        config["max_output_tokens"] = max_completion_tokens or max_tokens
+    if temperature is not None:
+        config["temperature"] = temperature
+    if response_format and response_format.get("type") in ("json_object", "json_schema"):
+        config["response_mime_type"] = "application/json"
+        if response_format["type"] == "json_schema":
+            config["response_schema"] = gemini_schema(response_format["json_schema"]["schema"])
+    return config
+
+
+def _blocked_response(error, model):
+    """If response is blocked, return a default message, otherwise re-raise"""
+    if "blocked" in str(error).lower():
+        # Flagged as filtered so the response cache does not store the fallback text
+        return GeminiResponse("I apologize, but I cannot process this request due to safety guidelines.", model,
+                              finish_reason="content_filter")
+    raise error
+
+
+def _gemini_finish_reason(response):
+    """OpenAI-style finish reason of a Gemini response or chunk, None while a stream is still going"""
+    candidates = getattr(response, "candidates", None)
+    if not candidates:
+        return None
+    reason = getattr(candidates[0].finish_reason, "name", None)
+    if reason in (None, "FINISH_REASON_UNSPECIFIED"):
+        return None
+    return {"STOP": "stop", "MAX_TOKENS": "length"}.get(reason, "content_filter")
+
+
+class GeminiModelCache:
+    """
+    LRU cache of GenerativeModel instances keyed by model name, generation config
+    and system instruction, so agents calling the same model reuse one instance.
+    """
+
+    def __init__(self, max_size=None, async_client=None):
+        if max_size is None:
+            max_size = int(os.getenv("GEMINI_MODEL_CACHE_SIZE", "64"))
+        self.max_size = max_size
+        self.async_client = async_client
+        self._models = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key_for(model, generation_config, system_instruction):
+        instruction_hash = hashlib.sha256(system_instruction.encode("utf-8")).hexdigest() if system_instruction else None
+        return (model, json.dumps(generation_config, sort_keys=True), instruction_hash)
+
+    def get(self, model, generation_config, system_instruction=None):
+        key = self.key_for(model, generation_config, system_instruction)
+        with self._lock:
+            gemini_model = self._models.get(key)
+            if gemini_model is not None:
+                self._models.move_to_end(key)
+                self.hits += 1
+                return gemini_model
+            self.misses += 1
+            gemini_model = genai.GenerativeModel(
+                model,
+                generation_config=generation_config or None,
+                system_instruction=system_instruction
+            )
+            if self.async_client is not None and hasattr(gemini_model, "_async_client"):
+                gemini_model._async_client = self.async_client
+            self._models[key] = gemini_model
+            while len(self._models) > self.max_size:
+                self._models.popitem(last=False)
+            return gemini_model
+
+    def stats(self):
+        with self._lock:
+            return {"models": len(self._models), "hits": self.hits, "misses": self.misses}
+
+    def clear(self):
+        with self._lock:
+            self._models.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_gemini_models = GeminiModelCache()
+
+
+def get_gemini_model_cache():
+    """Return the GenerativeModel cache shared by the sync Gemini clients"""
+    return _gemini_models
+
+
 class GeminiChatCompletions:
     """Chat completions interface for Gemini"""
     
     def __init__(self):
         self.completions = self
     
-    def create(self, model, messages, max_tokens=None, max_completion_tokens=None, **kwargs):
-        # Convert OpenAI messages format to Gemini format
-        gemini_model = genai.GenerativeModel(model)
-        
-        # Extract the user message (assuming simple user message for now)
-        user_message = ""
-        system_message = ""
-        
-        for message in messages:
-            if message["role"] == "user":
-                user_message = message["content"]
-            elif message["role"] == "system":
-                system_message = message["content"]
-        
-        # Combine system and user messages for Gemini
-        final_message = f"{system_message}\n\n{user_message}" if system_message else user_message
+    def create(self, model, messages, **kwargs):
+        system_instruction, prompt = _to_gemini_request(messages)
+        gemini_model = _gemini_models.get(model, _generation_config(**kwargs), system_instruction)
         
         # Generate response
         try:
-            response = gemini_model.generate_content(final_message)
-            return GeminiResponse(response.text, model)
+            response = gemini_model.generate_content(prompt)
+            return GeminiResponse(response.text, model, _gemini_finish_reason(response) or "stop")
         except Exception as e:
-            # If response is blocked, return a default message
-            if "blocked" in str(e).lower():
-                return GeminiResponse("I apologize, but I cannot process this request due to safety guidelines.", model)
-            else:
-                raise e
+            return _blocked_response(e, model)
+
+
+def _new_gemini_async_client():
+    """
+    A fresh genai async service client for the current event loop. This goes through
+    genai internals (checked against google-generativeai 0.8.3, pinned in the
+    requirements); if they are missing, None is returned and the models fall back to
+    genai's shared client through the public generate_content_async.
+    """
+    client_manager = getattr(genai_client, "_client_manager", None)
+    make_client = getattr(client_manager, "make_client", None)
+    if make_client is None:
+        return None
+    return make_client("generative_async")
+
+
+class AsyncGeminiChatCompletions:
+    """Async chat completions interface for Gemini"""
+    
+    def __init__(self):
+        self.completions = self
+        self._models = None
+    
+    def _get_models(self):
+        # genai keeps one process-wide async client bound to the event loop it was first
+        # used on; keep our own so a new event loop (one per screening run) gets a fresh one,
+        # along with the models that use it
+        if self._models is None:
+            self._models = GeminiModelCache(async_client=_new_gemini_async_client())
+        return self._models
+    
+    async def create(self, model, messages, stream=False, **kwargs):
+        system_instruction, prompt = _to_gemini_request(messages)
+        gemini_model = self._get_models().get(model, _generation_config(**kwargs), system_instruction)
+        
+        # Generate response without blocking the event loop
+        try:
+            if stream:
+                response = await gemini_model.generate_content_async(prompt, stream=True)
+                return _stream_gemini_chunks(response, model)
+            response = await gemini_model.generate_content_async(prompt)
+            return GeminiResponse(response.text, model, _gemini_finish_reason(response) or "stop")
+        except Exception as e:
+            response = _blocked_response(e, model)
+            if stream:
+                return _stream_text(response.choices[0].message.content, model, response.choices[0].finish_reason)
+            return response
+
+
+async def _stream_gemini_chunks(response, model):
+    """Yield OpenAI-style chunks from a streaming Gemini response"""
+    async for chunk in response:
+        finish_reason = _gemini_finish_reason(chunk)
+        try:
+            text = chunk.text
+        except ValueError:
+            text = ""  # chunk without text parts, e.g. finish reason or safety metadata
+        if text or finish_reason:
+            yield GeminiChunk(text, model, finish_reason)
+
+
+async def _stream_text(text, model, finish_reason="stop"):
+    """A single-chunk stream, used when Gemini returns a fixed message"""
+    yield GeminiChunk(text, model, finish_reason)
 
 
 class GeminiResponse:
     """Response wrapper to match OpenAI response format"""
     
-    def __init__(self, text, model):
-        self.choices = [GeminiChoice(text)]
+    def __init__(self, text, model, finish_reason="stop"):
+        self.choices = [GeminiChoice(text, finish_reason)]
         self.model = model
     
     def model_dump_json(self):
@@ -91,8 +300,9 @@ class GeminiResponse:
 class GeminiChoice:
     """Choice wrapper for Gemini response"""
     
-    def __init__(self, text):
+    def __init__(self, text, finish_reason="stop"):
         self.message = GeminiMessage(text)
+        self.finish_reason = finish_reason
 
 
 class GeminiMessage:
@@ -102,6 +312,104 @@ class GeminiMessage:
         self.content = text
 
 
+class GeminiChunk:
+    """Streaming chunk wrapper to match OpenAI chunk format"""
+    
+    def __init__(self, text, model, finish_reason=None):
+        self.choices = [GeminiStreamChoice(text, finish_reason)]
+        self.model = model
+
+
+class GeminiStreamChoice:
+    """Streaming choice wrapper for Gemini chunks"""
+    
+    def __init__(self, text, finish_reason=None):
+        self.delta = GeminiMessage(text)
+        self.finish_reason = finish_reason
+
+
+class ClientRegistry:
+    """
+    Process-wide pool of AI clients, one per (service, endpoint, API key).
+    Sync clients and their keep-alive connection pools are shared by every screening
+    run and Streamlit session. Async clients are bound to the event loop that created
+    their connections, so they are pooled per loop and dropped with it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._clients = {}
+        self._async_clients = weakref.WeakKeyDictionary()  # event loop -> {key: client}
+        self._uses = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key_for(service_type, endpoint, api_key):
+        # Keys are identified by a hash so they never sit in the registry in clear text
+        return (service_type, endpoint or "", hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()[:16])
+
+    def _lookup(self, clients, key, factory):
+        client = clients.get(key)
+        if client is None:
+            self.misses += 1
+            client = clients[key] = factory()
+        else:
+            self.hits += 1
+        self._uses[key] = self._uses.get(key, 0) + 1
+        return client
+
+    def get_client(self, service_type, endpoint, api_key, factory):
+        """Return the shared sync client for this service, creating it with `factory` once"""
+        with self._lock:
+            return self._lookup(self._clients, self.key_for(service_type, endpoint, api_key), factory)
+
+    def get_async_client(self, service_type, endpoint, api_key, factory):
+        """Return the async client for this service on the running event loop"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Outside an event loop the client is not pooled, it binds to the loop that first uses it
+            return factory()
+        with self._lock:
+            clients = self._async_clients.get(loop)
+            if clients is None:
+                clients = self._async_clients[loop] = {}
+            return self._lookup(clients, self.key_for(service_type, endpoint, api_key), factory)
+
+    def stats(self):
+        with self._lock:
+            uses = {}
+            for (service, endpoint, _key), count in self._uses.items():
+                name = f"{service}:{endpoint or 'default'}"
+                uses[name] = uses.get(name, 0) + count
+            return {
+                "clients": len(self._clients),
+                "async_clients": sum(len(clients) for clients in self._async_clients.values()),
+                "event_loops": len(self._async_clients),
+                "hits": self.hits,
+                "misses": self.misses,
+                "uses": uses,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._clients.clear()
+            self._async_clients.clear()
+            self._uses.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_client_registry = ClientRegistry()
+
+
+def get_client_registry():
+    """Return the process-wide AI client registry"""
+    return _client_registry
+
+
+
 def get_ai_service_config():
     """
     Determine which AI service to use based on AI_SERVICE environment variable.
@@ -120,11 +428,11 @@ def get_ai_service_config():
             raise ValueError("Azure OpenAI selected but credentials are missing. Please check AZURE_OPENAI_ENDPOINT and AZURE_OPENAI_API_KEY in .env file.")
         
         try:
-            client = AzureOpenAI(
+            client = _client_registry.get_client("azure", azure_endpoint, azure_api_key, lambda: AzureOpenAI(
                 azure_endpoint=azure_endpoint,
                 api_key=azure_api_key,
                 api_version=os.getenv("AZURE_OPENAI_API_VERSION", "2024-12-01-preview")
-            )
+            ))
             print(f"✅ Using Azure OpenAI with model: {azure_model_orchestrator}")
             return ("azure", client, azure_model, azure_model_orchestrator)
         except Exception as e:
@@ -140,7 +448,8 @@ def get_ai_service_config():
             raise ValueError("OpenAI selected but API key is missing. Please check OPENAI_API_KEY in .env file.")
         
         try:
-            client = OpenAI(api_key=openai_api_key)
+            client = _client_registry.get_client("openai", None, openai_api_key,
+                                                 lambda: OpenAI(api_key=openai_api_key))
             print(f"✅ Using OpenAI with model: {openai_model_orchestrator}")
             return ("openai", client, openai_model, openai_model_orchestrator)
         except Exception as e:
@@ -156,7 +465,8 @@ def get_ai_service_config():
             raise ValueError("Gemini selected but API key is missing. Please check GEMINI_API_KEY in .env file.")
         
         try:
-            client = GeminiWrapper(gemini_api_key)
+            client = _client_registry.get_client("gemini", None, gemini_api_key,
+                                                 lambda: GeminiWrapper(gemini_api_key))
             print(f"✅ Using Google Gemini with model: {gemini_model_orchestrator}")
             return ("gemini", client, gemini_model, gemini_model_orchestrator)
         except Exception as e:
@@ -166,20 +476,214 @@ def get_ai_service_config():
         raise ValueError(f"Invalid AI_SERVICE '{ai_service}'. Please set AI_SERVICE to 'azure', 'openai', or 'gemini' in your .env file.")
 
 
+def create_async_client(service_type):
+    """
+    Get the async client for a service returned by get_ai_service_config(), pooled per
+    event loop in the client registry. All three clients share the AsyncOpenAI interface:
+    `await client.chat.completions.create(...)`.
+    """
+    if service_type == "azure":
+        endpoint, api_key = os.getenv("AZURE_OPENAI_ENDPOINT"), os.getenv("AZURE_OPENAI_API_KEY")
+        factory = lambda: AsyncAzureOpenAI(
+            azure_endpoint=endpoint,
+            api_key=api_key,
+            api_version=os.getenv("AZURE_OPENAI_API_VERSION", "2024-12-01-preview")
+        )
+    elif service_type == "openai":
+        endpoint, api_key = None, os.getenv("OPENAI_API_KEY")
+        factory = lambda: AsyncOpenAI(api_key=api_key)
+    elif service_type == "gemini":
+        endpoint, api_key = None, os.getenv("GEMINI_API_KEY")
+        factory = lambda: AsyncGeminiWrapper(api_key)
+    else:
+        raise ValueError(f"Invalid AI service '{service_type}'. Expected 'azure', 'openai', or 'gemini'.")
+    return _client_registry.get_async_client(service_type, endpoint, api_key, factory)
+
+
+async def create_chat_completion(client, **kwargs):
+    """
+    Run a chat completion without blocking the event loop. Async clients are awaited
+    directly; sync clients are run in a worker thread.
+    """
+    create = client.chat.completions.create
+    if inspect.iscoroutinefunction(inspect.unwrap(create)):
+        return await create(**kwargs)
+    return await asyncio.to_thread(create, **kwargs)
+
+
+async def stream_chat_completion(client, **kwargs):
+    """
+    Yield the text of a chat completion as it is generated. Async clients stream
+    token chunks; sync clients yield the whole completion as a single chunk.
+    """
+    create = client.chat.completions.create
+    if not inspect.iscoroutinefunction(inspect.unwrap(create)):
+        response = await asyncio.to_thread(create, **kwargs)
+        yield response.choices[0].message.content
+        return
+    
+    stream = await create(stream=True, **kwargs)
+    async for chunk in stream:
+        # Azure sends content filter results in chunks without choices
+        text = chunk.choices[0].delta.content if chunk.choices else None
+        if text:
+            yield text
+
+
+class StreamMetrics:
+    """Time to first token and throughput of one agent's streamed response"""
+
+    # Rough conversion used when the provider does not report token counts
+    CHARS_PER_TOKEN = 4
+
+    def __init__(self, name, started=None):
+        self.name = name
+        self.started = started if started is not None else time.perf_counter()
+        self.first_token_at = None
+        self.finished_at = None
+        self.chunks = 0
+        self.chars = 0
+
+    def record(self, text):
+        now = time.perf_counter()
+        if self.first_token_at is None:
+            self.first_token_at = now
+        self.finished_at = now
+        self.chunks += 1
+        self.chars += len(text)
+
+    @property
+    def tokens(self):
+        return round(self.chars / self.CHARS_PER_TOKEN)
+
+    @property
+    def time_to_first_token(self):
+        return None if self.first_token_at is None else self.first_token_at - self.started
+
+    @property
+    def tokens_per_second(self):
+        if self.first_token_at is None:
+            return 0.0
+        generating = self.finished_at - self.first_token_at
+        return self.tokens / generating if generating > 0 else float(self.tokens)
+
+    def summary(self):
+        if self.first_token_at is None:
+            return "no output"
+        return f"first token {self.time_to_first_token:.2f}s, ~{self.tokens_per_second:.0f} tok/s"
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "time_to_first_token": self.time_to_first_token,
+            "tokens_per_second": self.tokens_per_second,
+            "tokens": self.tokens,
+            "chunks": self.chunks,
+        }
+
+
+class ReportingSelectionStrategy(SelectionStrategy):
+    """
+    Delegates the choice of the next agent to another selection strategy and reports
+    each pick through `on_select`, which is the moment just before that agent's
+    request is sent.
+    """
+
+    strategy: SelectionStrategy
+    on_select: Any = None
+
+    async def next(self, agents, history):
+        agent = await self.strategy.next(agents, history)
+        if self.on_select is not None:
+            self.on_select(agent.name)
+        return agent
+
+
+async def track_stream(stream, metrics, reporter=None, group=None):
+    """
+    Record per-agent StreamMetrics for a stream of chunks that carry `name` and
+    `content`, such as AgentGroupChat.invoke_stream(). Lifecycle events are sent to
+    the optional ProgressReporter. When the `group` producing the stream is given,
+    each agent's clock starts and STARTED is emitted as the group selects it, before
+    its request goes out; otherwise agents are assumed to take turns and each
+    agent's clock starts when the previous chunk arrived.
+    """
+    last_chunk_at = time.perf_counter()
+    current = None
+    selected_at = {}
+
+    def finish():
+        nonlocal current
+        if current is not None and reporter is not None:
+            reporter.emit(current, DONE, metrics[current].summary())
+        current = None
+
+    def on_select(name):
+        finish()
+        selected_at[name] = time.perf_counter()
+        if reporter is not None:
+            reporter.emit(name, STARTED)
+
+    strategy = None
+    if group is not None:
+        strategy = group.selection_strategy
+        if not isinstance(strategy, ReportingSelectionStrategy):
+            strategy = group.selection_strategy = ReportingSelectionStrategy(strategy=strategy)
+        strategy.on_select = on_select
+    try:
+        async for chunk in stream:
+            if chunk.name != current:
+                finish()
+                current = chunk.name
+                reported = current in selected_at
+                metrics[current] = StreamMetrics(current, started=selected_at.pop(current, last_chunk_at))
+                if reporter is not None:
+                    if not reported:
+                        reporter.emit(current, STARTED)
+                    reporter.emit(current, FIRST_TOKEN)
+            if chunk.content:
+                metrics[current].record(chunk.content)
+            last_chunk_at = time.perf_counter()
+            yield chunk
+        finish()
+    finally:
+        if strategy is not None:
+            strategy.on_select = None
+
+
+class ManagedAzureChatCompletion(CachedChatCompletionMixin, ScheduledChatCompletionMixin, AzureChatCompletion):
+    """Azure chat service whose requests go through the response cache, then the scheduler"""
+
+    scheduler_service: ClassVar[str] = "azure"
+
+
+class ManagedOpenAIChatCompletion(CachedChatCompletionMixin, ScheduledChatCompletionMixin, OpenAIChatCompletion):
+    """OpenAI chat service whose requests go through the response cache, then the scheduler"""
+
+    scheduler_service: ClassVar[str] = "openai"
+
+
 class Orchestrator:
 
     def __init__(self, screening_context, num_agents):
         self.service_type, self.client, self.model, self.model_orchestrator = get_ai_service_config()
+        self.client = cache_client(schedule_client(self.client, self.service_type, ORCHESTRATOR))
         
         self.env = Environment(loader=FileSystemLoader(os.getenv('TEMPLATE_DIR_PROMPTS')))
         self.template = self.env.get_template(os.getenv('TEMPLATE_SYSTEM_ORCHESTRATOR'))
+        # Cached rosters are invalidated whenever the orchestrator template changes
+        template_source = self.env.loader.get_source(self.env, os.getenv('TEMPLATE_SYSTEM_ORCHESTRATOR'))[0]
+        self.template_version = hashlib.sha256(template_source.encode("utf-8")).hexdigest()[:16]
+        self.roster_cache = get_roster_cache()
         self.screening_context = screening_context
         self.num_agents = num_agents
+        # Created lazily, inside the event loop that uses it
+        self.async_client = None
         
         print(f"Using {self.service_type.upper()} service with model: {self.model_orchestrator}")
 
-    def get_response(self):
-        response = self.client.chat.completions.create(
+    def _get_request(self):
+        return dict(
             model=self.model_orchestrator,
             messages=[
                 {"role": "user", "content": self.template.render(
@@ -188,14 +692,32 @@ class Orchestrator:
                     num_agents=self.num_agents
                 )},
             ],
-            max_completion_tokens=5000
+            max_completion_tokens=5000,
+            **({"response_format": response_format(AgentRoster)} if structured_output_enabled() else {})
         )
+
+    def get_response(self):
+        # The scheduler is async: a sync caller waits for its orchestrator slot on a private event loop
+        coroutine = create_chat_completion(self.client, **self._get_request())
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        # Called from inside a running loop (async code should use run_async): asyncio.run would
+        # raise there, so the private loop gets its own thread while this caller blocks on it
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coroutine).result()
+
+    async def get_response_async(self):
+        if self.async_client is None:
+            self.async_client = cache_client(schedule_client(create_async_client(self.service_type),
+                                                             self.service_type, ORCHESTRATOR))
+        response = await create_chat_completion(self.async_client, **self._get_request())
         return response
 
     def parse_response(self, response):
         json_response = json.loads(response.model_dump_json())
-        json_response = json.loads(json_response['choices'][0]['message']['content'].replace('```json\n', '').replace('```', ''))
-        return json_response
+        return parse_structured(AgentRoster, json_response['choices'][0]['message']['content']).model_dump()
 
     def get_dynamic_agents(self, json_response):
         agents = []
@@ -208,14 +730,117 @@ class Orchestrator:
             agents.append(agent)
         return agents
 
+    def _roster_key(self):
+        return RosterCache.key_for(self.screening_context['job_profile'], self.num_agents,
+                                   f"{self.service_type}:{self.model_orchestrator}", self.template_version)
+
+    def _get_cached_agents(self):
+        if self.roster_cache is None:
+            return None
+        dynamic_agents = self.roster_cache.get(self._roster_key())
+        if dynamic_agents is not None:
+            print(f'Reusing the cached roster of {len(dynamic_agents)} agents for this job profile.')
+        return dynamic_agents
+
+    def _cache_agents(self, dynamic_agents):
+        if self.roster_cache is not None and dynamic_agents:
+            self.roster_cache.put(self._roster_key(), dynamic_agents)
+
     def run(self):
+        dynamic_agents = self._get_cached_agents()
+        if dynamic_agents is not None:
+            return dynamic_agents
         response = self.get_response()
         json_response = self.parse_response(response)
         print(f'Creating dynamic agents who will be responsible for resume screening and matching analysis.')
         dynamic_agents = self.get_dynamic_agents(json_response)
+        self._cache_agents(dynamic_agents)
+        return dynamic_agents
+
+    async def run_async(self):
+        dynamic_agents = self._get_cached_agents()
+        if dynamic_agents is not None:
+            return dynamic_agents
+        response = await self.get_response_async()
+        json_response = self.parse_response(response)
+        print(f'Creating dynamic agents who will be responsible for resume screening and matching analysis.')
+        dynamic_agents = self.get_dynamic_agents(json_response)
+        self._cache_agents(dynamic_agents)
         return dynamic_agents
 
 
+class KernelFactory:
+    """
+    Shared building blocks for Semantic Kernel agents. Stateless plugins are created
+    once per configuration and reused by every agent and screening run. Kernels (and
+    the chat service inside them) are bound to the async client of an event loop, so
+    they are shared by all agents of that loop and dropped with it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._plugins = {}
+        self._kernels = weakref.WeakKeyDictionary()  # event loop -> {key: kernel}
+        self.hits = 0
+        self.misses = 0
+
+    def get_plugins(self, bing_connector=None, bing_api_key=None):
+        """Plugins for expert agents; web search only when a Bing connector is configured"""
+        key = hashlib.sha256((bing_api_key or "").encode("utf-8")).hexdigest()[:16] if bing_connector else ""
+        with self._lock:
+            plugins = self._plugins.get(key)
+            if plugins is None:
+                plugins = self._plugins[key] = []
+                if bing_connector is not None:
+                    plugins.append(KernelPlugin.from_object("WebSearch", WebSearchEnginePlugin(bing_connector)))
+                plugins.append(KernelPlugin.from_object("ResumeScreening", ResumeScreeningPlugin()))
+            return plugins
+
+    def get_kernel(self, key, build):
+        """Return the kernel for `key` on the running event loop, creating it with `build` once"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Outside an event loop the kernel is not shared, its client binds to the loop that first uses it
+            return build()
+        with self._lock:
+            kernels = self._kernels.get(loop)
+            if kernels is None:
+                kernels = self._kernels[loop] = {}
+            kernel = kernels.get(key)
+            if kernel is None:
+                self.misses += 1
+                kernel = kernels[key] = build()
+            else:
+                self.hits += 1
+            return kernel
+
+    def stats(self):
+        with self._lock:
+            return {
+                "plugin_sets": len(self._plugins),
+                "kernels": sum(len(kernels) for kernels in self._kernels.values()),
+                "event_loops": len(self._kernels),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._plugins.clear()
+            self._kernels.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_kernel_factory = KernelFactory()
+
+
+def get_kernel_factory():
+    """Return the process-wide kernel factory"""
+    return _kernel_factory
+
+
 class ApprovalTerminationStrategy(KernelFunctionTerminationStrategy):
     """A strategy for determining when an agent should terminate."""
 
@@ -224,9 +849,17 @@ class ApprovalTerminationStrategy(KernelFunctionTerminationStrategy):
         return "approved" in history[-1].content.lower()
 
 
+# Service id of the chat service shared by all expert agents
+AGENT_SERVICE_ID = "agents"
+
+
 class MultiAgent:
     def __init__(self):
         self.service_type, self.client, self.model, self.model_orchestrator = get_ai_service_config()
+        # Agents talk to the model through the async client so their calls overlap
+        self.async_client = create_async_client(self.service_type)
+        # Agent completions outside Semantic Kernel go through the response cache, then the scheduler
+        self.completion_client = cache_client(schedule_client(self.async_client, self.service_type, AGENT))
         
         # Initialize Bing connector only if API key is available
         bing_api_key = os.getenv("BING_API_KEY")
@@ -251,17 +884,37 @@ class MultiAgent:
     def _create_kernel_with_chat_completion(self, service_id: str, deployment_name: str) -> Kernel:
         kernel = Kernel()
         if self.service_type == "azure":
-            kernel.add_service(AzureChatCompletion(service_id=service_id, 
-                                                   deployment_name=deployment_name))
+            kernel.add_service(ManagedAzureChatCompletion(service_id=service_id, 
+                                                         deployment_name=deployment_name,
+                                                         async_client=self.async_client))
         elif self.service_type == "openai":
-            kernel.add_service(OpenAIChatCompletion(service_id=service_id, 
-                                                    ai_model_id=deployment_name))
+            kernel.add_service(ManagedOpenAIChatCompletion(service_id=service_id, 
+                                                          ai_model_id=deployment_name,
+                                                          async_client=self.async_client))
         else:  # Gemini - create a minimal kernel without chat completion service
             # For Gemini, we'll use a simplified approach that doesn't require OpenAI
             # We'll handle the chat completion directly with Gemini API
             pass  # Don't add any chat completion service for Gemini
         return kernel
     
+    def get_kernel(self, service_id: str, with_plugins: bool = False) -> Kernel:
+        """
+        Shared kernel for a role ("agents", "selection" or "termination") on the running
+        event loop; the agents' kernel also carries the shared plugins.
+        """
+        plugins = []
+        if with_plugins:
+            plugins = _kernel_factory.get_plugins(self.bing_connector, os.getenv("BING_API_KEY"))
+        key = (self.service_type, service_id, self.model, id(self.async_client), tuple(id(plugin) for plugin in plugins))
+
+        def build():
+            kernel = self._create_kernel_with_chat_completion(service_id, self.model)
+            for plugin in plugins:
+                kernel.add_plugin(plugin)
+            return kernel
+
+        return _kernel_factory.get_kernel(key, build)
+    
     def _standardize_string(self, input_string: str) -> str:
         return re.sub(r'[^0-9A-Za-z_-]', '_', input_string)
     
@@ -277,28 +930,24 @@ class MultiAgent:
                     agent_id=agent_name,
                     name=agent_name,
                     instructions=agent['system_prompt'],
-                    client=self.client,
+                    client=self.completion_client,
                     model=self.model
                 )
                 expert_agents.append(expert_agent)
                 print(f"Created Gemini agent: {agent_name}")
             return expert_agents
         
-        # For Azure/OpenAI, use the existing Semantic Kernel approach
+        # For Azure/OpenAI, all agents share one kernel, chat service and set of plugins
+        kernel = self.get_kernel(AGENT_SERVICE_ID, with_plugins=True)
         for agent in dynamic_agents:
 
             agent_name = self._standardize_string(agent['name'])
-            kernel = self._create_kernel_with_chat_completion(agent_name, self.model)            
         
-            # Configure the function choice behavior to auto invoke kernel functions
-            settings = kernel.get_prompt_execution_settings_from_service_id(service_id=agent_name)
+            # Each agent layers its own settings over the shared service, auto invoking kernel functions
+            settings = kernel.get_prompt_execution_settings_from_service_id(service_id=AGENT_SERVICE_ID)
             settings.function_choice_behavior = FunctionChoiceBehavior.Auto()
-
-            # Add WebSearch plugin only if Bing is available
-            if self.has_bing:
-                kernel.add_plugin(WebSearchEnginePlugin(self.bing_connector), "WebSearch")
-            
-            kernel.add_plugin(ResumeScreeningPlugin(), "ResumeScreening")
+            if structured_output_enabled():
+                settings.response_format = response_format(ScreeningReport)
            
             expert = ChatCompletionAgent(id=agent_name,
                                          kernel=kernel,
@@ -333,27 +982,76 @@ class MultiAgent:
               
         return selection_function
 
-    def create_chat_group(self, expert_agents, selection_function, termination_function, termination_keyword):
+    def create_termination_strategy(self, scope, termination_function, termination_keyword, candidates=(),
+                                    chat_history=None, round_size=None):
+        """
+        Decide after a turn of an agent in `scope` whether the chat is done. Checked
+        locally unless TERMINATION_MODE=llm asks a model to judge the history.
+        `round_size` is the number of turns per round of a chat whose agents take
+        turns; concurrent chats leave it unset and report each finished round.
+        """
+        if termination_mode() == LLM:
+            return KernelFunctionTerminationStrategy(
+                agents=scope,
+                function=termination_function,
+                kernel=self.get_kernel("termination"),
+                result_parser=lambda result: termination_keyword in str(result.value[0]).lower(),
+                history_variable_name="history",
+                maximum_iterations=2,
+            )
+        return LocalTerminationStrategy(
+            agents=scope,
+            policy=TerminationPolicy(termination_keyword, candidates, round_size=round_size),
+            chat_history=chat_history,
+            maximum_iterations=2,
+        )
+
+    def create_selection_strategy(self, expert_agents, selection_function, candidates=(), chat_history=None):
+        """
+        Pick the agent for the next turn. Rule based unless SELECTION_MODE=llm asks a
+        model to choose from the history.
+        """
+        mode = selection_mode()
+        if mode == SELECTION_LLM:
+            return KernelFunctionSelectionStrategy(
+                function=selection_function,
+                kernel=self.get_kernel("selection"),
+                result_parser=lambda result: str(result.value[0]) if result.value is not None else expert_agents[-1].name,
+                agent_variable_name="agents",
+                history_variable_name="history",
+            )
+        if mode == COVERAGE:
+            return CoverageSelectionStrategy(candidates=list(candidates), chat_history=chat_history)
+        return RoundRobinSelectionStrategy()
+
+    def create_chat_group(self, expert_agents, selection_function, termination_function, termination_keyword,
+                          candidates=()):
         if self.service_type == "gemini":
             # For Gemini, create a simplified chat group that doesn't use Semantic Kernel
-            return GeminiChatGroup(expert_agents, termination_keyword)
+            return GeminiChatGroup(expert_agents, termination_keyword,
+                                   policy=TerminationPolicy(termination_keyword, candidates, round_size=None))
+        
+        # A sliding window with a rolling summary keeps prompts from growing every round
+        history = ScreeningHistory(candidates=list(candidates))
+        if selection_mode() == PARALLEL:
+            # Every agent answers each round, so any agent's turn may end the chat
+            return ParallelAgentGroupChat(
+                agents=expert_agents,
+                chat_history=history,
+                termination_strategy=self.create_termination_strategy(
+                    [], termination_function, termination_keyword, candidates, history
+                ),
+            )
         
         # For Azure/OpenAI, use the existing Semantic Kernel approach
         group = AgentGroupChat(agents=expert_agents,
-                               selection_strategy=KernelFunctionSelectionStrategy(
-                                    function=selection_function,
-                                    kernel=self._create_kernel_with_chat_completion("selection", self.model),
-                                    result_parser=lambda result: str(result.value[0]) if result.value is not None else expert_agents[-1].name,
-                                    agent_variable_name="agents",
-                                    history_variable_name="history",
+                               chat_history=history,
+                               selection_strategy=self.create_selection_strategy(
+                                    expert_agents, selection_function, candidates, history
                                 ),
-                                termination_strategy=KernelFunctionTerminationStrategy(
-                                    agents=[expert_agents[-1]],
-                                    function=termination_function,
-                                    kernel=self._create_kernel_with_chat_completion("termination", self.model),
-                                    result_parser=lambda result: termination_keyword in str(result.value[0]).lower(),
-                                    history_variable_name="history",
-                                    maximum_iterations=2,
+                                termination_strategy=self.create_termination_strategy(
+                                    [expert_agents[-1]], termination_function, termination_keyword, candidates, history,
+                                    round_size=len(expert_agents)
                                 ),
                         )
           
@@ -400,75 +1098,307 @@ class GeminiAgent:
 class GeminiChatGroup:
     """Simplified chat group for Gemini agents"""
     
-    def __init__(self, agents, termination_keyword):
+    def __init__(self, agents, termination_keyword, concurrency=None, policy=None):
         self.agents = agents
         self.termination_keyword = termination_keyword
         self.is_complete = False
         self.history = []
+        # Completed agent responses, checked locally for a verdict after each one
+        self.transcript = []
+        # Responses of each finished round, compared for convergence once the whole round is in
+        self.rounds = []
+        self.history_window = int(os.getenv("HISTORY_WINDOW", "8"))
+        self.policy = policy or TerminationPolicy(termination_keyword, round_size=None)
+        self.termination_reason = None
+        self.stream_metrics = {}
+        # Optional ProgressReporter notified of each agent's lifecycle events
+        self.reporter = None
+        # Maximum number of agents called at once, 0 means all agents in parallel
+        if concurrency is None:
+            concurrency = int(os.getenv("AGENT_CONCURRENCY", "0"))
+        self.concurrency = concurrency
     
     async def add_chat_message(self, message):
-        """Add a message to the chat history"""
-        self.history.append(message)
+        """Add a message to the chat history, keeping the latest copy of a repeated input and a window of messages"""
+        self.history = dedupe_inputs(self.history + [message])[-self.history_window:]
+
+    def _get_request(self, agent, last_message):
+        """Build the completion request for a single agent"""
+        # The agent's instructions go in the system message, which Gemini handles natively
+        system_prompt = f"""
+            You are {agent.name}. Your role: {agent.instructions}
+            
+            Please provide your analysis and recommendations based on your role.
+            """
+        return dict(
+            model=agent.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": f"User request: {last_message.content}"},
+            ],
+            max_completion_tokens=1000,
+            **({"response_format": response_format(ScreeningReport)} if structured_output_enabled() else {})
+        )
+    
+    async def _get_agent_response(self, agent, last_message):
+        """Call the model for a single agent"""
+        self._emit(agent, STARTED)
+        try:
+            # Generate response using Gemini
+            response = await create_chat_completion(agent.client, **self._get_request(agent, last_message))
+            
+            # Parse the response
+            response_text = response.choices[0].message.content
+            
+            self._emit(agent, DONE)
+            
+            # Create a mock response object similar to Semantic Kernel's format
+            return type('MockResponse', (), {
+                'role': 'assistant',
+                'name': agent.name,
+                'content': response_text
+            })()
+                
+        except Exception as e:
+            # Handle errors gracefully
+            self._emit(agent, ERROR, str(e))
+            return type('ErrorResponse', (), {
+                'role': 'assistant',
+                'name': agent.name,
+                'content': f"I apologize, but I encountered an error while processing your request: {str(e)}",
+                'is_error': True
+            })()
+    
+    def _emit(self, agent, kind, detail=""):
+        if self.reporter is not None:
+            self.reporter.emit(agent.name, kind, detail)
+    
+    def _contains_termination(self, content):
+        """Record a completed response and check whether it ends the chat on its own (verdict or turn limit)"""
+        self.transcript.append(content)
+        self.rounds[-1].append(content)
+        self.termination_reason = self.policy.turn_reason(self.transcript)
+        return self.termination_reason is not None
+    
+    def _is_termination(self, response):
+        """Check whether a successful agent response ends the chat"""
+        return not getattr(response, 'is_error', False) and self._contains_termination(response.content)
+
+    def _round_converged(self):
+        """After every agent of the round has answered: has the ranking stopped changing between rounds?"""
+        self.termination_reason = self.policy.round_reason(self.rounds)
+        self.is_complete = self.termination_reason is not None
+        return self.is_complete
     
     async def invoke(self):
-        """Invoke the chat group to process messages"""
+        """
+        Invoke the chat group to process messages. Agents answer independently, so their
+        model calls are dispatched concurrently (bounded by `concurrency`) and responses
+        are yielded in completion order.
+        """
         if not self.history:
             return
         
         # Get the last message
         last_message = self.history[-1]
+        limit = self.concurrency if self.concurrency > 0 else len(self.agents)
+        self.rounds.append([])
         
-        # Process with each agent
-        for agent in self.agents:
-            # Create a prompt combining the agent's instructions with the user message
-            prompt = f"""
-            You are {agent.name}. Your role: {agent.instructions}
-            
-            User request: {last_message.content}
-            
-            Please provide your analysis and recommendations based on your role.
-            """
-            
-            try:
-                # Generate response using Gemini
-                response = agent.client.chat.completions.create(
-                    model=agent.model,
-                    messages=[{"role": "user", "content": prompt}],
-                    max_completion_tokens=1000
-                )
-                
-                # Parse the response
-                response_text = response.choices[0].message.content
-                
-                # Create a mock response object similar to Semantic Kernel's format
-                mock_response = type('MockResponse', (), {
-                    'role': 'assistant',
-                    'name': agent.name,
-                    'content': response_text
-                })()
-                
-                yield mock_response
+        if limit <= 1:
+            # One agent at a time; agents after a termination are never called
+            for agent in self.agents:
+                response = await self._get_agent_response(agent, last_message)
+                yield response
+                if self._is_termination(response):
+                    self.is_complete = True
+                    return
+            self._round_converged()
+            return
+        
+        semaphore = asyncio.Semaphore(limit)
+
+        async def respond(agent):
+            async with semaphore:
+                return await self._get_agent_response(agent, last_message)
+
+        tasks = [asyncio.create_task(respond(agent)) for agent in self.agents]
+        try:
+            for next_response in asyncio.as_completed(tasks):
+                response = await next_response
+                yield response
                 
                 # Check for termination
-                if self.termination_keyword.lower() in response_text.lower():
+                if self._is_termination(response):
                     self.is_complete = True
-                    break
-                    
-            except Exception as e:
-                # Handle errors gracefully
-                error_response = type('ErrorResponse', (), {
+                    return
+            self._round_converged()
+        finally:
+            # Agents still queued behind the concurrency limit are not called
+            for task in tasks:
+                task.cancel()
+    
+    async def _stream_agent_response(self, agent, last_message, queue):
+        """Stream a single agent's response into the queue as ("chunk" | "error" | "done", agent, value) events"""
+        metrics = self.stream_metrics[agent.name] = StreamMetrics(agent.name)
+        self._emit(agent, STARTED)
+        content = ""
+        try:
+            async for text in stream_chat_completion(agent.client, **self._get_request(agent, last_message)):
+                if not content:
+                    self._emit(agent, FIRST_TOKEN)
+                metrics.record(text)
+                content += text
+                await queue.put(("chunk", agent, text))
+        except Exception as e:
+            # Handle errors gracefully
+            self._emit(agent, ERROR, str(e))
+            await queue.put(("error", agent, f"I apologize, but I encountered an error while processing your request: {str(e)}"))
+            return
+        self._emit(agent, DONE, metrics.summary())
+        await queue.put(("done", agent, content))
+    
+    async def invoke_stream(self):
+        """
+        Stream the agents' responses as they are generated. Yields chunks with the agent's
+        `name` and the new `content`; agents stream concurrently (bounded by `concurrency`)
+        so chunks of different agents interleave. Per-agent time to first token and
+        throughput are kept in `stream_metrics`.
+        """
+        if not self.history:
+            return
+        
+        last_message = self.history[-1]
+        limit = self.concurrency if self.concurrency > 0 else len(self.agents)
+        semaphore = asyncio.Semaphore(limit)
+        queue = asyncio.Queue()
+        self.stream_metrics = {}
+        self.rounds.append([])
+        
+        async def stream(agent):
+            async with semaphore:
+                await self._stream_agent_response(agent, last_message, queue)
+        
+        tasks = [asyncio.create_task(stream(agent)) for agent in self.agents]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                kind, agent, value = await queue.get()
+                if kind == "done":
+                    remaining -= 1
+                    if self._contains_termination(value):
+                        self.is_complete = True
+                        return
+                    continue
+                yield type('StreamingResponse', (), {
                     'role': 'assistant',
                     'name': agent.name,
-                    'content': f"I apologize, but I encountered an error while processing your request: {str(e)}"
+                    'content': value,
+                    'is_error': kind == "error"
                 })()
-                yield error_response
-    
-    async def invoke_stream(self):
-        """Streaming version of invoke - alias for invoke since we already yield responses"""
-        async for response in self.invoke():
-            yield response
+                if kind == "error":
+                    remaining -= 1
+            self._round_converged()
+        finally:
+            # Agents still queued behind the concurrency limit are not called
+            for task in tasks:
+                task.cancel()
     
     async def reset(self):
         """Reset the chat group"""
         self.history = []
+        self.transcript = []
+        self.rounds = []
         self.is_complete = False
+        self.termination_reason = None
+
+
+class ParallelAgentGroupChat(AgentGroupChat):
+    """
+    Semantic Kernel group chat in which every agent answers the latest messages at
+    once each round, so no selection step is needed. Each agent works on its own copy
+    of the history; finished responses are appended in completion order and checked
+    by the termination strategy. Exposes `stream_metrics` and `reporter` like
+    GeminiChatGroup.
+    """
+
+    concurrency: int = Field(default_factory=lambda: int(os.getenv("AGENT_CONCURRENCY", "0")))
+    stream_metrics: dict = Field(default_factory=dict)
+    reporter: Any = None
+
+    def _emit(self, agent, kind, detail=""):
+        if self.reporter is not None:
+            self.reporter.emit(agent.name, kind, detail)
+
+    async def _stream_agent(self, agent, snapshot, queue):
+        """Stream one agent's answer into the queue as ("chunk" | "error" | "done", agent, value) events"""
+        metrics = self.stream_metrics[agent.name] = StreamMetrics(agent.name)
+        self._emit(agent, STARTED)
+        history = ChatHistory(messages=list(snapshot))
+        try:
+            async for chunk in agent.invoke_stream(history):
+                if chunk.content:
+                    if metrics.first_token_at is None:
+                        self._emit(agent, FIRST_TOKEN)
+                    metrics.record(chunk.content)
+                await queue.put(("chunk", agent, chunk))
+        except Exception as e:
+            self._emit(agent, ERROR, str(e))
+            await queue.put(("error", agent, str(e)))
+            return
+        self._emit(agent, DONE, metrics.summary())
+        await queue.put(("done", agent, history.messages[len(snapshot):]))
+
+    async def invoke_stream(self, agent=None, is_joining=True):
+        if agent is not None:
+            async for message in super().invoke_stream(agent, is_joining):
+                yield message
+            return
+
+        if not self.agents:
+            raise AgentChatException("No agents are available")
+        if self.is_complete:
+            if not self.termination_strategy.automatic_reset:
+                raise AgentChatException("Chat is already complete")
+            self.is_complete = False
+
+        snapshot = list(self.history.messages)
+        limit = self.concurrency if self.concurrency > 0 else len(self.agents)
+        semaphore = asyncio.Semaphore(limit)
+        queue = asyncio.Queue()
+        self.stream_metrics = {}
+
+        async def stream(agent):
+            async with semaphore:
+                await self._stream_agent(agent, snapshot, queue)
+
+        tasks = [asyncio.create_task(stream(agent)) for agent in self.agents]
+        round_messages = []
+        try:
+            remaining = len(tasks)
+            while remaining:
+                kind, agent, value = await queue.get()
+                if kind == "chunk":
+                    yield value
+                    continue
+                remaining -= 1
+                if kind == "error":
+                    yield StreamingChatMessageContent(
+                        role=AuthorRole.ASSISTANT, name=agent.name, choice_index=0,
+                        content=f"I apologize, but I encountered an error while processing your request: {value}"
+                    )
+                    continue
+                for message in value:
+                    self.history.add_message(message)
+                round_messages.extend(message.content for message in value
+                                      if message.role == AuthorRole.ASSISTANT and message.content)
+                if await self.termination_strategy.should_terminate(agent, self.history.messages):
+                    self.is_complete = True
+                    return
+            # Convergence is judged on the whole round, never on the first agents to finish
+            should_round_terminate = getattr(self.termination_strategy, "should_round_terminate", None)
+            if should_round_terminate is not None and should_round_terminate(round_messages):
+                self.is_complete = True
+        finally:
+            # Agents still queued behind the concurrency limit are not called
+            for task in tasks:
+                task.cancel()
@@ -0,0 +1,110 @@
+"""
+Vectorized scoring of whole candidate pools for the ResumeScreeningPlugin.
+
+Each resume's extracted features are encoded as boolean rows against the job's
+requirement vocabulary, so the skill, experience, education and overall scores
+for the whole pool are computed with a handful of NumPy operations. The scoring
+rules mirror ResumeScreeningPlugin._calculate_*_match exactly.
+"""
+
+from typing import Dict, List
+
+import numpy as np
+
+
+SKILL_WEIGHT = 0.5
+EXPERIENCE_WEIGHT = 0.3
+EDUCATION_WEIGHT = 0.2
+
+
+class PoolScores:
+    """Per-candidate score arrays for a pool, in input order"""
+
+    def __init__(self, skill: np.ndarray, experience: np.ndarray, education: np.ndarray):
+        self.skill = skill
+        self.experience = experience
+        self.education = education
+        self.overall = (skill * SKILL_WEIGHT) + (experience * EXPERIENCE_WEIGHT) + (education * EDUCATION_WEIGHT)
+
+    def __len__(self) -> int:
+        return len(self.overall)
+
+    def top_n(self, n: int) -> np.ndarray:
+        """Indices of the best `n` candidates, best first, ties kept in input order"""
+        return top_n_indices(np.round(self.overall, 1), n)
+
+
+def _max_years(values: List[str]) -> int:
+    return max([int(value) for value in values], default=0)
+
+
+def encode_pool(pool_features: List, requirements: Dict):
+    """
+    Encode extracted features (objects with skills/experience/education lists)
+    against the requirement vocabulary.
+    Returns (skill_matrix, education_matches, candidate_years).
+    """
+    skill_columns = {skill: column for column, skill in enumerate(dict.fromkeys(requirements.get("skills", [])))}
+    required_education = set(requirements.get("education", []))
+
+    skill_matrix = np.zeros((len(pool_features), len(skill_columns)), dtype=bool)
+    education_matches = np.zeros(len(pool_features), dtype=bool)
+    candidate_years = np.zeros(len(pool_features), dtype=np.int64)
+
+    for row, features in enumerate(pool_features):
+        for skill in features.skills:
+            column = skill_columns.get(skill)
+            if column is not None:
+                skill_matrix[row, column] = True
+        education_matches[row] = not required_education.isdisjoint(features.education)
+        candidate_years[row] = _max_years(features.experience)
+
+    return skill_matrix, education_matches, candidate_years
+
+
+def score_pool(pool_features: List, requirements: Dict) -> PoolScores:
+    """Compute all sub-scores and the weighted overall score for a pool at once"""
+    skill_matrix, education_matches, candidate_years = encode_pool(pool_features, requirements)
+    size = len(pool_features)
+
+    required_skills = len(set(requirements.get("skills", [])))
+    if required_skills:
+        skill = np.minimum(skill_matrix.sum(axis=1) / required_skills * 100, 100.0)
+    else:
+        skill = np.full(size, 80.0)  # Default score if no specific skills required
+
+    if requirements.get("experience"):
+        required_years = _max_years(requirements["experience"])
+        if required_years > 0:
+            ratio = np.maximum(candidate_years / required_years * 100, 20.0)
+            experience = np.where(candidate_years >= required_years, 100.0,
+                                  np.where(candidate_years >= required_years * 0.7, 80.0, ratio))
+        else:
+            experience = np.full(size, 100.0)
+    else:
+        experience = np.full(size, 75.0)
+
+    if requirements.get("education"):
+        education = np.where(education_matches, 90.0, 50.0)
+    else:
+        education = np.full(size, 70.0)
+
+    return PoolScores(skill.astype(float), experience.astype(float), education.astype(float))
+
+
+def top_n_indices(scores: np.ndarray, n: int) -> np.ndarray:
+    """
+    Indices of the `n` highest scores, best first. Uses argpartition so only the
+    selected candidates are sorted; ties keep input order like a stable sort.
+    """
+    n = max(0, min(n, len(scores)))
+    if n == 0:
+        return np.empty(0, dtype=np.int64)
+    if n < len(scores):
+        kth = scores[np.argpartition(-scores, n - 1)[:n]].min()
+        above = np.flatnonzero(scores > kth)
+        ties = np.flatnonzero(scores == kth)[:n - len(above)]
+        selected = np.concatenate([above, ties])
+    else:
+        selected = np.arange(len(scores))
+    return selected[np.argsort(-scores[selected], kind="stable")]
@@ -1,12 +1,141 @@
-from typing import Annotated, List, Dict
+from collections import OrderedDict
+from typing import Annotated, Iterable, List, Dict
 from semantic_kernel.functions.kernel_function_decorator import kernel_function
+import hashlib
+import heapq
 import json
+import os
 import re
+import threading
+
+from src.plugins.batch_scoring import score_pool
+
+
+# Common skill keywords
+SKILL_PATTERNS = [
+    r'\b(?:Python|Java|JavaScript|React|Angular|Vue|Node\.js|Django|Flask)\b',
+    r'\b(?:SQL|MySQL|PostgreSQL|MongoDB|Redis|Elasticsearch)\b',
+    r'\b(?:AWS|Azure|GCP|Docker|Kubernetes|Jenkins|Git)\b',
+    r'\b(?:Machine Learning|AI|Data Science|Analytics|Statistics)\b',
+    r'\b(?:Project Management|Agile|Scrum|Leadership|Communication)\b'
+]
+
+# Experience indicators, the first group captures the number of years
+EXPERIENCE_PATTERNS = [
+    r'(\d+)\+?\s*years?\s*of\s*experience',
+    r'(\d+)\+?\s*years?\s*in',
+    r'experience:\s*(\d+)\+?\s*years?',
+    r'(\d+)\+?\s*years?\s*working'
+]
+
+EDUCATION_PATTERNS = [
+    r'\b(?:Bachelor|Master|PhD|MBA|B\.S\.|M\.S\.|B\.A\.|M\.A\.)\b',
+    r'\b(?:Computer Science|Engineering|Mathematics|Business|Marketing)\b',
+    r'\b(?:University|College|Institute|School)\b'
+]
+
+
+class ResumeFeatures:
+    """Skill, experience and education tokens found in a document."""
+
+    def __init__(self, skills: List[str], experience: List[str], education: List[str]):
+        self.skills = skills
+        self.experience = experience
+        self.education = education
+
+
+class ResumeFeatureMatcher:
+    """
+    Finds all skill, education and experience tokens with precompiled patterns: one
+    alternation per word-bounded family (skills, education) and one pass per
+    experience pattern, since those overlap each other and the education terms
+    (e.g. "3 years in" and "Institute"). A single lookahead-based pattern over all
+    families gives the same matches but ran about twice as slow, because the combined
+    pattern loses the literal-prefix scanning each separate pattern gets.
+    """
+
+    def __init__(self):
+        self._skills = re.compile("|".join(SKILL_PATTERNS), re.IGNORECASE)
+        self._education = re.compile("|".join(EDUCATION_PATTERNS), re.IGNORECASE)
+        self._experience = [re.compile(pattern, re.IGNORECASE) for pattern in EXPERIENCE_PATTERNS]
+
+    def match(self, text: str) -> ResumeFeatures:
+        # dicts keep the first-seen order while removing duplicates
+        skills = {match.group(0).lower(): None for match in self._skills.finditer(text)}
+        education = {match.group(0).lower(): None for match in self._education.finditer(text)}
+        experience = [match.group(1) for pattern in self._experience for match in pattern.finditer(text)]
+        return ResumeFeatures(list(skills), experience, list(education))
+
+
+class CandidateScore:
+    """Typed score record for one candidate; converted to a dict only at the kernel boundary."""
+
+    __slots__ = (
+        "candidate",
+        "overall_score",
+        "skill_score",
+        "experience_score",
+        "education_score",
+        "explanation",
+        "extracted_skills",
+        "extracted_experience",
+        "extracted_education",
+    )
+
+    def __init__(self, candidate: str, overall_score: float, skill_score: float = 0.0,
+                 experience_score: float = 0.0, education_score: float = 0.0, explanation: str = "",
+                 extracted_skills: List[str] = None, extracted_experience: List[str] = None,
+                 extracted_education: List[str] = None):
+        self.candidate = candidate
+        self.overall_score = overall_score
+        self.skill_score = skill_score
+        self.experience_score = experience_score
+        self.education_score = education_score
+        self.explanation = explanation
+        self.extracted_skills = extracted_skills or []
+        self.extracted_experience = extracted_experience or []
+        self.extracted_education = extracted_education or []
+
+    def to_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "CandidateScore":
+        """Build a score from a to_dict() result; unknown fields raise ValueError instead of being dropped."""
+        unknown = set(data) - set(cls.__slots__)
+        if unknown:
+            raise ValueError(f"Unknown CandidateScore fields: {', '.join(sorted(unknown))}")
+        return cls(**data)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, CandidateScore) and self.to_dict() == other.to_dict()
+
+    # Mutable and compared by value, so instances are deliberately unhashable
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"CandidateScore(candidate={self.candidate!r}, overall_score={self.overall_score})"
+
+
+def rank_scores(scores: Iterable[CandidateScore], top_n: int) -> List[CandidateScore]:
+    """
+    Return the top N scores, best first, ties kept in input order. Uses a bounded heap,
+    so memory stays flat no matter how many scores are streamed in.
+    """
+    return heapq.nlargest(top_n, scores, key=lambda score: score.overall_score)
 
 
 class ResumeScreeningPlugin:
     """The Resume Screening Plugin can be used to analyze resumes and calculate matching scores."""
 
+    def __init__(self):
+        self._matcher = ResumeFeatureMatcher()
+        # Parsed job requirements keyed by a hash of the normalized job profile
+        self._requirements_cache = OrderedDict()
+        self._requirements_cache_size = int(os.getenv("JOB_REQUIREMENTS_CACHE_SIZE", "128"))
+        # The plugin is shared by agents running on several threads
+        self._requirements_lock = threading.Lock()
+
     @kernel_function(description="Analyze a resume against a job profile and calculate matching score.")
     def analyze_resume(self, 
                       resume_content: Annotated[str, "The content of the resume to analyze"],
@@ -17,45 +146,78 @@ class ResumeScreeningPlugin:
         Analyze a single resume against a job profile and return matching score with explanation.
         """
         try:
-            # Extract key information from resume
-            skills = self._extract_skills(resume_content)
-            experience = self._extract_experience(resume_content)
-            education = self._extract_education(resume_content)
-            
             # Extract requirements from job profile
             job_requirements = self._extract_job_requirements(job_profile)
-            
-            # Calculate matching scores for different aspects
-            skill_score = self._calculate_skill_match(skills, job_requirements.get('skills', []))
-            experience_score = self._calculate_experience_match(experience, job_requirements.get('experience', []))
-            education_score = self._calculate_education_match(education, job_requirements.get('education', []))
-            
-            # Calculate overall score (weighted average)
-            overall_score = (skill_score * 0.5) + (experience_score * 0.3) + (education_score * 0.2)
-            
-            # Generate detailed explanation
-            explanation = self._generate_explanation(
-                overall_score, skill_score, experience_score, education_score,
-                skills, experience, education, job_requirements
-            )
-            
-            result = {
-                "candidate": candidate_name,
-                "overall_score": round(overall_score, 1),
-                "skill_score": round(skill_score, 1),
-                "experience_score": round(experience_score, 1),
-                "education_score": round(education_score, 1),
-                "explanation": explanation,
-                "extracted_skills": skills,
-                "extracted_experience": experience,
-                "extracted_education": education
-            }
-            
-            return json.dumps(result, indent=2)
+            result = self._score_resume(resume_content, job_requirements, candidate_name)
+            return json.dumps(result.to_dict(), indent=2)
             
         except Exception as e:
             return f"Error analyzing resume: {str(e)}"
 
+    def analyze_resumes(self, resumes: List[Dict], job_profile: str) -> List[CandidateScore]:
+        """
+        Analyze a pool of resumes ({"filename", "content"} dicts) against one job profile.
+        The job profile is parsed once for the whole pool.
+        """
+        job_requirements = self._extract_job_requirements(job_profile)
+        return [
+            self._score_resume(resume["content"], job_requirements, resume.get("filename", "Unknown"))
+            for resume in resumes
+        ]
+
+    def rank_resumes(self, resumes: List[Dict], job_profile: str, top_n: int = 5) -> Dict:
+        """
+        Batch scoring mode: score a whole pool of resumes with NumPy and return the
+        top N in the same shape as rank_candidates.
+        """
+        job_requirements = self._extract_job_requirements(job_profile)
+        pool_features = [self._matcher.match(resume["content"]) for resume in resumes]
+        scores = score_pool(pool_features, job_requirements)
+
+        top_candidates = [
+            self._score_features(pool_features[i], job_requirements, resumes[i].get("filename", "Unknown"))
+            for i in scores.top_n(top_n)
+        ]
+        return self._build_ranking(len(resumes), top_candidates)
+
+    def _score_resume(self, resume_content: str, job_requirements: Dict, candidate_name: str) -> CandidateScore:
+        """Score a single resume against already parsed job requirements."""
+        # Extract key information from resume
+        return self._score_features(self._matcher.match(resume_content), job_requirements, candidate_name)
+
+    def _score_features(self, features: ResumeFeatures, job_requirements: Dict,
+                        candidate_name: str) -> CandidateScore:
+        """Score extracted resume features against already parsed job requirements."""
+        skills = features.skills
+        experience = features.experience
+        education = features.education
+        
+        # Calculate matching scores for different aspects
+        skill_score = self._calculate_skill_match(skills, job_requirements.get('skills', []))
+        experience_score = self._calculate_experience_match(experience, job_requirements.get('experience', []))
+        education_score = self._calculate_education_match(education, job_requirements.get('education', []))
+        
+        # Calculate overall score (weighted average)
+        overall_score = (skill_score * 0.5) + (experience_score * 0.3) + (education_score * 0.2)
+        
+        # Generate detailed explanation
+        explanation = self._generate_explanation(
+            overall_score, skill_score, experience_score, education_score,
+            skills, experience, education, job_requirements
+        )
+        
+        return CandidateScore(
+            candidate=candidate_name,
+            overall_score=round(overall_score, 1),
+            skill_score=round(skill_score, 1),
+            experience_score=round(experience_score, 1),
+            education_score=round(education_score, 1),
+            explanation=explanation,
+            extracted_skills=skills,
+            extracted_experience=experience,
+            extracted_education=education
+        )
+
     @kernel_function(description="Compare multiple resumes and rank them by matching score.")
     def rank_candidates(self,
                        analysis_results: Annotated[List[str], "List of individual analysis results"],
@@ -65,95 +227,77 @@ class ResumeScreeningPlugin:
         Rank multiple candidates based on their analysis results.
         """
         try:
-            candidates = []
-            for result_str in analysis_results:
-                result = json.loads(result_str)
-                candidates.append(result)
-            
-            # Sort by overall score (descending)
-            candidates.sort(key=lambda x: x['overall_score'], reverse=True)
-            
-            # Return top N candidates
-            top_candidates = candidates[:top_n]
-            
-            ranking = {
-                "total_candidates": len(candidates),
-                "top_candidates": top_candidates,
-                "ranking_summary": [
-                    {
-                        "rank": i + 1,
-                        "candidate": candidate["candidate"],
-                        "score": candidate["overall_score"],
-                        "recommendation": self._get_recommendation(candidate["overall_score"])
-                    }
-                    for i, candidate in enumerate(top_candidates)
-                ]
-            }
-            
+            scores = (CandidateScore.from_dict(json.loads(result_str)) for result_str in analysis_results)
+            ranking = self.rank(scores, top_n)
             return json.dumps(ranking, indent=2)
             
         except Exception as e:
             return f"Error ranking candidates: {str(e)}"
 
+    def rank(self, scores: Iterable[CandidateScore], top_n: int = 5) -> Dict:
+        """Rank a stream of candidate scores, keeping only the top N in memory."""
+        total = 0
+
+        def counted():
+            nonlocal total
+            for score in scores:
+                total += 1
+                yield score
+
+        top_candidates = rank_scores(counted(), top_n)
+        return self._build_ranking(total, top_candidates)
+
+    def _build_ranking(self, total_candidates: int, top_candidates: List[CandidateScore]) -> Dict:
+        """Build the ranking structure returned by rank_candidates."""
+        return {
+            "total_candidates": total_candidates,
+            "top_candidates": [candidate.to_dict() for candidate in top_candidates],
+            "ranking_summary": [
+                {
+                    "rank": i + 1,
+                    "candidate": candidate.candidate,
+                    "score": candidate.overall_score,
+                    "recommendation": self._get_recommendation(candidate.overall_score)
+                }
+                for i, candidate in enumerate(top_candidates)
+            ]
+        }
+
     def _extract_skills(self, resume_content: str) -> List[str]:
         """Extract skills from resume content."""
-        # Common skill keywords
-        skill_patterns = [
-            r'\b(?:Python|Java|JavaScript|React|Angular|Vue|Node\.js|Django|Flask)\b',
-            r'\b(?:SQL|MySQL|PostgreSQL|MongoDB|Redis|Elasticsearch)\b',
-            r'\b(?:AWS|Azure|GCP|Docker|Kubernetes|Jenkins|Git)\b',
-            r'\b(?:Machine Learning|AI|Data Science|Analytics|Statistics)\b',
-            r'\b(?:Project Management|Agile|Scrum|Leadership|Communication)\b'
-        ]
-        
-        skills = []
-        for pattern in skill_patterns:
-            matches = re.findall(pattern, resume_content, re.IGNORECASE)
-            skills.extend([match.lower() for match in matches])
-        
-        return list(set(skills))  # Remove duplicates
+        return self._matcher.match(resume_content).skills
 
     def _extract_experience(self, resume_content: str) -> List[str]:
         """Extract work experience from resume content."""
-        # Look for experience indicators
-        experience_patterns = [
-            r'(\d+)\+?\s*years?\s*of\s*experience',
-            r'(\d+)\+?\s*years?\s*in',
-            r'experience:\s*(\d+)\+?\s*years?',
-            r'(\d+)\+?\s*years?\s*working'
-        ]
-        
-        experiences = []
-        for pattern in experience_patterns:
-            matches = re.findall(pattern, resume_content, re.IGNORECASE)
-            experiences.extend(matches)
-        
-        return experiences
+        return self._matcher.match(resume_content).experience
 
     def _extract_education(self, resume_content: str) -> List[str]:
         """Extract education information from resume content."""
-        education_patterns = [
-            r'\b(?:Bachelor|Master|PhD|MBA|B\.S\.|M\.S\.|B\.A\.|M\.A\.)\b',
-            r'\b(?:Computer Science|Engineering|Mathematics|Business|Marketing)\b',
-            r'\b(?:University|College|Institute|School)\b'
-        ]
-        
-        education = []
-        for pattern in education_patterns:
-            matches = re.findall(pattern, resume_content, re.IGNORECASE)
-            education.extend([match.lower() for match in matches])
-        
-        return list(set(education))
+        return self._matcher.match(resume_content).education
 
     def _extract_job_requirements(self, job_profile: str) -> Dict:
-        """Extract requirements from job profile."""
+        """Extract requirements from job profile, memoized per normalized profile."""
+        # Matching is case-insensitive, so case and surrounding whitespace cannot change the requirements
+        key = hashlib.sha256(job_profile.strip().lower().encode("utf-8")).hexdigest()
+        with self._requirements_lock:
+            requirements = self._requirements_cache.get(key)
+            if requirements is not None:
+                self._requirements_cache.move_to_end(key)
+                return requirements
+
         # This is a simplified extraction - in real implementation, 
         # you'd use more sophisticated NLP techniques
+        features = self._matcher.match(job_profile)
         requirements = {
-            'skills': self._extract_skills(job_profile),
-            'experience': self._extract_experience(job_profile),
-            'education': self._extract_education(job_profile)
+            'skills': features.skills,
+            'experience': features.experience,
+            'education': features.education
         }
+        with self._requirements_lock:
+            self._requirements_cache[key] = requirements
+            self._requirements_cache.move_to_end(key)
+            if len(self._requirements_cache) > self._requirements_cache_size:
+                self._requirements_cache.popitem(last=False)
         return requirements
 
     def _calculate_skill_match(self, candidate_skills: List[str], required_skills: List[str]) -> float:
@@ -0,0 +1,98 @@
+"""
+Event-driven progress reporting for screening runs.
+
+Agents report lifecycle events (started, first token, done, error) as they happen,
+so the UI updates from real progress instead of fixed sleeps. RunTimer splits a
+run's wall time into phases such as setup, model and UI time.
+"""
+
+import time
+from collections import Counter, OrderedDict
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Dict, List, Optional
+
+
+STARTED = "started"
+FIRST_TOKEN = "first_token"
+DONE = "done"
+ERROR = "error"
+
+
+class AgentEvent:
+    """A single lifecycle event of one agent"""
+
+    __slots__ = ("agent", "kind", "at", "detail")
+
+    def __init__(self, agent: str, kind: str, at: float, detail: str = ""):
+        self.agent = agent
+        self.kind = kind
+        self.at = at
+        self.detail = detail
+
+    def __repr__(self) -> str:
+        return f"AgentEvent(agent={self.agent!r}, kind={self.kind!r}, detail={self.detail!r})"
+
+
+class RunTimer:
+    """
+    Splits wall time into named phases. Phases nest: time spent in an inner phase
+    (e.g. UI updates during model streaming) is only counted for the inner phase.
+    """
+
+    def __init__(self):
+        self.phases: Dict[str, float] = OrderedDict()
+        self._stack: List[str] = []
+        self._mark = time.perf_counter()
+
+    def _switch(self):
+        now = time.perf_counter()
+        if self._stack:
+            self.phases[self._stack[-1]] += now - self._mark
+        self._mark = now
+
+    @contextmanager
+    def measure(self, phase: str):
+        self._switch()
+        self.phases.setdefault(phase, 0.0)
+        self._stack.append(phase)
+        try:
+            yield
+        finally:
+            self._switch()
+            self._stack.pop()
+
+    @property
+    def total(self) -> float:
+        return sum(self.phases.values())
+
+    def breakdown(self) -> Dict[str, float]:
+        return dict(self.phases)
+
+    def summary(self) -> str:
+        parts = [f"{phase} {seconds:.1f}s" for phase, seconds in self.phases.items()]
+        return f"{self.total:.1f}s total ({', '.join(parts)})"
+
+
+class ProgressReporter:
+    """
+    Collects agent lifecycle events and forwards each one to `listener`. Time spent
+    in the listener is counted as "ui" on the optional RunTimer.
+    """
+
+    def __init__(self, listener: Optional[Callable[[AgentEvent], None]] = None, timer: Optional[RunTimer] = None):
+        self.listener = listener
+        self.timer = timer
+        self.events: List[AgentEvent] = []
+        self.states: Dict[str, str] = {}
+
+    def emit(self, agent: str, kind: str, detail: str = ""):
+        event = AgentEvent(agent, kind, time.perf_counter(), detail)
+        self.events.append(event)
+        self.states[agent] = kind
+        if self.listener is not None:
+            with self.timer.measure("ui") if self.timer is not None else nullcontext():
+                self.listener(event)
+
+    def counts(self) -> Counter:
+        """Number of agents currently in each state"""
+        return Counter(self.states.values())
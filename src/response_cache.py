@@ -0,0 +1,368 @@
+"""
+Prompt-level cache of model responses.
+
+Completions are keyed by a canonical hash of the provider endpoint, model, messages
+and generation parameters (the same deployment name on two Azure resources, or the
+same model id on OpenAI and a compatible endpoint, can answer differently) and stored in a local SQLite database with a per-entry time-to-live and
+a total size limit (least recently used entries go first). Recruiters re-running a
+screening with the same inputs get their responses back in milliseconds; hits are
+counted together with the latency and tokens they saved.
+
+CachedClient wraps the OpenAI-style clients used by the orchestrator, Gemini agents
+and map/reduce screening; CachedChatCompletionMixin plugs the same cache into the
+Semantic Kernel chat services behind agents, selection and termination functions.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+
+# Rough conversion used to estimate saved tokens
+CHARS_PER_TOKEN = 4
+
+# Parameters that change how a response is delivered, not what it contains
+TRANSPORT_PARAMS = frozenset({"stream", "stream_options", "timeout", "extra_headers"})
+
+# Only complete, unfiltered completions are cached. Truncated, filtered or blocked
+# replies (and the fallback texts that stand in for them) are passed through, so the
+# next identical request goes to the model again instead of replaying the failure.
+CACHEABLE_FINISH_REASONS = frozenset({"stop"})
+
+
+class ResponseCache:
+    """SQLite-backed cache of completion texts with TTL and a size limit"""
+
+    def __init__(self, path: Optional[str] = None, max_bytes: Optional[int] = None,
+                 ttl_seconds: Optional[float] = None):
+        self.path = path or os.getenv("RESPONSE_CACHE_PATH", ".cache/responses.sqlite3")
+        if max_bytes is None:
+            max_bytes = int(float(os.getenv("RESPONSE_CACHE_MAX_MB", "128")) * 1024 * 1024)
+        if ttl_seconds is None:
+            ttl_seconds = float(os.getenv("RESPONSE_CACHE_TTL_HOURS", "24")) * 3600
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.saved_seconds = 0.0
+        self.saved_tokens = 0
+        self._lock = threading.Lock()
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        # One connection shared by all sessions, serialized by the lock
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                model TEXT,
+                content TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                prompt_chars INTEGER NOT NULL,
+                latency REAL NOT NULL,
+                expires REAL NOT NULL,
+                last_used REAL NOT NULL,
+                hits INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)")
+
+    @staticmethod
+    def key_for(request: Dict, endpoint: str = "") -> str:
+        """Canonical hash of a request: provider endpoint, model, messages and generation parameters"""
+        canonical = {name: value for name, value in request.items()
+                     if name not in TRANSPORT_PARAMS and value is not None}
+        encoded = json.dumps({"endpoint": endpoint, "request": canonical},
+                             sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached completion text, or None on a miss or expired entry"""
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT content, latency, prompt_chars, expires FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[3] < now:
+                if row is not None:
+                    self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.misses += 1
+                return None
+            content, latency, prompt_chars, _expires = row
+            self._db.execute("UPDATE responses SET last_used = ?, hits = hits + 1 WHERE key = ?", (now, key))
+            self.hits += 1
+            self.saved_seconds += latency
+            self.saved_tokens += (prompt_chars + len(content)) // CHARS_PER_TOKEN
+            return content
+
+    def put(self, key: str, content: str, model: str = "", latency: float = 0.0,
+            prompt_chars: int = 0, ttl_seconds: Optional[float] = None):
+        """Store a completion; `ttl_seconds` overrides the default time-to-live for this entry"""
+        if content is None:
+            return
+        now = time.time()
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        expires = now + ttl if ttl > 0 else float("inf")
+        size = len(content.encode("utf-8"))
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, model, content, size, prompt_chars, latency, expires, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, model, content, size, prompt_chars, latency, expires, now)
+            )
+            self._evict(now)
+
+    def _evict(self, now: float):
+        self._db.execute("DELETE FROM responses WHERE expires < ?", (now,))
+        if self.max_bytes <= 0:
+            return
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in self._db.execute("SELECT key, size FROM responses ORDER BY last_used").fetchall():
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+
+    def stats(self) -> Dict:
+        with self._lock:
+            entries, size = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        return {
+            "entries": entries,
+            "bytes": size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "saved_seconds": round(self.saved_seconds, 2),
+            "saved_tokens": self.saved_tokens,
+        }
+
+
+def endpoint_of(client) -> str:
+    """
+    Provider and base URL of an OpenAI-style client, looking through wrappers such as
+    ScheduledClient. Azure base URLs carry the resource (and deployment, when bound).
+    """
+    while not hasattr(client, "base_url") and hasattr(client, "client"):
+        client = client.client
+    provider = type(client).__name__.removeprefix("Async")
+    return f"{provider}:{getattr(client, 'base_url', None) or ''}"
+
+
+def _prompt_chars(request: Dict) -> int:
+    return sum(len(str(message.get("content") or "")) for message in request.get("messages", []))
+
+
+def _finish_reason(choice) -> Optional[str]:
+    """Finish reason of an OpenAI-style or Semantic Kernel choice as a plain string"""
+    reason = getattr(choice, "finish_reason", None)
+    return getattr(reason, "value", reason)
+
+
+def _cacheable(response) -> bool:
+    choices = getattr(response, "choices", None)
+    return bool(choices) and _finish_reason(choices[0]) in CACHEABLE_FINISH_REASONS
+
+
+class CachedMessage:
+    def __init__(self, content):
+        self.content = content
+
+
+class CachedChoice:
+    def __init__(self, content):
+        self.message = CachedMessage(content)
+        self.delta = self.message
+
+
+class CachedResponse:
+    """A cached completion in the OpenAI response (and streaming chunk) format"""
+
+    def __init__(self, content, model):
+        self.choices = [CachedChoice(content)]
+        self.model = model
+        self.cached = True
+
+    def model_dump_json(self):
+        return json.dumps({"choices": [{"message": {"content": self.choices[0].message.content}}]})
+
+
+class CachedClient:
+    """
+    Wraps an OpenAI-style client (sync or async) so `chat.completions.create` is
+    served from the response cache when the same request was seen before.
+    """
+
+    def __init__(self, client, cache: ResponseCache):
+        self.client = client
+        self.cache = cache
+        create = client.chat.completions.create
+        if inspect.iscoroutinefunction(inspect.unwrap(create)):
+            completions = AsyncCachedCompletions(create, cache, endpoint_of(client))
+        else:
+            completions = CachedCompletions(create, cache, endpoint_of(client))
+        self.chat = type("CachedChat", (), {"completions": completions})()
+
+
+class CachedCompletions:
+    def __init__(self, create, cache: ResponseCache, endpoint: str = ""):
+        self._create = create
+        self.cache = cache
+        self.endpoint = endpoint
+
+    def create(self, **kwargs):
+        if kwargs.get("stream"):
+            return self._create(**kwargs)
+        key = self.cache.key_for(kwargs, self.endpoint)
+        content = self.cache.get(key)
+        if content is not None:
+            return CachedResponse(content, kwargs.get("model"))
+        started = time.perf_counter()
+        response = self._create(**kwargs)
+        if _cacheable(response):
+            self.cache.put(key, response.choices[0].message.content, kwargs.get("model", ""),
+                           time.perf_counter() - started, _prompt_chars(kwargs))
+        return response
+
+
+class AsyncCachedCompletions:
+    def __init__(self, create, cache: ResponseCache, endpoint: str = ""):
+        self._create = create
+        self.cache = cache
+        self.endpoint = endpoint
+
+    async def create(self, **kwargs):
+        key = self.cache.key_for(kwargs, self.endpoint)
+        content = self.cache.get(key)
+        if content is not None:
+            response = CachedResponse(content, kwargs.get("model"))
+            return _replay(response) if kwargs.get("stream") else response
+        started = time.perf_counter()
+        response = await self._create(**kwargs)
+        if kwargs.get("stream"):
+            return self._record_stream(response, key, kwargs, started)
+        if _cacheable(response):
+            self.cache.put(key, response.choices[0].message.content, kwargs.get("model", ""),
+                           time.perf_counter() - started, _prompt_chars(kwargs))
+        return response
+
+    async def _record_stream(self, stream, key, request, started):
+        """Pass chunks through and store the full text once the stream completes normally"""
+        parts = []
+        finish_reason = None
+        async for chunk in stream:
+            text = chunk.choices[0].delta.content if chunk.choices else None
+            if text:
+                parts.append(text)
+            if chunk.choices:
+                finish_reason = _finish_reason(chunk.choices[0]) or finish_reason
+            yield chunk
+        if finish_reason in CACHEABLE_FINISH_REASONS and parts:
+            self.cache.put(key, "".join(parts), request.get("model", ""),
+                           time.perf_counter() - started, _prompt_chars(request))
+
+
+async def _replay(response: CachedResponse):
+    yield response
+
+
+class CachedChatCompletionMixin:
+    """
+    Mixin for Semantic Kernel OpenAI/Azure chat services. Non-streaming requests
+    (agents, selection and termination functions) are cached as full ChatCompletion
+    objects so tool calls round-trip; streamed text responses are replayed as one chunk.
+    """
+
+    async def _send_request(self, settings):
+        cache = get_response_cache()
+        if cache is None or getattr(settings, "stream", False):
+            return await super()._send_request(settings)
+        from openai.types.chat import ChatCompletion
+
+        request = settings.prepare_settings_dict()
+        key = cache.key_for(request, endpoint_of(self.client))
+        cached = cache.get(key)
+        if cached is not None:
+            return ChatCompletion.model_validate_json(cached)
+        started = time.perf_counter()
+        response = await super()._send_request(settings)
+        if isinstance(response, ChatCompletion) and response.choices and all(
+                choice.finish_reason in CACHEABLE_FINISH_REASONS | {"tool_calls"} for choice in response.choices):
+            cache.put(key, response.model_dump_json(), request.get("model", ""),
+                      time.perf_counter() - started, _prompt_chars(request))
+        return response
+
+    async def _inner_get_streaming_chat_message_contents(self, chat_history, settings, function_invoke_attempt=0):
+        cache = get_response_cache()
+        if cache is None:
+            async for chunk in super()._inner_get_streaming_chat_message_contents(
+                    chat_history, settings, function_invoke_attempt):
+                yield chunk
+            return
+        from semantic_kernel.contents.function_call_content import FunctionCallContent
+        from semantic_kernel.contents.streaming_chat_message_content import StreamingChatMessageContent
+        from semantic_kernel.contents.utils.author_role import AuthorRole
+
+        if not hasattr(settings, "prepare_settings_dict"):
+            settings = self.get_prompt_execution_settings_from_settings(settings)
+        request = settings.prepare_settings_dict()
+        request["messages"] = self._prepare_chat_history_for_request(chat_history)
+        request["model"] = settings.ai_model_id or self.ai_model_id
+        key = cache.key_for(request, endpoint_of(self.client))
+        content = cache.get(key)
+        if content is not None:
+            yield [StreamingChatMessageContent(role=AuthorRole.ASSISTANT, content=content, choice_index=0,
+                                               ai_model_id=request["model"],
+                                               function_invoke_attempt=function_invoke_attempt)]
+            return
+
+        started = time.perf_counter()
+        parts = []
+        calls_function = False
+        finish_reason = None
+        async for chunk in super()._inner_get_streaming_chat_message_contents(
+                chat_history, settings, function_invoke_attempt):
+            for message in chunk:
+                # Responses that call tools depend on the tool results, only plain text is replayed
+                calls_function = calls_function or any(isinstance(item, FunctionCallContent) for item in message.items)
+                if message.choice_index == 0:
+                    if message.content:
+                        parts.append(message.content)
+                    finish_reason = _finish_reason(message) or finish_reason
+            yield chunk
+        if not calls_function and finish_reason in CACHEABLE_FINISH_REASONS and parts:
+            cache.put(key, "".join(parts), request["model"], time.perf_counter() - started, _prompt_chars(request))
+
+
+def cache_client(client):
+    """Wrap a client with the response cache, or return it unchanged when caching is disabled"""
+    cache = get_response_cache()
+    return CachedClient(client, cache) if cache is not None else client
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Return the process-wide response cache, or None when disabled via RESPONSE_CACHE"""
+    global _cache
+    if os.getenv("RESPONSE_CACHE", "true").lower() != "true":
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache()
+    return _cache
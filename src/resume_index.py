@@ -0,0 +1,143 @@
+"""
+Local inverted index over ingested resumes.
+
+Maps each token to a posting list of resume ids with term frequencies and ranks
+resumes against a job profile with BM25. Used to pre-filter large pools so only
+the most promising resumes are sent to the multi-agent screening stage.
+"""
+
+import hashlib
+import heapq
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Tuple
+
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+STOP_WORDS = frozenset("""
+a an and are as at be by for from has have in is it its of on or that the this to was were
+will with we you your our their they he she his her i me my not but if then than so such
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens, keeping tech terms like c++, c# and node.js intact"""
+    tokens = []
+    for token in TOKEN_PATTERN.findall(text.lower()):
+        token = token.rstrip(".")
+        if token and token not in STOP_WORDS:
+            tokens.append(token)
+    return tokens
+
+
+def content_version(resume: Dict) -> str:
+    """Content hash of a resume; matches the corpus store's doc_id so stored resumes are not rehashed"""
+    return resume.get("doc_id") or hashlib.sha256(resume["content"].encode("utf-8")).hexdigest()
+
+
+class ResumeIndex:
+    """Incrementally built BM25 index of resume texts"""
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.doc_lengths: Dict[str, int] = {}
+        self.doc_terms: Dict[str, List[str]] = {}
+        self.doc_versions: Dict[str, str] = {}
+        self.total_length = 0
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self.doc_lengths
+
+    def add(self, doc_id: str, text: str, version: str = None):
+        """Index a resume, replacing any previous version with the same id"""
+        if doc_id in self.doc_lengths:
+            self.remove(doc_id)
+        self.doc_versions[doc_id] = version or content_version({"content": text})
+        tokens = tokenize(text)
+        counts = Counter(tokens)
+        for token, count in counts.items():
+            self.postings.setdefault(token, {})[doc_id] = count
+        self.doc_terms[doc_id] = list(counts)
+        self.doc_lengths[doc_id] = len(tokens)
+        self.total_length += len(tokens)
+
+    def remove(self, doc_id: str):
+        """Drop a resume from the index"""
+        length = self.doc_lengths.pop(doc_id, None)
+        if length is None:
+            return
+        self.total_length -= length
+        del self.doc_versions[doc_id]
+        for token in self.doc_terms.pop(doc_id):
+            posting = self.postings[token]
+            del posting[doc_id]
+            if not posting:
+                del self.postings[token]
+
+    def clear(self):
+        self.postings.clear()
+        self.doc_lengths.clear()
+        self.doc_terms.clear()
+        self.doc_versions.clear()
+        self.total_length = 0
+
+    def score(self, query: str) -> Dict[str, float]:
+        """BM25 score of every resume sharing at least one term with the query"""
+        if not self.doc_lengths:
+            return {}
+        num_docs = len(self.doc_lengths)
+        avg_length = self.total_length / num_docs or 1.0
+        scores: Dict[str, float] = {}
+        for token in set(tokenize(query)):
+            posting = self.postings.get(token)
+            if not posting:
+                continue
+            idf = math.log(1 + (num_docs - len(posting) + 0.5) / (len(posting) + 0.5))
+            for doc_id, tf in posting.items():
+                norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_id] / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+        return scores
+
+    def top_k(self, query: str, k: int) -> List[Tuple[str, float]]:
+        """The `k` best matching resume ids with their scores, best first"""
+        return heapq.nlargest(k, self.score(query).items(), key=lambda item: item[1])
+
+    def sync(self, resumes: List[Dict]):
+        """
+        Bring the index in line with a list of {"filename", "content"} resumes. A resume
+        re-uploaded under the same filename with new content is reindexed.
+        """
+        current = {resume["filename"]: resume for resume in resumes}
+        for doc_id in [doc_id for doc_id in self.doc_lengths if doc_id not in current]:
+            self.remove(doc_id)
+        for doc_id, resume in current.items():
+            version = content_version(resume)
+            if self.doc_versions.get(doc_id) != version:
+                self.add(doc_id, resume["content"], version)
+
+
+def prefilter_resumes(index: ResumeIndex, resumes: List[Dict], job_profile: str, top_k: int) -> List[Dict]:
+    """
+    Keep only the `top_k` resumes that best match the job profile, best first.
+    Resumes with no overlapping terms fill the quota, in pool order, if too few match.
+    """
+    if top_k <= 0 or len(resumes) <= top_k:
+        return list(resumes)
+    index.sync(resumes)
+    by_id = {resume["filename"]: resume for resume in resumes}
+    selected = [by_id[doc_id] for doc_id, _score in index.top_k(job_profile, top_k)]
+    chosen = {resume["filename"] for resume in selected}
+    for resume in resumes:
+        if len(selected) >= top_k:
+            break
+        if resume["filename"] not in chosen:
+            selected.append(resume)
+            chosen.add(resume["filename"])
+    return selected
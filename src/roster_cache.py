@@ -0,0 +1,116 @@
+"""
+Persistent cache of orchestrator-designed agent rosters.
+
+Designing the expert agents is one large orchestrator call per screening. Rosters
+parsed by Orchestrator.get_dynamic_agents are stored in a JSON file keyed by the
+normalized job profile, number of agents, model and orchestrator template, so
+re-screening an open requisition reuses its roster. Entries expire after a TTL and
+the least recently used ones are evicted beyond a maximum count.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+class RosterCache:
+    """JSON-file backed LRU cache of agent rosters with a time-to-live"""
+
+    def __init__(self, path: Optional[str] = None, ttl_seconds: Optional[float] = None,
+                 max_entries: Optional[int] = None):
+        self.path = path or os.getenv("ROSTER_CACHE_PATH", ".cache/rosters.json")
+        if ttl_seconds is None:
+            ttl_seconds = float(os.getenv("ROSTER_CACHE_TTL_HOURS", "168")) * 3600
+        if max_entries is None:
+            max_entries = int(os.getenv("ROSTER_CACHE_MAX_ENTRIES", "256"))
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(job_profile: str, num_agents: int, model: str, template_version: str) -> str:
+        """Cache key; whitespace and case differences in the job profile do not matter"""
+        normalized = re.sub(r"\s+", " ", job_profile).strip().lower()
+        digest = hashlib.sha256()
+        digest.update(f"{num_agents}\0{model}\0{template_version}\0".encode("utf-8"))
+        digest.update(normalized.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _read(self) -> Dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, entries: Dict):
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        # Write to a temporary file first so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _expired(self, entry: Dict, now: float) -> bool:
+        return self.ttl_seconds > 0 and now - entry["created"] > self.ttl_seconds
+
+    def get(self, key: str) -> Optional[List[Dict]]:
+        """Return the cached roster for a key, or None if missing or expired"""
+        now = time.time()
+        with self._lock:
+            entries = self._read()
+            entry = entries.get(key)
+            if entry is None or self._expired(entry, now):
+                self.misses += 1
+                return None
+            entry["used"] = now
+            self._write(entries)
+            self.hits += 1
+            return entry["agents"]
+
+    def put(self, key: str, agents: List[Dict]):
+        """Store a roster, dropping expired and least recently used entries"""
+        now = time.time()
+        with self._lock:
+            entries = {k: entry for k, entry in self._read().items() if not self._expired(entry, now)}
+            entries[key] = {"agents": agents, "created": now, "used": now}
+            if self.max_entries > 0 and len(entries) > self.max_entries:
+                by_use = sorted(entries, key=lambda k: entries[k]["used"])
+                for stale in by_use[:len(entries) - self.max_entries]:
+                    del entries[stale]
+            self._write(entries)
+
+    def __len__(self) -> int:
+        return len(self._read())
+
+    def clear(self):
+        with self._lock:
+            self._write({})
+
+    def stats(self) -> Dict:
+        return {"entries": len(self), "hits": self.hits, "misses": self.misses}
+
+
+_cache = None
+
+
+def get_roster_cache() -> Optional[RosterCache]:
+    """Return the process-wide roster cache, or None when disabled via ROSTER_CACHE"""
+    global _cache
+    if os.getenv("ROSTER_CACHE", "true").lower() != "true":
+        return None
+    if _cache is None:
+        _cache = RosterCache()
+    return _cache
@@ -0,0 +1,354 @@
+"""
+Rate-limit aware scheduling of model calls.
+
+Every model request goes through a per-provider ModelScheduler that enforces a
+maximum number of requests in flight, token buckets for requests/min and
+tokens/min, and priority classes so the orchestrator is served before agents and
+agents before termination checks. Rate-limit (429) and server (5xx) errors are
+retried with exponential backoff and jitter. Queue depth and wait-time metrics
+show how close a workload runs to the provider quota.
+
+Schedulers are process-wide and shared by all Streamlit sessions, so the limits
+hold across event loops and threads.
+"""
+
+import asyncio
+import heapq
+import inspect
+import itertools
+import os
+import random
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import Awaitable, Callable, ClassVar, Dict, Optional
+
+
+ORCHESTRATOR = 0
+AGENT = 1
+TERMINATION = 2
+
+PRIORITY_NAMES = {ORCHESTRATOR: "orchestrator", AGENT: "agent", TERMINATION: "termination"}
+
+# Rough conversion used to estimate the tokens of a request before it is sent
+CHARS_PER_TOKEN = 4
+DEFAULT_COMPLETION_TOKENS = 500
+
+RETRYABLE_STATUS = frozenset({408, 409, 429, 500, 502, 503, 504})
+
+
+class TokenBucket:
+    """Refills `per_minute` units per minute; a limit of 0 disables the bucket"""
+
+    def __init__(self, per_minute: float):
+        self.per_minute = per_minute
+        self.tokens = float(per_minute)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float) -> float:
+        """
+        Take `amount` units now and return the seconds to wait before using them.
+        The bucket may go into debt, which keeps later callers queued in order.
+        """
+        if self.per_minute <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            rate = self.per_minute / 60.0
+            self.tokens = min(float(self.per_minute), self.tokens + (now - self.updated) * rate)
+            self.updated = now
+            self.tokens -= min(amount, self.per_minute)
+            return 0.0 if self.tokens >= 0 else -self.tokens / rate
+
+
+class PrioritySlots:
+    """
+    Counting semaphore that hands free slots to the highest-priority waiter first
+    (lowest number), FIFO within a priority. Waiters may live on different event loops.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_use = 0
+        self._waiters = []  # heap of [priority, sequence, loop, future]
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+    async def acquire(self, priority: int):
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self.limit <= 0 or (self.in_use < self.limit and not self._waiters):
+                self.in_use += 1
+                return
+            future = loop.create_future()
+            entry = [priority, next(self._sequence), loop, future]
+            heapq.heappush(self._waiters, entry)
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                entry[3] = None
+                granted = future.done() and not future.cancelled()
+            if granted:
+                self.release()
+            raise
+
+    def release(self):
+        with self._lock:
+            while self._waiters:
+                _priority, _sequence, loop, future = heapq.heappop(self._waiters)
+                if future is None or loop.is_closed():
+                    continue
+                # The slot passes straight to the waiter, in_use is unchanged
+                loop.call_soon_threadsafe(self._grant, future)
+                return
+            self.in_use -= 1
+
+    def _grant(self, future):
+        if future.cancelled():
+            self.release()
+        else:
+            future.set_result(None)
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    for attribute in ("status_code", "code"):
+        value = getattr(error, attribute, None)
+        if isinstance(value, int):
+            return value
+    return None
+
+
+def is_retryable(error: Exception) -> bool:
+    """Rate limits, server errors and dropped connections are worth retrying"""
+    status = _status_code(error)
+    if status is not None:
+        return status in RETRYABLE_STATUS
+    name = type(error).__name__
+    return name in ("APIConnectionError", "APITimeoutError", "ResourceExhausted", "ServiceUnavailable",
+                    "InternalServerError", "DeadlineExceeded")
+
+
+def retry_after(error: Exception) -> Optional[float]:
+    """Seconds the provider asked us to wait, if it said so"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        value = headers.get("retry-after")
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def estimate_tokens(request: Dict) -> int:
+    """Prompt tokens (estimated from characters) plus the completion budget"""
+    prompt_chars = sum(len(str(message.get("content") or "")) for message in request.get("messages", []))
+    completion = request.get("max_completion_tokens") or request.get("max_tokens") or DEFAULT_COMPLETION_TOKENS
+    return prompt_chars // CHARS_PER_TOKEN + completion
+
+
+class ModelScheduler:
+    """Bounded-concurrency, rate-limited, prioritized gateway to one provider"""
+
+    def __init__(self, provider: str, requests_per_minute: Optional[float] = None,
+                 tokens_per_minute: Optional[float] = None, max_in_flight: Optional[int] = None,
+                 max_retries: Optional[int] = None, base_delay: Optional[float] = None,
+                 max_delay: float = 60.0):
+        self.provider = provider
+        if requests_per_minute is None:
+            requests_per_minute = float(os.getenv("MODEL_RPM", "0"))
+        if tokens_per_minute is None:
+            tokens_per_minute = float(os.getenv("MODEL_TPM", "0"))
+        if max_in_flight is None:
+            max_in_flight = int(os.getenv("MODEL_MAX_IN_FLIGHT", "8"))
+        if max_retries is None:
+            max_retries = int(os.getenv("MODEL_MAX_RETRIES", "4"))
+        if base_delay is None:
+            base_delay = float(os.getenv("MODEL_RETRY_BASE_SECONDS", "1"))
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.slots = PrioritySlots(max_in_flight)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.completed = 0
+        self.failed = 0
+        self.retries = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.wait_by_priority: Dict[int, float] = {}
+
+    def backoff(self, attempt: int) -> float:
+        """Exponential backoff with full jitter"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    async def _wait_for_quota(self, tokens: int):
+        wait = max(self.requests.reserve(1), self.tokens.reserve(tokens))
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    @asynccontextmanager
+    async def reserve(self, priority: int = AGENT, tokens: int = 0):
+        """Hold an in-flight slot, granted by priority, once the request and token quota allow it"""
+        queued_at = time.monotonic()
+        with self._lock:
+            self.queued += 1
+        try:
+            await self.slots.acquire(priority)
+        except BaseException:
+            with self._lock:
+                self.queued -= 1
+            raise
+        try:
+            try:
+                await self._wait_for_quota(tokens)
+            finally:
+                waited = time.monotonic() - queued_at
+                with self._lock:
+                    self.queued -= 1
+                    self.total_wait += waited
+                    self.max_wait = max(self.max_wait, waited)
+                    self.wait_by_priority[priority] = self.wait_by_priority.get(priority, 0.0) + waited
+            yield
+        finally:
+            self.slots.release()
+
+    async def call(self, call: Callable[[], Awaitable], tokens: int = 0):
+        """Run `call` inside a reserved slot, retrying rate-limit and server errors"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                result = await call()
+            except Exception as e:
+                if attempt >= self.max_retries or not is_retryable(e):
+                    with self._lock:
+                        self.failed += 1
+                    raise
+                with self._lock:
+                    self.retries += 1
+                    self.throttled += _status_code(e) == 429 or type(e).__name__ == "ResourceExhausted"
+                await asyncio.sleep(retry_after(e) or self.backoff(attempt))
+                await self._wait_for_quota(tokens)
+                continue
+            with self._lock:
+                self.completed += 1
+            return result
+
+    async def submit(self, call: Callable[[], Awaitable], priority: int = AGENT, tokens: int = 0):
+        """Run `call` once a slot and quota are available, retrying retryable errors"""
+        async with self.reserve(priority, tokens):
+            return await self.call(call, tokens)
+
+    def summary(self) -> str:
+        stats = self.stats()
+        return (f"{self.provider}: {stats['completed']} calls, {stats['in_flight']} in flight, "
+                f"{stats['queue_depth']} queued, avg wait {stats['avg_wait_seconds']:.2f}s "
+                f"(max {stats['max_wait_seconds']:.2f}s), {stats['retries']} retries")
+
+    def stats(self) -> Dict:
+        with self._lock:
+            started = self.completed + self.failed + self.slots.in_use
+            return {
+                "provider": self.provider,
+                "queue_depth": self.queued,
+                "in_flight": self.slots.in_use,
+                "completed": self.completed,
+                "failed": self.failed,
+                "retries": self.retries,
+                "throttled": self.throttled,
+                "avg_wait_seconds": round(self.total_wait / started, 3) if started else 0.0,
+                "max_wait_seconds": round(self.max_wait, 3),
+                "wait_seconds_by_priority": {PRIORITY_NAMES.get(priority, str(priority)): round(wait, 3)
+                                             for priority, wait in self.wait_by_priority.items()},
+            }
+
+
+class ScheduledClient:
+    """
+    Wraps an OpenAI-style client so every `chat.completions.create` call goes through
+    a ModelScheduler with the given priority. The result is always awaitable; sync
+    clients run in a worker thread. Streams hold their slot until fully consumed.
+    """
+
+    def __init__(self, client, scheduler: ModelScheduler, priority: int = AGENT):
+        self.client = client
+        completions = ScheduledCompletions(client.chat.completions.create, scheduler, priority)
+        self.chat = type("ScheduledChat", (), {"completions": completions})()
+
+
+class ScheduledCompletions:
+    def __init__(self, create, scheduler: ModelScheduler, priority: int):
+        self._create = create
+        self._is_async = inspect.iscoroutinefunction(inspect.unwrap(create))
+        self.scheduler = scheduler
+        self.priority = priority
+
+    async def create(self, **kwargs):
+        async def call():
+            if self._is_async:
+                return await self._create(**kwargs)
+            return await asyncio.to_thread(self._create, **kwargs)
+        if kwargs.get("stream") and self._is_async:
+            return self._stream(call, estimate_tokens(kwargs))
+        return await self.scheduler.submit(call, self.priority, estimate_tokens(kwargs))
+
+    async def _stream(self, call, tokens):
+        """Keep the slot until the stream is consumed; only opening the stream is retried"""
+        async with self.scheduler.reserve(self.priority, tokens):
+            stream = await self.scheduler.call(call, tokens)
+            async for chunk in stream:
+                yield chunk
+
+
+class ScheduledChatCompletionMixin:
+    """
+    Mixin for Semantic Kernel OpenAI/Azure chat services that sends every request
+    through the provider's scheduler. Selection and termination services get the
+    lowest priority. Streamed responses hold their slot until the stream is consumed.
+    """
+
+    scheduler_service: ClassVar[str] = "openai"
+
+    def _scheduler_priority(self) -> int:
+        return TERMINATION if self.service_id in ("selection", "termination") else AGENT
+
+    async def _send_request(self, settings):
+        scheduler = get_scheduler(self.scheduler_service)
+        request = settings.prepare_settings_dict()
+        call = lambda: super(ScheduledChatCompletionMixin, self)._send_request(settings)
+        if getattr(settings, "stream", False):
+            # The slot is already held by _inner_get_streaming_chat_message_contents
+            return await scheduler.call(call, estimate_tokens(request))
+        return await scheduler.submit(call, self._scheduler_priority(), estimate_tokens(request))
+
+    async def _inner_get_streaming_chat_message_contents(self, chat_history, settings, function_invoke_attempt=0):
+        if not hasattr(settings, "prepare_settings_dict"):
+            settings = self.get_prompt_execution_settings_from_settings(settings)
+        request = settings.prepare_settings_dict()
+        request["messages"] = self._prepare_chat_history_for_request(chat_history)
+        async with get_scheduler(self.scheduler_service).reserve(self._scheduler_priority(),
+                                                                  estimate_tokens(request)):
+            async for chunk in super()._inner_get_streaming_chat_message_contents(
+                    chat_history, settings, function_invoke_attempt):
+                yield chunk
+
+
+def schedule_client(client, provider: str, priority: int = AGENT) -> ScheduledClient:
+    """Route a client's completions through the process-wide scheduler of its provider"""
+    return ScheduledClient(client, get_scheduler(provider), priority)
+
+
+_schedulers: Dict[str, ModelScheduler] = {}
+_schedulers_lock = threading.Lock()
+
+
+def get_scheduler(provider: str) -> ModelScheduler:
+    """Return the process-wide scheduler for a provider ("azure", "openai" or "gemini")"""
+    with _schedulers_lock:
+        scheduler = _schedulers.get(provider)
+        if scheduler is None:
+            scheduler = _schedulers[provider] = ModelScheduler(provider)
+        return scheduler
@@ -0,0 +1,162 @@
+"""
+Persistent ledger of screening verdicts.
+
+Every agent verdict is stored in a local SQLite database under its requisition (the
+normalized job profile, the agent roster and the model) and the resume's content
+hash. Rescreening an open requisition looks the pool up first: resumes already
+scored are merged into the ranking from the ledger and only new or modified ones
+are sent to the agents, so a rerun costs in proportion to what changed. The
+requisition is keyed by the orchestrator's roster, so the lookup runs before any
+agent is created. A resume is only recorded when all of its verdicts succeeded;
+otherwise it is screened again.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.corpus_store import CorpusStore
+from src.map_reduce import AgentVerdict
+
+
+class ScreeningLedger:
+    """SQLite-backed store of per-agent verdicts by requisition and resume content"""
+
+    def __init__(self, path: Optional[str] = None, ttl_seconds: Optional[float] = None):
+        self.path = path or os.getenv("SCREENING_LEDGER_PATH", ".cache/screening_ledger.sqlite3")
+        if ttl_seconds is None:
+            ttl_seconds = float(os.getenv("SCREENING_LEDGER_TTL_DAYS", "30")) * 86400
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        # One connection shared by all sessions, serialized by the lock
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS verdicts (
+                requisition TEXT NOT NULL,
+                resume TEXT NOT NULL,
+                agent TEXT NOT NULL,
+                score REAL NOT NULL,
+                summary TEXT NOT NULL,
+                strengths TEXT NOT NULL,
+                concerns TEXT NOT NULL,
+                expires REAL NOT NULL,
+                PRIMARY KEY (requisition, resume, agent)
+            )
+        """)
+
+    @staticmethod
+    def requisition_key(job_profile: str, roster: Sequence[Dict], model: str) -> str:
+        """
+        Hash of the job profile (ignoring whitespace and case), the orchestrator's agent
+        roster ({"name", "system_prompt"} dicts) and the model
+        """
+        normalized = re.sub(r"\s+", " ", job_profile).strip().lower()
+        roster = [[agent["name"], agent.get("system_prompt") or ""] for agent in roster]
+        digest = hashlib.sha256()
+        digest.update(f"{model}\0{json.dumps(roster)}\0".encode("utf-8"))
+        digest.update(normalized.encode("utf-8"))
+        return digest.hexdigest()
+
+    @staticmethod
+    def resume_key(resume) -> str:
+        """Content hash of a resume, the corpus store's document id when it has one"""
+        return resume.get("doc_id") or CorpusStore.doc_id_for(resume["content"])
+
+    def lookup(self, requisition: str, resumes: List) -> Tuple[List[AgentVerdict], List]:
+        """
+        Stored verdicts for the resumes already screened under a requisition, reported
+        under each resume's current filename, and the resumes still to be screened.
+        The resumes reused in this run are those not returned as pending.
+        """
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT resume, agent, score, summary, strengths, concerns FROM verdicts "
+                "WHERE requisition = ? AND expires > ?", (requisition, time.time())
+            ).fetchall()
+        by_resume: Dict[str, List[tuple]] = {}
+        for row in rows:
+            by_resume.setdefault(row[0], []).append(row[1:])
+
+        stored, pending = [], []
+        for resume in resumes:
+            resume_rows = by_resume.get(self.resume_key(resume))
+            if not resume_rows:
+                pending.append(resume)
+                continue
+            stored += [AgentVerdict(agent, resume["filename"], score=score, summary=summary,
+                                    strengths=json.loads(strengths), concerns=json.loads(concerns))
+                       for agent, score, summary, strengths, concerns in resume_rows]
+        return stored, pending
+
+    def record(self, requisition: str, resumes: List, verdicts: List[AgentVerdict], agents: Sequence[str]) -> int:
+        """
+        Store the verdicts of each resume, by content, for which every agent in `agents`
+        returned a usable verdict; returns how many resumes were stored. A resume missing
+        an agent's verdict is screened again next time instead of being reused with a
+        partial panel. Verdicts name their resume by filename, so a filename shared by
+        uploads with different content is ambiguous and skipped.
+        """
+        keys_by_filename: Dict[str, set] = {}
+        for resume in resumes:
+            keys_by_filename.setdefault(resume["filename"], set()).add(self.resume_key(resume))
+        by_resume: Dict[str, List[AgentVerdict]] = {}
+        for verdict in verdicts:
+            keys = keys_by_filename.get(verdict.filename, ())
+            if len(keys) == 1:
+                by_resume.setdefault(next(iter(keys)), []).append(verdict)
+        now = time.time()
+        expires = now + self.ttl_seconds if self.ttl_seconds > 0 else float("inf")
+        roster = set(agents)
+        recorded = {resume: resume_verdicts for resume, resume_verdicts in by_resume.items()
+                    if roster and {verdict.agent for verdict in resume_verdicts if verdict.ok} >= roster
+                    and all(verdict.ok for verdict in resume_verdicts)}
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                self._db.execute("DELETE FROM verdicts WHERE expires <= ?", (now,))
+                for resume, resume_verdicts in recorded.items():
+                    # A resume's verdicts are replaced as a whole, so no agent's stale verdict survives
+                    self._db.execute("DELETE FROM verdicts WHERE requisition = ? AND resume = ?", (requisition, resume))
+                    self._db.executemany(
+                        "INSERT OR REPLACE INTO verdicts VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        [(requisition, resume, verdict.agent, verdict.score, verdict.summary,
+                          json.dumps(verdict.strengths), json.dumps(verdict.concerns), expires)
+                         for verdict in resume_verdicts]
+                    )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        return len(recorded)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(DISTINCT requisition || resume) FROM verdicts").fetchone()[0]
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM verdicts")
+
+    def stats(self) -> Dict:
+        return {"resumes": len(self)}
+
+
+_ledger = None
+
+
+def get_screening_ledger() -> Optional[ScreeningLedger]:
+    """Return the process-wide screening ledger, or None when disabled via SCREENING_LEDGER"""
+    global _ledger
+    if os.getenv("SCREENING_LEDGER", "true").lower() != "true":
+        return None
+    if _ledger is None:
+        _ledger = ScreeningLedger()
+    return _ledger
@@ -0,0 +1,72 @@
+"""
+Agent selection for Semantic Kernel group chats.
+
+Picking who speaks next no longer needs a model call per turn. Round robin cycles
+through the roster; coverage gives the turn to the agent whose rubric dimension has
+scored the fewest candidates so far; parallel lets every agent answer each round at
+once (see ParallelAgentGroupChat). SELECTION_MODE=llm keeps the model-driven
+selection through the selection template.
+"""
+
+import os
+from collections import Counter
+from typing import Any, List, Optional
+
+from pydantic import Field
+from semantic_kernel.agents.strategies.selection.selection_strategy import SelectionStrategy
+from semantic_kernel.contents.utils.author_role import AuthorRole
+
+from src.termination import extract_scores
+
+
+ROUND_ROBIN = "round_robin"
+COVERAGE = "coverage"
+PARALLEL = "parallel"
+LLM = "llm"
+
+
+def selection_mode() -> str:
+    return os.getenv("SELECTION_MODE", ROUND_ROBIN).lower()
+
+
+def _last_speaker(history) -> Optional[str]:
+    for message in reversed(history):
+        if message.role == AuthorRole.ASSISTANT and message.name:
+            return message.name
+    return None
+
+
+class RoundRobinSelectionStrategy(SelectionStrategy):
+    """The agent after the last speaker in roster order takes the next turn"""
+
+    async def select_agent(self, agents, history):
+        names = [agent.name for agent in agents]
+        last = _last_speaker(history)
+        if last in names:
+            return agents[(names.index(last) + 1) % len(agents)]
+        return agents[0]
+
+
+class CoverageSelectionStrategy(SelectionStrategy):
+    """
+    The agent that has scored the fewest candidates takes the next turn, then the one
+    with the fewest turns; ties follow roster order. Nobody speaks twice in a row.
+    """
+
+    candidates: List[str] = Field(default_factory=list)
+    # Optional ScreeningHistory of the chat, whose summary keeps the scores of folded turns
+    chat_history: Any = None
+
+    async def select_agent(self, agents, history):
+        scored = {agent.name: set() for agent in agents}
+        for name, scores in getattr(self.chat_history, "scores", {}).items():
+            if name in scored:
+                scored[name].update(scores)
+        turns = Counter()
+        for message in history:
+            if message.role == AuthorRole.ASSISTANT and message.name in scored:
+                scored[message.name].update(extract_scores(message.content, self.candidates))
+                turns[message.name] += 1
+        last = _last_speaker(history)
+        eligible = [agent for agent in agents if agent.name != last] or agents
+        return min(eligible, key=lambda agent: (len(scored[agent.name]), turns[agent.name]))
@@ -0,0 +1,137 @@
+"""
+Structured model output.
+
+The orchestrator's roster and the agents' verdicts are requested with the
+provider's native structured output: an OpenAI/Azure `response_format` JSON schema
+in strict mode, which the Gemini client maps to `response_mime_type` and
+`response_schema`. Replies are validated straight into typed records, so scores
+flow into the ranking without scraping free text or another model call. The
+pydantic models below are the single source of both the schemas and the parsing.
+STRUCTURED_OUTPUT=false sends the requests without a schema; replies are still
+parsed the same way, tolerating code fences or text around the JSON object.
+"""
+
+import copy
+import functools
+import os
+import re
+from typing import Any, Dict, List, Type, TypeVar
+
+from pydantic import BaseModel, Field, ValidationError, field_validator
+
+
+JSON_OBJECT_PATTERN = re.compile(r"\{.*\}", re.DOTALL)
+
+# Schema keywords that only document the pydantic model
+DROPPED_KEYWORDS = ("title", "default")
+
+Model = TypeVar("Model", bound=BaseModel)
+
+
+def structured_output_enabled() -> bool:
+    return os.getenv("STRUCTURED_OUTPUT", "true").lower() == "true"
+
+
+class StructuredOutputError(ValueError):
+    """A model reply that does not validate against the expected schema"""
+
+
+class AgentSpec(BaseModel):
+    name: str = Field(description="Short agent name")
+    role: str = Field(description="Specific expertise area")
+    system_prompt: str = Field(description="Detailed instructions for this agent's analysis focus and responsibilities")
+
+
+class AgentRoster(BaseModel):
+    agents: List[AgentSpec]
+
+
+class CandidateScoreSchema(BaseModel):
+    """One agent's score for one candidate"""
+
+    filename: str = Field("", description="Resume filename exactly as given")
+    score: float = Field(description="Match score from 0 to 100")
+    summary: str = Field("", description="One or two sentences explaining the score")
+    strengths: List[str] = Field(default_factory=list)
+    concerns: List[str] = Field(default_factory=list)
+
+    @field_validator("score")
+    @classmethod
+    def _clamp(cls, score: float) -> float:
+        return min(max(score, 0.0), 100.0)
+
+
+class ScreeningReport(BaseModel):
+    """One agent turn in a group chat: its analysis and a score per candidate scored so far"""
+
+    analysis: str = Field("", description="Your analysis from the perspective of your role")
+    candidates: List[CandidateScoreSchema] = Field(default_factory=list)
+    complete: bool = Field(False, description="True once every candidate has a final score")
+
+
+def _strict(node: Any, defs: Dict[str, Any]) -> Any:
+    """Inline references and close every object, as strict structured output requires"""
+    if isinstance(node, list):
+        return [_strict(item, defs) for item in node]
+    if not isinstance(node, dict):
+        return node
+    if "$ref" in node:
+        return _strict(defs[node["$ref"].rsplit("/", 1)[-1]], defs)
+    schema = {}
+    for key, value in node.items():
+        if key in DROPPED_KEYWORDS:
+            continue
+        if key == "properties":
+            schema[key] = {name: _strict(field, defs) for name, field in value.items()}
+        else:
+            schema[key] = _strict(value, defs)
+    if schema.get("type") == "object":
+        schema["additionalProperties"] = False
+        schema["required"] = list(schema.get("properties", {}))
+    return schema
+
+
+@functools.lru_cache(maxsize=None)
+def _json_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    schema = model.model_json_schema()
+    return _strict(schema, schema.pop("$defs", {}))
+
+
+def json_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """Self-contained strict JSON schema of a model"""
+    return copy.deepcopy(_json_schema(model))
+
+
+def response_format(model: Type[BaseModel]) -> Dict[str, Any]:
+    """OpenAI-style `response_format` asking for a reply matching the model"""
+    return {"type": "json_schema", "json_schema": {"name": model.__name__, "schema": json_schema(model), "strict": True}}
+
+
+def gemini_schema(schema: Any) -> Any:
+    """A JSON schema without the keywords Gemini's response_schema does not accept"""
+    if isinstance(schema, list):
+        return [gemini_schema(item) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+    return {key: ({name: gemini_schema(field) for name, field in value.items()} if key == "properties"
+                  else gemini_schema(value))
+            for key, value in schema.items() if key != "additionalProperties"}
+
+
+def parse_structured(model: Type[Model], text: str) -> Model:
+    """
+    Validate a reply into the model. Structured output is parsed as is; otherwise the
+    JSON object is taken from around code fences or text. Raises StructuredOutputError.
+    """
+    text = text or ""
+    try:
+        return model.model_validate_json(text)
+    except ValidationError as e:
+        error = e
+    match = JSON_OBJECT_PATTERN.search(text)
+    if match is not None and match.group(0) != text:
+        try:
+            return model.model_validate_json(match.group(0))
+        except ValidationError as e:
+            error = e
+    raise StructuredOutputError(f"Reply does not match {model.__name__}: {error.errors()[0]['msg']}")
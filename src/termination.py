@@ -0,0 +1,171 @@
+"""
+Termination checks for agent group chats.
+
+By default the decision is made locally after each agent turn, without a model
+call: the chat ends when the last message carries the termination keyword or a
+structured verdict, when the maximum number of agent turns is reached, or when the
+candidate ranking has stopped changing from one round of agents to the next.
+Concurrent chats check convergence only once every agent of a round has answered,
+so agents agreeing early in a round cannot cut the others off. TERMINATION_MODE=llm
+restores the model judge that reads the history through the termination template.
+"""
+
+import json
+import os
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from semantic_kernel.agents.strategies.termination.termination_strategy import TerminationStrategy
+from semantic_kernel.contents.utils.author_role import AuthorRole
+
+
+LOCAL = "local"
+LLM = "llm"
+
+VERDICT = "verdict"
+MAX_ROUNDS = "max_rounds"
+CONVERGED = "converged"
+
+JSON_OBJECT_PATTERN = re.compile(r"\{.*\}", re.DOTALL)
+
+# Keys of a structured verdict that end the chat when true, e.g. {"complete": true}
+VERDICT_KEYS = ("complete", "done", "terminate", "final")
+
+# How far after a candidate's name the score may appear, e.g. "jane_doe.pdf - Score: 85/100"
+SCORE_WINDOW = 80
+
+
+def termination_mode() -> str:
+    return os.getenv("TERMINATION_MODE", LOCAL).lower()
+
+
+def has_verdict(text: str, keyword: str) -> bool:
+    """
+    True if a finished message carries a verdict: a structured object with a true
+    completion flag or a matching "verdict" field, or otherwise the keyword as a word
+    on the message's last line. Keywords elsewhere in the text, including inside the
+    structured object's values, are part of the analysis and do not count.
+    """
+    if not text:
+        return False
+    match = JSON_OBJECT_PATTERN.search(text)
+    try:
+        data = json.loads(match.group(0)) if match else None
+    except ValueError:
+        data = None
+    if isinstance(data, dict):
+        return (any(data.get(key) is True for key in VERDICT_KEYS)
+                or str(data.get("verdict", "")).lower() == keyword.lower())
+    lines = [line for line in text.strip().splitlines() if line.strip()]
+    return bool(lines) and re.search(rf"(?<!\w){re.escape(keyword)}(?!\w)", lines[-1], re.IGNORECASE) is not None
+
+
+def extract_scores(text: str, candidates: Sequence[str]) -> Dict[str, float]:
+    """Score stated next to each candidate's name (or filename without extension), for those that have one"""
+    scores = {}
+    for candidate in candidates:
+        stem = os.path.splitext(candidate)[0]
+        pattern = rf"{re.escape(stem)}[^\n\d]{{0,{SCORE_WINDOW}}}?(\d{{1,3}}(?:\.\d+)?)"
+        match = re.search(pattern, text or "", re.IGNORECASE)
+        if match is not None:
+            scores[candidate] = float(match.group(1))
+    return scores
+
+
+def extract_ranking(text: str, candidates: Sequence[str]) -> Tuple[str, ...]:
+    """Candidates ordered by their stated score, best first; empty unless every candidate is scored"""
+    scores = extract_scores(text, candidates)
+    if not candidates or len(scores) < len(candidates):
+        return ()
+    return tuple(sorted(scores, key=lambda candidate: -scores[candidate]))
+
+
+def combined_ranking(messages: Sequence[str], candidates: Sequence[str]) -> Tuple[str, ...]:
+    """
+    Candidates ordered by their mean stated score over one round's messages, best first;
+    empty unless every candidate is scored by at least one of them
+    """
+    stated: Dict[str, List[float]] = {}
+    for message in messages:
+        for candidate, score in extract_scores(message, candidates).items():
+            stated.setdefault(candidate, []).append(score)
+    if not candidates or len(stated) < len(candidates):
+        return ()
+    means = {candidate: sum(scores) / len(scores) for candidate, scores in stated.items()}
+    return tuple(sorted(candidates, key=lambda candidate: -means[candidate]))
+
+
+class TerminationPolicy:
+    """
+    Deterministic termination check over the agents' messages, oldest first.
+    `round_size` is the number of agent turns in a round for chats that take turns;
+    concurrent chats pass None and call round_reason() after each full round.
+    """
+
+    def __init__(self, keyword: str, candidates: Sequence[str] = (), max_rounds: Optional[int] = None,
+                 patience: Optional[int] = None, round_size: Optional[int] = 1):
+        self.keyword = keyword
+        self.candidates = list(candidates)
+        if max_rounds is None:
+            max_rounds = int(os.getenv("TERMINATION_MAX_ROUNDS", "0"))
+        if patience is None:
+            patience = int(os.getenv("TERMINATION_PATIENCE", "2"))
+        self.max_rounds = max_rounds
+        self.patience = patience
+        self.round_size = round_size
+
+    def turn_reason(self, messages: List[str], earlier_turns: int = 0) -> Optional[str]:
+        """Why the chat should end right after the last message (verdict or turn limit), or None"""
+        if not messages:
+            return None
+        if has_verdict(messages[-1], self.keyword):
+            return VERDICT
+        if self.max_rounds > 0 and earlier_turns + len(messages) >= self.max_rounds:
+            return MAX_ROUNDS
+        return None
+
+    def round_reason(self, rounds: Sequence[Sequence[str]]) -> Optional[str]:
+        """CONVERGED when the last `patience` rounds agree on the combined ranking, else None"""
+        if self.patience < 2 or not self.candidates or len(rounds) < self.patience:
+            return None
+        rankings = [combined_ranking(messages, self.candidates) for messages in rounds[-self.patience:]]
+        if rankings[-1] and all(ranking == rankings[-1] for ranking in rankings):
+            return CONVERGED
+        return None
+
+    def reason(self, messages: List[str], earlier_turns: int = 0) -> Optional[str]:
+        """
+        Why the chat should end after the last message, or None to continue.
+        `earlier_turns` counts agent turns no longer in `messages` (e.g. summarized).
+        With a `round_size`, the latest messages are split into rounds for the
+        convergence check, so call this after the last agent of a round.
+        """
+        reason = self.turn_reason(messages, earlier_turns)
+        if reason is not None or not self.round_size:
+            return reason
+        size = self.round_size
+        rounds = [messages[end - size:end] for end in range(len(messages), size - 1, -size)]
+        return self.round_reason(rounds[::-1])
+
+
+class LocalTerminationStrategy(TerminationStrategy):
+    """Semantic Kernel termination strategy backed by a TerminationPolicy, no model call per turn"""
+
+    policy: Any = None
+    # Optional ScreeningHistory of the chat, whose summarized turns still count towards the round limit
+    chat_history: Any = None
+    reason: Optional[str] = None
+    # Finished rounds reported by a concurrent chat, as the messages of each
+    rounds: List[List[str]] = []
+
+    async def should_agent_terminate(self, agent, history) -> bool:
+        messages = [message.content for message in history
+                    if message.role == AuthorRole.ASSISTANT and message.content]
+        self.reason = self.policy.reason(messages, getattr(self.chat_history, "summarized", 0))
+        return self.reason is not None
+
+    def should_round_terminate(self, messages: List[str]) -> bool:
+        """Called by concurrent chats once every agent of a round has answered"""
+        self.rounds.append(list(messages))
+        self.reason = self.policy.round_reason(self.rounds)
+        return self.reason is not None
@@ -184,7 +184,7 @@ class UsageTracker:
             pass
         return 1
 
-def add_usage_monitoring():
+def add_usage_monitoring(num_resumes=None):
     """Add enhanced usage monitoring to your app"""
     tracker = UsageTracker()
     
@@ -195,7 +195,8 @@ def add_usage_monitoring():
         return False
     
     # Get number of resumes to process
-    num_resumes = len(st.session_state.get('resumes', []))
+    if num_resumes is None:
+        num_resumes = len(st.session_state.get('resumes', []))
     
     if num_resumes == 0:
         return True  # No cost if no resumes
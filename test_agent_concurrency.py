@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Test script for concurrent agent fan-out in the Gemini chat group (no API calls)
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+# Add src to path
+sys.path.append(os.path.dirname(__file__))
+
+from fake_clients import chat_client, chat_message, chat_response, stream_chunk
+from src.mas import GeminiAgent, GeminiChatGroup, Orchestrator, create_chat_completion
+from src.progress import DONE, FIRST_TOKEN, STARTED, ProgressReporter
+from src.termination import CONVERGED, TerminationPolicy
+
+
+class BlockingCompletions:
+    """Blocking stand-in for GeminiChatCompletions with a fixed latency per agent"""
+
+    def __init__(self, delays, replies):
+        self.delays = delays
+        self.replies = replies
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def create(self, model, messages, max_completion_tokens=None, **kwargs):
+        name = next(name for name in self.delays if f"You are {name}." in messages[0]["content"])
+        with self._lock:
+            self.calls.append(name)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delays[name])
+        with self._lock:
+            self.in_flight -= 1
+        return chat_response(self.replies.get(name, f"{name} analysis"))
+
+
+def _group(delays, replies=None, concurrency=None, policy=None):
+    completions = BlockingCompletions(delays, replies or {})
+    client = chat_client(completions)
+    agents = [GeminiAgent(f"agent_{i}", name, "Review resumes", client, "fake-model")
+              for i, name in enumerate(delays)]
+    return GeminiChatGroup(agents, "yes", concurrency=concurrency, policy=policy), completions
+
+
+async def _collect(group):
+    await group.add_chat_message(chat_message("Screen these resumes"))
+    return [response async for response in group.invoke()]
+
+
+def test_round_latency_is_slowest_agent():
+    delays = {"Skills": 0.3, "Experience": 0.1, "Culture": 0.2}
+    group, _completions = _group(delays, concurrency=0)
+    start = time.perf_counter()
+    responses = asyncio.run(_collect(group))
+    elapsed = time.perf_counter() - start
+    assert [response.name for response in responses] == ["Experience", "Culture", "Skills"]
+    assert elapsed < sum(delays.values())
+    print(f"✅ Concurrent round took {elapsed:.2f}s (sequential would be {sum(delays.values()):.2f}s)")
+
+
+def test_concurrency_limit():
+    delays = {name: 0.05 for name in ("A", "B", "C", "D", "E")}
+    group, completions = _group(delays, concurrency=2)
+    assert len(asyncio.run(_collect(group))) == 5
+    assert completions.max_in_flight == 2
+    print("✅ Concurrency limit is respected")
+
+
+def test_termination_cancels_queued_agents():
+    delays = {"Lead": 0.01, "Second": 0.2, "Third": 0.2}
+    group, completions = _group(delays, {"Lead": "Hire them: yes"}, concurrency=1)
+    responses = asyncio.run(_collect(group))
+    assert [response.name for response in responses] == ["Lead"]
+    assert group.is_complete
+    assert completions.calls == ["Lead"]
+    print("✅ Termination keyword stops the round")
+
+
+def _convergence_policy():
+    return TerminationPolicy("yes", ["jane.pdf", "john.pdf"], max_rounds=0, patience=2, round_size=None)
+
+
+AGREEING = {"Skills": "jane.pdf: 90, john.pdf: 40", "Experience": "jane.pdf: 85, john.pdf: 50",
+            "Culture": "john.pdf: 60 and jane.pdf: 80"}
+
+
+def test_agreement_waits_for_the_whole_round():
+    """Agents agreeing early in round one do not cut off the others; two agreeing rounds end the chat"""
+    delays = {"Skills": 0.01, "Experience": 0.02, "Culture": 0.1}
+    group, completions = _group(delays, AGREEING, concurrency=0, policy=_convergence_policy())
+
+    async def two_rounds():
+        first = await _collect(group)
+        complete_after_first = group.is_complete
+        return first, complete_after_first, await _collect(group)
+
+    first, complete_after_first, second = asyncio.run(two_rounds())
+    assert [response.name for response in first] == ["Skills", "Experience", "Culture"]
+    assert not complete_after_first
+    assert len(second) == 3 and group.is_complete and group.termination_reason == CONVERGED
+    assert len(completions.calls) == 6
+
+    streaming = _streaming_group(AGREEING, policy=_convergence_policy())
+
+    async def two_streamed_rounds():
+        first = await _collect_stream(streaming)
+        complete_after_first = streaming.is_complete
+        return first, complete_after_first, await _collect_stream(streaming)
+
+    first, complete_after_first, second = asyncio.run(two_streamed_rounds())
+    assert {name for name, _content in first} == set(AGREEING) and not complete_after_first
+    assert {name for name, _content in second} == set(AGREEING) and streaming.termination_reason == CONVERGED
+    print("✅ Convergence is judged on whole rounds, every agent's verdict is collected")
+
+
+def test_async_client_is_awaited():
+    """Native async clients run on the event loop instead of in a worker thread"""
+    class AsyncCompletions:
+        async def create(self, **kwargs):
+            await asyncio.sleep(0)
+            return threading.current_thread().name
+
+    client = chat_client(AsyncCompletions())
+    assert asyncio.run(create_chat_completion(client, model="fake-model", messages=[])) == threading.current_thread().name
+    print("✅ Async clients are awaited directly")
+
+
+def test_sync_orchestrator_inside_running_loop():
+    """get_response works from async code too, where asyncio.run alone would raise"""
+    async def create(**kwargs):
+        await asyncio.sleep(0)
+        return chat_response("roster")
+
+    orchestrator = Orchestrator.__new__(Orchestrator)
+    orchestrator.client = chat_client(create)
+    orchestrator._get_request = lambda: {"model": "fake-model", "messages": []}
+
+    async def call_from_loop():
+        return orchestrator.get_response()
+
+    assert orchestrator.get_response().choices[0].message.content == "roster"
+    assert asyncio.run(call_from_loop()).choices[0].message.content == "roster"
+    print("✅ The sync orchestrator call works inside a running event loop")
+
+
+class FakeStreamingCompletions:
+    """Async stand-in for a streaming OpenAI-style client"""
+
+    def __init__(self, replies):
+        self.replies = replies
+
+    async def create(self, model, messages, stream=False, **kwargs):
+        name = next(name for name in self.replies if f"You are {name}." in messages[0]["content"])
+
+        async def chunks():
+            for word in self.replies[name].split(" "):
+                await asyncio.sleep(0.01)
+                yield stream_chunk(word + " ")
+
+        return chunks()
+
+
+def _streaming_group(replies, policy=None):
+    client = chat_client(FakeStreamingCompletions(replies))
+    agents = [GeminiAgent(f"agent_{i}", name, "Review resumes", client, "fake-model")
+              for i, name in enumerate(replies)]
+    return GeminiChatGroup(agents, "yes", concurrency=0, policy=policy)
+
+
+async def _collect_stream(group):
+    await group.add_chat_message(chat_message("Screen these resumes"))
+    return [(chunk.name, chunk.content) async for chunk in group.invoke_stream()]
+
+
+def test_stream_yields_incremental_chunks():
+    group = _streaming_group({"Skills": "Strong Python background", "Culture": "Good team fit"})
+    group.reporter = ProgressReporter()
+    chunks = asyncio.run(_collect_stream(group))
+    text = {name: "".join(content for chunk_name, content in chunks if chunk_name == name) for name in ("Skills", "Culture")}
+    assert text == {"Skills": "Strong Python background ", "Culture": "Good team fit "}
+    assert len(chunks) == 6 and not group.is_complete
+
+    metrics = group.stream_metrics["Skills"]
+    assert metrics.chunks == 3 and metrics.time_to_first_token > 0 and metrics.tokens_per_second > 0
+    assert [event.kind for event in group.reporter.events if event.agent == "Skills"] == [STARTED, FIRST_TOKEN, DONE]
+    print(f"✅ Agents stream chunks ({metrics.summary()})")
+
+
+def test_stream_honours_termination():
+    group = _streaming_group({"Lead": "Recommend: yes", "Slow": " ".join(["word"] * 50)})
+    chunks = asyncio.run(_collect_stream(group))
+    assert group.is_complete
+    assert len([name for name, _content in chunks if name == "Slow"]) < 50
+    print("✅ Streaming stops once an agent answers with the termination keyword")
+
+
+if __name__ == "__main__":
+    print("Agent Concurrency Test")
+    print("=" * 50)
+
+    try:
+        test_round_latency_is_slowest_agent()
+        test_concurrency_limit()
+        test_termination_cancels_queued_agents()
+        test_agreement_waits_for_the_whole_round()
+        test_async_client_is_awaited()
+        test_sync_orchestrator_inside_running_loop()
+        test_stream_yields_incremental_chunks()
+        test_stream_honours_termination()
+        print("\n✅ All agent concurrency tests completed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
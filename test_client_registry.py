@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Test script for the process-wide AI client registry (no API calls)
+"""
+
+import asyncio
+import os
+import sys
+
+# Add src to path
+sys.path.append(os.path.dirname(__file__))
+
+from src import mas
+from src.mas import AsyncGeminiChatCompletions, ClientRegistry, GeminiModelCache, _to_gemini_request
+
+
+def test_sync_clients_are_shared():
+    registry = ClientRegistry()
+    first = registry.get_client("openai", None, "sk-one", object)
+    assert registry.get_client("openai", None, "sk-one", object) is first
+    assert registry.get_client("openai", None, "sk-two", object) is not first
+    assert registry.get_client("azure", "https://a.example", "sk-one", object) is not first
+
+    stats = registry.stats()
+    assert stats["clients"] == 3 and stats["hits"] == 1 and stats["misses"] == 3
+    assert stats["uses"]["openai:default"] == 3
+    assert all("sk-one" not in str(key) for key in registry._clients)
+    print("✅ One sync client per service, endpoint and key")
+
+
+def test_async_clients_are_pooled_per_event_loop():
+    registry = ClientRegistry()
+
+    async def get_twice():
+        first = registry.get_async_client("gemini", None, "key", object)
+        assert registry.get_async_client("gemini", None, "key", object) is first
+        return first
+
+    assert asyncio.run(get_twice()) is not asyncio.run(get_twice())
+    assert registry.stats()["hits"] == 2
+    print("✅ Async clients are reused within an event loop")
+
+
+def test_gemini_models_are_cached():
+    cache = GeminiModelCache(max_size=2)
+    first = cache.get("gemini-1.5-flash", {"max_output_tokens": 1000}, "You are a skills analyst.")
+    assert cache.get("gemini-1.5-flash", {"max_output_tokens": 1000}, "You are a skills analyst.") is first
+    assert cache.get("gemini-1.5-flash", {"max_output_tokens": 1000}, "You are a recruiter.") is not first
+    cache.get("gemini-1.5-pro", {}, None)
+    assert cache.stats() == {"models": 2, "hits": 1, "misses": 3}
+
+    system_instruction, prompt = _to_gemini_request([
+        {"role": "system", "content": "You are a recruiter."},
+        {"role": "user", "content": "Screen this resume"},
+    ])
+    assert (system_instruction, prompt) == ("You are a recruiter.", "Screen this resume")
+    print("✅ Gemini models are reused per model, config and system instruction")
+
+
+def test_gemini_async_falls_back_without_genai_internals():
+    """Without genai's private client manager the models keep genai's own async client"""
+    original = mas.genai_client._client_manager
+    del mas.genai_client._client_manager
+    try:
+        models = AsyncGeminiChatCompletions()._get_models()
+        assert models.async_client is None
+        assert models.get("gemini-1.5-flash", {}, None) is not None
+    finally:
+        mas.genai_client._client_manager = original
+    print("✅ Gemini async path falls back to the public API")
+
+
+if __name__ == "__main__":
+    print("Client Registry Test")
+    print("=" * 50)
+
+    try:
+        test_sync_clients_are_shared()
+        test_async_clients_are_pooled_per_event_loop()
+        test_gemini_models_are_cached()
+        test_gemini_async_falls_back_without_genai_internals()
+        print("\n✅ All client registry tests completed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
@@ -206,7 +206,7 @@ async def test_end_to_end():
         
         # Step 2: Create orchestrator and generate agents
         orchestrator = Orchestrator(screening_context, num_agents=2)
-        dynamic_agents = orchestrator.run()
+        dynamic_agents = await orchestrator.run_async()
         print(f"🤖 Generated {len(dynamic_agents)} dynamic agents")
         
         # Step 3: Create multi-agent system
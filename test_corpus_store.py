@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Test script for the memory-mapped resume corpus store
+"""
+
+import gc
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+
+# Add src to path
+sys.path.append(os.path.dirname(__file__))
+
+from src.corpus_store import CorpusStore
+
+
+def _write_from_another_process(root, text):
+    CorpusStore(root).put(text)
+
+
+def test_append_and_read():
+    """Documents round-trip through the segments and are stored once"""
+    with tempfile.TemporaryDirectory() as root:
+        store = CorpusStore(root, segment_max_bytes=32)
+        texts = ["Jane Smith — Data Scientist", "John Doe, Python developer", "Sam Lee, Designer"]
+        ids = [store.put(text) for text in texts]
+        assert store.put(texts[0]) == ids[0]
+        assert len(store) == 3
+        assert [store.get(doc_id) for doc_id in ids] == texts
+
+        # Small segments roll over into new files
+        segments = [name for name in os.listdir(root) if name.startswith("segment-")]
+        assert len(segments) > 1
+        store.close()
+    print("✅ Corpus store round-trips documents across segments")
+
+
+def test_shared_between_processes():
+    """A document appended by another process is readable without reloading"""
+    with tempfile.TemporaryDirectory() as root:
+        store = CorpusStore(root)
+        store.put("first resume")
+        process = multiprocessing.Process(target=_write_from_another_process, args=(root, "second resume"))
+        process.start()
+        process.join()
+        assert store.get(CorpusStore.doc_id_for("second resume")) == "second resume"
+        store.close()
+    print("✅ Corpus store is shared between processes")
+
+
+def test_stored_resume_behaves_like_dict():
+    with tempfile.TemporaryDirectory() as root:
+        store = CorpusStore(root)
+        resume = store.add_resume("jane.txt", "Python, SQL, AWS")
+        assert resume["filename"] == "jane.txt"
+        assert resume["content"] == "Python, SQL, AWS"
+        assert dict(resume)["chars"] == 16
+        assert dict(resume)["content"] == "Python, SQL, AWS"
+        assert json.loads(json.dumps(resume))["content"] == "Python, SQL, AWS"
+        assert isinstance(resume, dict) and resume == {**resume}
+        store.close()
+    print("✅ Stored resumes behave like resume dicts")
+
+
+def test_compaction_caps_the_store():
+    """The oldest segments are dropped past the size budget; the active segment always stays"""
+    with tempfile.TemporaryDirectory() as root:
+        store = CorpusStore(root, segment_max_bytes=20, max_bytes=45)
+        texts = [f"resume number {i:05d}" for i in range(6)]
+        ids = [store.put(text) for text in texts]
+        assert store.evicted_segments > 0
+        assert ids[0] not in store and ids[-1] in store
+        assert store.get(ids[-1]) == texts[-1]
+        segment_bytes = sum(os.path.getsize(os.path.join(root, name))
+                            for name in os.listdir(root) if name.startswith("segment-"))
+        assert segment_bytes <= 45
+
+        # Another instance reloads the rewritten index
+        reopened = CorpusStore(root, max_bytes=45)
+        assert ids[0] not in reopened and reopened.get(ids[-1]) == texts[-1]
+        try:
+            store.get(ids[0])
+        except KeyError:
+            pass
+        else:
+            raise AssertionError("dropped document still readable")
+
+        # Expired segments are dropped on open
+        assert CorpusStore(root, max_bytes=0, ttl_seconds=-1).evicted_segments == 0
+        for name in os.listdir(root):
+            os.utime(os.path.join(root, name), (0, 0))
+        expired = CorpusStore(root, max_bytes=0, ttl_seconds=60)
+        assert len(expired) == 1
+        store.close()
+        reopened.close()
+        expired.close()
+    print("✅ Compaction keeps the corpus within its size and TTL budget")
+
+
+def test_compaction_keeps_live_handles():
+    """A session's resume stays readable through rollovers; once released its segment can go"""
+    with tempfile.TemporaryDirectory() as root:
+        store = CorpusStore(root, segment_max_bytes=20, max_bytes=45)
+        resume = store.add_resume("first.txt", "resume number 00000")
+        ids = [store.put(f"resume number {i:05d}") for i in range(1, 6)]
+        assert store.evicted_segments > 0
+        assert resume["content"] == "resume number 00000" and resume.available
+        assert ids[0] not in store and ids[-1] in store
+
+        # Another process does not know about the handle and may drop the text
+        doc_id = resume.doc_id
+        for name in os.listdir(root):
+            os.utime(os.path.join(root, name), (0, 0))
+        other = CorpusStore(root, max_bytes=0, ttl_seconds=60)
+        assert doc_id not in other
+        assert not resume.available
+        other.close()
+
+        del resume
+        gc.collect()
+        assert not store._pinned_segments()
+        store.close()
+    print("✅ Compaction keeps segments that live handles point to")
+
+
+if __name__ == "__main__":
+    print("Corpus Store Test")
+    print("=" * 50)
+
+    try:
+        test_append_and_read()
+        test_shared_between_processes()
+        test_stored_resume_behaves_like_dict()
+        test_compaction_caps_the_store()
+        test_compaction_keeps_live_handles()
+        print("\n✅ All corpus store tests completed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Test script for the resume text extraction engine
+"""
+
+import io
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+import docx
+
+# Add src to path
+sys.path.append(os.path.dirname(__file__))
+
+from src.extraction import (
+    DOCX_TYPE,
+    PDF_TYPE,
+    TXT_TYPE,
+    ExtractionEngine,
+    ExtractionJob,
+    ExtractionStats,
+    PageText,
+    guess_content_type,
+    join_pages,
+)
+from src import extraction
+from src.extraction_cache import ExtractionCache
+
+
+def _docx_bytes(*paragraphs):
+    document = docx.Document()
+    for paragraph in paragraphs:
+        document.add_paragraph(paragraph)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def _sample_jobs():
+    return [
+        ExtractionJob("jane.txt", TXT_TYPE, b"Jane Smith\nPython, SQL, AWS", 0),
+        ExtractionJob("john.docx", DOCX_TYPE, _docx_bytes("John Doe", "6 years of experience"), 1),
+        ExtractionJob("broken.pdf", PDF_TYPE, b"not a pdf", 2),
+        ExtractionJob("notes.bin", "application/octet-stream", b"\x00\x01", 3),
+    ]
+
+
+def test_parallel_extraction():
+    """Files are parsed on the pool and failures stay isolated per file"""
+    engine = ExtractionEngine(max_workers=2, timeout=30)
+    stats = ExtractionStats()
+    try:
+        results = engine.extract(_sample_jobs(), stats=stats)
+    finally:
+        engine.shutdown()
+
+    assert [result.filename for result in results] == ["jane.txt", "john.docx", "broken.pdf", "notes.bin"]
+    assert results[0].ok and "Python" in results[0].text
+    assert results[1].ok and "6 years of experience" in results[1].text
+    assert not results[2].ok and results[2].error
+    assert not results[3].ok and "Unsupported" in results[3].error
+
+    assert stats.files == 4
+    assert stats.failed == 2
+    assert stats.files_per_second > 0
+    print(f"✅ Parallel extraction: {stats.summary()}")
+
+
+def _hanging_extract_document(content_type, data, max_pages=None, max_chars=None):
+    """Stand-in parser that never finishes on files named "hang" """
+    if data == b"hang":
+        time.sleep(60)
+    return extraction.ExtractedDocument(str(data, "utf-8"), [], False, 0.0)
+
+
+def test_timeout_terminates_stuck_worker():
+    """Hung files are cut off and their workers killed; files queued behind them are not timed out"""
+    if multiprocessing.get_start_method() != "fork":
+        print("⏭️ Skipped: needs fork to hand the slow parser to the workers")
+        return
+    original = extraction.extract_document
+    extraction.extract_document = _hanging_extract_document
+    engine = ExtractionEngine(max_workers=2, timeout=1)
+    jobs = [ExtractionJob(f"hang{i}.txt", TXT_TYPE, b"hang", i) for i in range(2)] + \
+        [ExtractionJob(f"ok{i}.txt", TXT_TYPE, f"resume {i}".encode(), i + 2) for i in range(4)]
+    stats = ExtractionStats()
+    try:
+        started = time.perf_counter()
+        results = engine.extract(jobs, stats=stats)
+        elapsed = time.perf_counter() - started
+    finally:
+        extraction.extract_document = original
+        engine.shutdown()
+
+    assert [result.timed_out for result in results] == [True, True, False, False, False, False]
+    assert all(result.ok for result in results[2:])
+    assert stats.timed_out == 2 and stats.files == 6
+    assert elapsed < 10
+    time.sleep(0.2)
+    assert not multiprocessing.active_children()
+    print("✅ Timed out workers are terminated instead of leaked")
+
+
+def test_single_upload_is_timed_out():
+    """One file on a one-worker engine still goes to the pool and is cut off when it hangs"""
+    if multiprocessing.get_start_method() != "fork":
+        print("⏭️ Skipped: needs fork to hand the slow parser to the workers")
+        return
+    original = extraction.extract_document
+    extraction.extract_document = _hanging_extract_document
+    engine = ExtractionEngine(max_workers=1, timeout=1)
+    try:
+        results = engine.extract([ExtractionJob("hang.txt", TXT_TYPE, b"hang")])
+    finally:
+        extraction.extract_document = original
+        engine.shutdown()
+    assert results[0].timed_out
+    time.sleep(0.2)
+    assert not multiprocessing.active_children()
+    print("✅ A single hung upload is timed out instead of blocking the app")
+
+
+def test_inline_extraction_matches_parallel():
+    """Without a timeout files are parsed in-process with the same results"""
+    engine = ExtractionEngine(max_workers=1, timeout=0)
+    results = engine.extract(_sample_jobs())
+    assert [result.ok for result in results] == [True, True, False, False]
+    print("✅ Inline extraction matches parallel results")
+
+
+def test_page_budget():
+    """Only one page past the budget is decoded and the result is flagged as truncated"""
+    decoded = []
+
+    def pages():
+        for index in range(100):
+            decoded.append(index)
+            yield PageText(index, f"page {index}", 0.001)
+
+    document = join_pages(pages(), max_pages=3)
+    assert document.text == "page 0\npage 1\npage 2\n"
+    assert document.truncated and len(document.page_timings) == 3
+    assert len(decoded) == 4
+
+    document = join_pages(pages(), max_chars=10)
+    assert document.text == "page 0\npag"
+    assert document.truncated
+
+    document = join_pages(PageText(i, "x", 0.0) for i in range(3))
+    assert document.text == "x\nx\nx\n" and not document.truncated
+    print("✅ Page and character budgets cut documents early")
+
+
+def test_docx_paragraph_budget():
+    """The paragraph loop in DOCX extraction honours the same budget"""
+    data = _docx_bytes(*[f"Paragraph {i}" for i in range(50)])
+    engine = ExtractionEngine(max_workers=1, max_pages=5)
+    result = engine.extract([ExtractionJob("long.docx", DOCX_TYPE, data)])[0]
+    engine.shutdown()
+    assert result.ok and result.truncated
+    assert result.text.count("Paragraph") == 5
+    assert len(result.page_timings) == 5
+    print("✅ DOCX paragraphs honour the extraction budget")
+
+
+def test_extraction_cache_hits():
+    """A second pass over the same bytes is served from the cache"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = ExtractionCache(cache_dir, max_bytes=1024 * 1024)
+        engine = ExtractionEngine(max_workers=1, cache=cache)
+
+        # Same job bytes both times: DOCX archives embed a timestamp
+        jobs = _sample_jobs()
+        first = engine.extract(jobs)
+        assert not any(result.cached for result in first)
+        second = engine.extract(jobs)
+        engine.shutdown()
+        assert [result.cached for result in second] == [True, True, False, False]
+        assert second[1].text == first[1].text
+        assert cache.stats()["hits"] == 2
+
+        # A fresh instance picks up the entries already on disk
+        assert len(ExtractionCache(cache_dir)) == 2
+    print("✅ Extraction cache serves repeated uploads")
+
+
+def test_extraction_cache_eviction():
+    """The least recently used entry is evicted once the size budget is exceeded"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = ExtractionCache(cache_dir, max_bytes=20)
+        keys = [cache.key_for(data) for data in (b"a", b"b", b"c")]
+        cache.put(keys[0], "x" * 8)
+        cache.put(keys[1], "y" * 8)
+        assert cache.get(keys[0]) == "x" * 8
+        cache.put(keys[2], "z" * 8)
+
+        assert keys[0] in cache and keys[2] in cache
+        assert keys[1] not in cache
+        assert cache.evictions == 1
+    print("✅ Extraction cache evicts least recently used entries")
+
+
+def test_extraction_cache_warm():
+    """Warming from a directory fills the cache once"""
+    with tempfile.TemporaryDirectory() as cache_dir, tempfile.TemporaryDirectory() as resume_dir:
+        for name, content in (("a.txt", "Python developer"), ("b.txt", "Data scientist")):
+            with open(os.path.join(resume_dir, name), "w") as f:
+                f.write(content)
+        cache = ExtractionCache(cache_dir)
+        engine = ExtractionEngine(max_workers=1)
+        assert cache.warm(resume_dir, engine) == 2
+        assert cache.warm(resume_dir, engine) == 0
+        engine.shutdown()
+
+        # Without an engine, warm starts its own pool and shuts it down again
+        cache.clear()
+        assert cache.warm(resume_dir) == 2
+        assert not multiprocessing.active_children()
+    print("✅ Extraction cache warmed from a directory")
+
+
+def test_content_type_guessing():
+    assert guess_content_type("resume.PDF") == PDF_TYPE
+    assert guess_content_type("resume.docx") == DOCX_TYPE
+    assert guess_content_type("resume.txt") == TXT_TYPE
+    print("✅ Content types guessed from extensions")
+
+
+if __name__ == "__main__":
+    print("Resume Extraction Engine Test")
+    print("=" * 50)
+
+    try:
+        test_parallel_extraction()
+        test_timeout_terminates_stuck_worker()
+        test_single_upload_is_timed_out()
+        test_inline_extraction_matches_parallel()
+        test_page_budget()
+        test_docx_paragraph_budget()
+        test_extraction_cache_hits()
+        test_extraction_cache_eviction()
+        test_extraction_cache_warm()
+        test_content_type_guessing()
+        print("\n✅ All extraction tests completed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
@@ -46,7 +46,7 @@ async def test_gemini_workflow():
         orchestrator = Orchestrator(screening_context, num_agents=2)
         
         print("🤖 Generating dynamic agents...")
-        dynamic_agents = orchestrator.run()
+        dynamic_agents = await orchestrator.run_async()
         
         print(f"✅ Created {len(dynamic_agents)} agents:")
         for agent in dynamic_agents:
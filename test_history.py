@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test script for the bounded agent group chat history (no API calls)
+"""
+
+import asyncio
+import os
+import sys
+
+# Add src to path
+sys.path.append(os.path.dirname(__file__))
+
+from semantic_kernel.agents import AgentGroupChat
+from semantic_kernel.contents.chat_message_content import ChatMessageContent
+from semantic_kernel.contents.function_call_content import FunctionCallContent
+from semantic_kernel.contents.function_result_content import FunctionResultContent
+from semantic_kernel.contents.utils.author_role import AuthorRole
+
+from src.history import SUMMARY_NAME, ScreeningHistory, dedupe_inputs
+from src.mas import GeminiChatGroup
+
+CANDIDATES = ["jane_doe.pdf", "john_smith.docx"]
+TASK = "Job Profile: Senior Python developer. Resumes: jane_doe.pdf, john_smith.docx. " * 20
+
+
+def _user(content):
+    return ChatMessageContent(role=AuthorRole.USER, content=content)
+
+
+def _said(name, content):
+    return ChatMessageContent(role=AuthorRole.ASSISTANT, name=name, content=content)
+
+
+def test_repeated_inputs_are_kept_once():
+    messages = [_user("task"), _said("Skills", "first"), _user("task")]
+    assert [message.content for message in dedupe_inputs(messages)] == ["first", "task"]
+    print("✅ A repeated input is kept once, at its latest position")
+
+
+def test_prompt_size_stays_flat():
+    group = AgentGroupChat(chat_history=ScreeningHistory(candidates=CANDIDATES, target_count=4, max_notes=4))
+    sizes = []
+
+    async def run():
+        for round_number in range(1, 11):
+            await group.add_chat_message(_user(TASK))
+            await group.reduce_history()
+            sizes.append(sum(len(message.content) for message in group.history.messages))
+            for name in ("Skills", "Experience"):
+                group.history.messages.append(_said(
+                    name, f"Round {round_number}: jane_doe.pdf {70 + round_number}, john_smith.docx 60. " + "Detail. " * 30
+                ))
+
+    asyncio.run(run())
+    history = group.history
+    assert sum(message.content == TASK for message in history.messages) == 1
+    assert max(sizes[3:]) - min(sizes[3:]) < len(TASK) // 2, sizes
+    summary = next(message for message in history.messages if message.name == SUMMARY_NAME)
+    assert "jane_doe.pdf 78" in summary.content and len(history.notes) == 4
+    print(f"✅ Prompt size stays flat over 10 rounds ({sizes[2]} -> {sizes[-1]} characters)")
+
+
+def test_tool_results_stay_with_their_call():
+    call = ChatMessageContent(role=AuthorRole.ASSISTANT, items=[FunctionCallContent(id="1", name="ResumeScreening-score")])
+    result = ChatMessageContent(role=AuthorRole.TOOL, items=[FunctionResultContent(id="1", result="85")])
+    history = ScreeningHistory(target_count=2)
+    history.messages = [_user("task"), _said("Skills", "a"), call, result, _said("Skills", "b")]
+    assert asyncio.run(history.reduce()) is history
+    roles = [message.role for message in history.messages if message.name != SUMMARY_NAME]
+    assert roles == [AuthorRole.USER, AuthorRole.ASSISTANT, AuthorRole.TOOL, AuthorRole.ASSISTANT]
+    assert asyncio.run(history.reduce()) is None
+    print("✅ Windowing never separates a tool result from its call")
+
+
+def test_gemini_history_is_bounded():
+    group = GeminiChatGroup([], "yes")
+    group.history_window = 3
+
+    async def run():
+        for round_number in range(5):
+            await group.add_chat_message(_user(TASK))
+            await group.add_chat_message(_user(f"Follow-up {round_number}"))
+
+    asyncio.run(run())
+    assert [message.content for message in group.history] == ["Follow-up 3", TASK, "Follow-up 4"]
+    print("✅ Gemini chat history keeps a window without repeated inputs")
+
+
+if __name__ == "__main__":
+    print("Chat History Test")
+    print("=" * 50)
+
+    try:
+        test_repeated_inputs_are_kept_once()
+        test_prompt_size_stays_flat()
+        test_tool_results_stay_with_their_call()
+        test_gemini_history_is_bounded()
+        print("\n✅ All chat history tests completed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared Semantic Kernel kernels, services and plugins (no API calls)
+"""
+
+import asyncio
+import os
+import sys
+
+# Add src to path
+sys.path.append(os.path.dirname(__file__))
+
+from src.mas import AGENT_SERVICE_ID, KernelFactory, MultiAgent, get_kernel_factory
+
+OPENAI_ENV = {
+    "AI_SERVICE": "openai",
+    "OPENAI_API_KEY": os.getenv("OPENAI_API_KEY") or "sk-test",
+    "TEMPLATE_DIR_PROMPTS": "src/prompts",
+    "TEMPLATE_SELECTION": "selection.jinja",
+    "TEMPLATE_TERMINATION": "termination.jinja",
+    # Keep the test from creating and filling the real response cache in .cache/
+    "RESPONSE_CACHE": "false",
+}
+
+ROSTER = [{"name": f"Expert {i}", "role": "Reviewer", "system_prompt": "Review resumes"} for i in range(4)]
+
+
+def test_kernels_are_shared_per_event_loop():
+    factory = KernelFactory()
+
+    async def get_twice():
+        first = factory.get_kernel(("openai", "agents"), object)
+        assert factory.get_kernel(("openai", "agents"), object) is first
+        assert factory.get_kernel(("openai", "selection"), object) is not first
+        return first
+
+    assert asyncio.run(get_twice()) is not asyncio.run(get_twice())
+    assert factory.get_plugins() is factory.get_plugins()
+    stats = factory.stats()
+    assert stats["hits"] == 2 and stats["misses"] == 4 and stats["plugin_sets"] == 1
+    print("✅ Kernels are reused within an event loop, plugins across loops")
+
+
+def test_agents_share_kernel_service_and_plugins():
+    async def build_twice():
+        first = MultiAgent().create_agents(ROSTER)
+        second = MultiAgent().create_agents(ROSTER)
+        return first, second
+
+    saved = {name: os.environ.get(name) for name in OPENAI_ENV}
+    os.environ.update(OPENAI_ENV)
+    try:
+        first, second = asyncio.run(build_twice())
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+    kernel = first[0].kernel
+    assert all(agent.kernel is kernel for agent in first + second)
+    assert list(kernel.services) == [AGENT_SERVICE_ID]
+    assert "ResumeScreening" in kernel.plugins
+    assert kernel.plugins["ResumeScreening"] is get_kernel_factory().get_plugins(None)[-1]
+
+    # Settings stay per agent on top of the shared service
+    settings = [agent.arguments.execution_settings[AGENT_SERVICE_ID] for agent in first]
+    assert len({id(setting) for setting in settings}) == len(first)
+    assert all(setting.function_choice_behavior is not None for setting in settings)
+    print("✅ All agents of a run share one kernel, chat service and plugin set")
+
+
+if __name__ == "__main__":
+    print("Kernel Factory Test")
+    print("=" * 50)
+
+    try:
+        test_kernels_are_shared_per_event_loop()
+        test_agents_share_kernel_service_and_plugins()
+        print("\n✅ All kernel factory tests completed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
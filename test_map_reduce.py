@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Test script for map/reduce resume screening (no API calls)
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+# Add src to path
+sys.path.append(os.path.dirname(__file__))
+
+from fake_clients import FakeCompletions, chat_client, fake_agent
+from src.map_reduce import AgentVerdict, MapReduceScreening, reduce_verdicts
+
+RESUMES = [
+    {"filename": "jane.txt", "content": "Senior Python developer, Django, AWS. " * 100},
+    {"filename": "john.txt", "content": "Junior Java developer"},
+]
+
+
+class ScoringCompletions(FakeCompletions):
+    """Scores resumes mentioning Python higher"""
+
+    delay = 0.01
+
+    def reply(self, messages):
+        agent = "Skills" if "You are Skills." in messages[0]["content"] else "Culture"
+        score = 90 if "Python" in messages[1]["content"] else 40
+        if agent == "Culture":
+            return "```json\n" + json.dumps({"score": score - 10, "summary": "Fits the team.",
+                                             "strengths": ["Collaboration"], "concerns": []}) + "\n```"
+        return json.dumps({"score": score, "summary": "Relevant skills.",
+                           "strengths": ["Python", "Collaboration"], "concerns": ["No Go"]})
+
+
+def _agent(name):
+    return fake_agent(name, f"Review {name.lower()}")
+
+
+def test_map_reduce_ranking():
+    completions = ScoringCompletions()
+    client = chat_client(completions)
+    screening = MapReduceScreening([_agent("Skills"), _agent("Culture")], client, "fake-model",
+                                   concurrency=2, max_chars=0)
+    progress = []
+    results = asyncio.run(screening.run("Python developer", RESUMES,
+                                        on_verdict=lambda verdict, done, total: progress.append((done, total))))
+
+    assert [result["filename"] for result in results] == ["jane.txt", "john.txt"]
+    assert results[0]["score"] == 85 and results[0]["agent_scores"] == {"Skills": 90, "Culture": 80}
+    assert results[0]["strengths"] == ["Python", "Collaboration"]
+    assert progress[-1] == (4, 4)
+
+    # Every resume is sent whole, on its own
+    assert len(completions.requests) == 4
+    assert all(RESUMES[0]["content"] in messages[1]["content"] or RESUMES[1]["content"] in messages[1]["content"]
+               for messages in completions.requests)
+    print("✅ Map/reduce ranks candidates from per-agent verdicts")
+
+
+def test_unparseable_verdicts_are_reported():
+    verdict = AgentVerdict.from_text("Skills", "jane.txt", "I think this candidate is great")
+    assert not verdict.ok
+    scored = AgentVerdict.from_text("Skills", "john.txt", json.dumps({"score": 10, "summary": "Weak match."}))
+    results = reduce_verdicts([verdict, scored], RESUMES)
+
+    # The unscored resume is not ranked below a genuinely weak one, it follows the ranking
+    assert [result["filename"] for result in results] == ["john.txt", "jane.txt"]
+    assert results[1]["score"] is None and results[1]["errors"]
+    print("✅ Unparseable verdicts are reported instead of scored")
+
+
+if __name__ == "__main__":
+    print("Map/Reduce Screening Test")
+    print("=" * 50)
+
+    try:
+        test_map_reduce_ranking()
+        test_unparseable_verdicts_are_reported()
+        print("\n✅ All map/reduce screening tests completed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Test script for event-driven screening progress reporting
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+# Add src to path
+sys.path.append(os.path.dirname(__file__))
+
+from src.mas import track_stream
+from src.progress import DONE, FIRST_TOKEN, STARTED, ProgressReporter, RunTimer
+from src.selection import RoundRobinSelectionStrategy
+
+
+def test_run_timer_nests_phases():
+    timer = RunTimer()
+    with timer.measure("setup"):
+        time.sleep(0.02)
+    with timer.measure("model"):
+        time.sleep(0.02)
+        with timer.measure("ui"):
+            time.sleep(0.05)
+    breakdown = timer.breakdown()
+    assert list(breakdown) == ["setup", "model", "ui"]
+    assert breakdown["ui"] >= 0.05 and breakdown["model"] < 0.05
+    assert "total" in timer.summary()
+    print(f"✅ Run timer splits wall time: {timer.summary()}")
+
+
+def test_reporter_forwards_events():
+    timer = RunTimer()
+    seen = []
+    reporter = ProgressReporter(lambda event: seen.append((event.agent, event.kind)), timer)
+    reporter.emit("Skills", STARTED)
+    reporter.emit("Culture", STARTED)
+    reporter.emit("Skills", DONE, "first token 0.40s")
+    assert seen == [("Skills", STARTED), ("Culture", STARTED), ("Skills", DONE)]
+    assert reporter.counts() == {STARTED: 1, DONE: 1}
+    assert "ui" in timer.breakdown()
+    print("✅ Reporter forwards agent lifecycle events")
+
+
+class _Chunk:
+    def __init__(self, name, content):
+        self.name = name
+        self.content = content
+
+
+class _Group:
+    """Stand-in for AgentGroupChat: selects each agent, waits for the model, then streams its reply"""
+
+    def __init__(self, names):
+        self.agents = [type("Agent", (), {"name": name})() for name in names]
+        self.selection_strategy = RoundRobinSelectionStrategy()
+        self.history = []
+
+    async def invoke_stream(self):
+        for _ in self.agents:
+            agent = await self.selection_strategy.next(self.agents, self.history)
+            await asyncio.sleep(0.05)  # request in flight
+            for word in ("Strong ", "candidate"):
+                yield _Chunk(agent.name, word)
+            self.history.append(type("Message", (), {"role": "assistant", "name": agent.name})())
+
+
+def test_track_stream_starts_clock_before_request():
+    """STARTED is emitted when the agent is selected, so time to first token covers the request"""
+    group = _Group(["Skills", "Culture"])
+    seen = []
+    reporter = ProgressReporter(lambda event: seen.append((event.agent, event.kind, event.at)))
+    metrics = {}
+
+    async def consume():
+        return [chunk async for chunk in track_stream(group.invoke_stream(), metrics, reporter, group)]
+
+    assert len(asyncio.run(consume())) == 4
+    assert [(agent, kind) for agent, kind, _at in seen] == [
+        ("Skills", STARTED), ("Skills", FIRST_TOKEN), ("Skills", DONE),
+        ("Culture", STARTED), ("Culture", FIRST_TOKEN), ("Culture", DONE),
+    ]
+    assert seen[1][2] - seen[0][2] >= 0.05
+    assert all(metrics[name].time_to_first_token >= 0.05 for name in ("Skills", "Culture"))
+    assert group.selection_strategy.on_select is None
+    print("✅ Stream tracking starts each agent's clock before its request")
+
+
+if __name__ == "__main__":
+    print("Progress Reporting Test")
+    print("=" * 50)
+
+    try:
+        test_run_timer_nests_phases()
+        test_reporter_forwards_events()
+        test_track_stream_starts_clock_before_request()
+        print("\n✅ All progress reporting tests completed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Test script for the prompt-level response cache (no API calls)
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+# Add src to path
+sys.path.append(os.path.dirname(__file__))
+
+from fake_clients import chat_client, chat_response, stream_chunk
+from src.mas import _blocked_response, _stream_text
+from src.response_cache import CachedClient, ResponseCache
+
+REQUEST = {
+    "model": "gpt-4o-mini",
+    "messages": [{"role": "user", "content": "Screen this resume"}],
+    "max_completion_tokens": 1000,
+}
+
+
+def test_cache_key_is_canonical():
+    reordered = {"max_completion_tokens": 1000, "messages": REQUEST["messages"], "model": "gpt-4o-mini", "stream": True}
+    assert ResponseCache.key_for(REQUEST) == ResponseCache.key_for(reordered)
+    assert ResponseCache.key_for(REQUEST) != ResponseCache.key_for({**REQUEST, "model": "gpt-4o"})
+    print("✅ Cache keys ignore parameter order and transport options")
+
+
+def test_sync_client_is_served_from_cache():
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = ResponseCache(os.path.join(cache_dir, "responses.sqlite3"), max_bytes=1024 * 1024, ttl_seconds=3600)
+        calls = []
+
+        def create(**kwargs):
+            calls.append(kwargs)
+            time.sleep(0.02)
+            return chat_response("Strong match")
+
+        client = CachedClient(chat_client(create), cache)
+        assert client.chat.completions.create(**REQUEST).choices[0].message.content == "Strong match"
+        cached = client.chat.completions.create(**REQUEST)
+        assert cached.choices[0].message.content == "Strong match" and len(calls) == 1
+        assert '"Strong match"' in cached.model_dump_json()
+
+        stats = cache.stats()
+        assert stats["hits"] == 1 and stats["misses"] == 1 and stats["saved_seconds"] > 0
+    print("✅ Repeated requests are answered from the cache")
+
+
+def test_endpoints_do_not_share_entries():
+    """The same deployment name on two resources is two different models"""
+    assert ResponseCache.key_for(REQUEST, "AzureOpenAI:https://a.openai.azure.com/openai/") != \
+        ResponseCache.key_for(REQUEST, "AzureOpenAI:https://b.openai.azure.com/openai/")
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = ResponseCache(os.path.join(cache_dir, "responses.sqlite3"), max_bytes=1024 * 1024, ttl_seconds=3600)
+        clients = []
+        for resource in ("a", "b"):
+            client = chat_client(lambda resource=resource, **kwargs: chat_response(f"From {resource}"))
+            client.base_url = f"https://{resource}.openai.azure.com/openai/"
+            clients.append(CachedClient(client, cache))
+
+        replies = [client.chat.completions.create(**REQUEST).choices[0].message.content for client in clients * 2]
+        assert replies == ["From a", "From b", "From a", "From b"]
+        assert cache.stats()["hits"] == 2 and len(cache) == 2
+    print("✅ Cache entries are kept apart per provider endpoint")
+
+
+def test_async_stream_is_recorded_and_replayed():
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = ResponseCache(os.path.join(cache_dir, "responses.sqlite3"), max_bytes=1024 * 1024, ttl_seconds=3600)
+        calls = []
+
+        async def create(stream=False, **kwargs):
+            calls.append(stream)
+
+            async def chunks():
+                for word, finish_reason in (("Strong ", None), ("match", "stop")):
+                    yield stream_chunk(word, finish_reason)
+
+            return chunks()
+
+        client = CachedClient(chat_client(create), cache)
+
+        async def collect():
+            stream = await client.chat.completions.create(stream=True, **REQUEST)
+            return [chunk.choices[0].delta.content async for chunk in stream]
+
+        assert asyncio.run(collect()) == ["Strong ", "match"]
+        assert asyncio.run(collect()) == ["Strong match"]
+        assert calls == [True]
+    print("✅ Streamed responses are recorded and replayed")
+
+
+def test_failed_replies_are_not_cached():
+    """Blocked, filtered or truncated replies go back to the model on the next request"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = ResponseCache(os.path.join(cache_dir, "responses.sqlite3"), max_bytes=1024 * 1024, ttl_seconds=3600)
+        replies = [_blocked_response(ValueError("Response was blocked"), "gemini-1.5-flash"),
+                   chat_response("Strong ma", finish_reason="length"), chat_response("Strong match")]
+        client = CachedClient(chat_client(lambda **kwargs: replies.pop(0)), cache)
+        assert "safety" in client.chat.completions.create(**REQUEST).choices[0].message.content
+        assert client.chat.completions.create(**REQUEST).choices[0].message.content == "Strong ma"
+        assert client.chat.completions.create(**REQUEST).choices[0].message.content == "Strong match"
+        assert len(cache) == 1 and cache.stats()["hits"] == 0
+
+        async def blocked_stream(stream=False, **kwargs):
+            return _stream_text("I apologize, but I cannot process this request.", "gemini-1.5-flash", "content_filter")
+
+        async def collect():
+            stream = await CachedClient(chat_client(blocked_stream), cache).chat.completions.create(
+                stream=True, **{**REQUEST, "model": "gemini-1.5-flash"})
+            return [chunk async for chunk in stream]
+
+        asyncio.run(collect())
+        assert len(cache) == 1
+    print("✅ Blocked and truncated replies are not cached")
+
+
+def test_ttl_and_size_limit():
+    with tempfile.TemporaryDirectory() as cache_dir:
+        path = os.path.join(cache_dir, "responses.sqlite3")
+        cache = ResponseCache(path, max_bytes=20, ttl_seconds=3600)
+        cache.put("a", "x" * 8)
+        cache.put("b", "y" * 8, ttl_seconds=0.01)
+        time.sleep(0.02)
+        assert cache.get("b") is None
+        cache.put("c", "z" * 8)
+        cache.get("a")
+        cache.put("d", "w" * 8)
+        assert cache.get("c") is None
+        assert cache.get("a") == "x" * 8 and cache.get("d") == "w" * 8
+        # Entries survive a restart
+        assert len(ResponseCache(path)) == 2
+    print("✅ Expired and least recently used responses are dropped")
+
+
+if __name__ == "__main__":
+    print("Response Cache Test")
+    print("=" * 50)
+
+    try:
+        test_cache_key_is_canonical()
+        test_sync_client_is_served_from_cache()
+        test_endpoints_do_not_share_entries()
+        test_async_stream_is_recorded_and_replayed()
+        test_failed_replies_are_not_cached()
+        test_ttl_and_size_limit()
+        print("\n✅ All response cache tests completed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
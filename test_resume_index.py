@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Test script for the BM25 resume pre-filter index
+"""
+
+import os
+import sys
+
+# Add src to path
+sys.path.append(os.path.dirname(__file__))
+
+from src.resume_index import ResumeIndex, prefilter_resumes, tokenize
+
+JOB_PROFILE = "Senior Python developer with Django, PostgreSQL and AWS experience"
+
+RESUMES = [
+    {"filename": "chef.txt", "content": "Head chef, French cuisine, kitchen management"},
+    {"filename": "python.txt", "content": "Python developer. Django, Flask, PostgreSQL, AWS, Docker"},
+    {"filename": "java.txt", "content": "Java developer. Spring, Oracle, AWS"},
+    {"filename": "designer.txt", "content": "Graphic designer, Figma, branding"},
+]
+
+
+def test_tokenize_keeps_tech_terms():
+    assert tokenize("C++, C# and Node.js.") == ["c++", "c#", "node.js"]
+    print("✅ Tokenizer keeps tech terms intact")
+
+
+def test_bm25_ranking():
+    index = ResumeIndex()
+    for resume in RESUMES:
+        index.add(resume["filename"], resume["content"])
+
+    top = [doc_id for doc_id, _score in index.top_k(JOB_PROFILE, 2)]
+    assert top == ["python.txt", "java.txt"]
+
+    index.remove("python.txt")
+    assert "python.txt" not in index
+    assert "django" not in index.postings
+    assert [doc_id for doc_id, _score in index.top_k(JOB_PROFILE, 1)] == ["java.txt"]
+    print("✅ BM25 ranks the closest resumes first")
+
+
+def test_prefilter_resumes():
+    index = ResumeIndex()
+    selected = prefilter_resumes(index, RESUMES, JOB_PROFILE, 3)
+    assert [resume["filename"] for resume in selected] == ["python.txt", "java.txt", "chef.txt"]
+    assert len(index) == len(RESUMES)
+
+    # Small pools are passed through untouched
+    assert prefilter_resumes(index, RESUMES, JOB_PROFILE, 10) == RESUMES
+    assert prefilter_resumes(index, RESUMES, JOB_PROFILE, 0) == RESUMES
+
+    # The index follows the pool when resumes are removed
+    prefilter_resumes(index, RESUMES[:3], JOB_PROFILE, 1)
+    assert "designer.txt" not in index
+    print("✅ Pre-filter keeps the top matching resumes")
+
+
+def test_sync_reindexes_changed_content():
+    """A resume re-uploaded under the same filename is scored on its new text"""
+    index = ResumeIndex()
+    index.sync(RESUMES)
+    assert "kubernetes" not in index.postings
+
+    updated = [RESUMES[0], dict(RESUMES[1], content="Kubernetes and Go platform engineer")] + RESUMES[2:]
+    index.sync(updated)
+    assert "kubernetes" in index.postings and "django" not in index.postings
+    assert len(index) == len(RESUMES)
+    print("✅ Sync reindexes resumes whose content changed")
+
+
+if __name__ == "__main__":
+    print("Resume Index Test")
+    print("=" * 50)
+
+    try:
+        test_tokenize_keeps_tech_terms()
+        test_bm25_ranking()
+        test_prefilter_resumes()
+        test_sync_reindexes_changed_content()
+        print("\n✅ All resume index tests completed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Test script for the deterministic scoring in ResumeScreeningPlugin
+"""
+
+import json
+import os
+import random
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Add src to path
+sys.path.append(os.path.dirname(__file__))
+
+from src.plugins.resume_screening import (
+    EXPERIENCE_PATTERNS,
+    CandidateScore,
+    ResumeFeatureMatcher,
+    ResumeScreeningPlugin,
+    rank_scores,
+)
+
+JOB_PROFILE = """
+Senior Python Developer
+- 5+ years of experience with Python and Django
+- SQL and AWS
+- Bachelor's degree in Computer Science
+"""
+
+RESUMES = [
+    {
+        "filename": "john.txt",
+        "content": "John Doe. 6 years of experience in Python, Django, PostgreSQL, SQL and AWS. "
+                   "Bachelor in Computer Science from State University.",
+    },
+    {
+        "filename": "jane.txt",
+        "content": "Jane Smith. Experience: 3 years working with Java and Docker. MBA.",
+    },
+    {
+        "filename": "sam.txt",
+        "content": "Sam Lee. Marketing graduate with Communication and Leadership skills.",
+    },
+]
+
+
+def test_precompiled_matcher():
+    """Precompiled patterns find skills, education and experience tokens"""
+    features = ResumeFeatureMatcher().match(
+        "Experience: 4 years. Python, python, JavaScript and Node.js. Bachelor, MIT Institute. "
+        "2+ years in Machine Learning"
+    )
+    assert features.skills == ["python", "javascript", "node.js", "machine learning"]
+    assert features.education == ["bachelor", "institute"]
+    assert features.experience == ["2", "4"]
+    print("✅ Precompiled matcher extracts all feature families")
+
+
+def test_overlapping_terms_are_all_found():
+    """Experience and education terms that share characters are each matched, as with separate findall passes"""
+    text = "4 years Institute of Technology. Experience: 6 years in Django, 6 years of experience working remotely"
+    features = ResumeFeatureMatcher().match(text)
+    assert "institute" in features.education
+    expected = [years for pattern in EXPERIENCE_PATTERNS for years in re.findall(pattern, text, re.IGNORECASE)]
+    assert features.experience == expected == ["6", "4", "6", "6"]
+    print("✅ Overlapping experience and education terms are all found")
+
+
+def test_analyze_resume_uses_matcher():
+    plugin = ResumeScreeningPlugin()
+    result = json.loads(plugin.analyze_resume(RESUMES[0]["content"], JOB_PROFILE, "John Doe"))
+    assert result["skill_score"] == 100.0
+    assert result["experience_score"] == 100.0
+    assert result["education_score"] == 90.0
+    assert result["overall_score"] == 98.0
+    print("✅ analyze_resume scores with the precompiled matcher")
+
+
+def test_job_requirements_memoized():
+    """The job profile is parsed once and reused for every candidate"""
+    plugin = ResumeScreeningPlugin()
+    calls = []
+    match = plugin._matcher.match
+
+    def counting_match(text):
+        calls.append(text)
+        return match(text)
+
+    plugin._matcher.match = counting_match
+    results = plugin.analyze_resumes(RESUMES, JOB_PROFILE)
+    plugin.analyze_resume(RESUMES[1]["content"], "  " + JOB_PROFILE.upper(), "Jane")
+
+    assert [result.candidate for result in results] == ["john.txt", "jane.txt", "sam.txt"]
+    assert calls.count(JOB_PROFILE) == 1
+    assert len(calls) == len(RESUMES) + 2
+    assert results[1].to_dict() == json.loads(plugin.analyze_resume(RESUMES[1]["content"], JOB_PROFILE, "jane.txt"))
+    print("✅ Job requirements are parsed once per profile")
+
+
+def test_job_requirements_memo_is_thread_safe():
+    """Agents share one plugin, so concurrent lookups must not corrupt the LRU memo"""
+    plugin = ResumeScreeningPlugin()
+    plugin._requirements_cache_size = 4
+    profiles = [f"{JOB_PROFILE} variant {i}" for i in range(16)]
+    expected = {profile: plugin._extract_job_requirements(profile) for profile in profiles}
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(plugin._extract_job_requirements, profiles * 200))
+
+    assert results == [expected[profile] for profile in profiles * 200]
+    assert len(plugin._requirements_cache) <= 4
+    print("✅ Job requirements memo is safe across threads")
+
+
+def _random_pool(size, seed=7):
+    words = ("Python Java SQL AWS Docker Django Leadership Agile Bachelor Master MBA PhD "
+             "University Engineering Business the with and team").split()
+    rng = random.Random(seed)
+    pool = []
+    for i in range(size):
+        text = " ".join(rng.choice(words) for _ in range(30))
+        text += f" {rng.randint(0, 9)} years of experience"
+        pool.append({"filename": f"candidate_{i}.txt", "content": text})
+    return pool
+
+
+def test_vectorized_ranking_matches_per_candidate_scoring():
+    """Batch NumPy scoring ranks the pool exactly like per-candidate scoring"""
+    plugin = ResumeScreeningPlugin()
+    pool = _random_pool(300)
+    for job_profile in (JOB_PROFILE, "Any role", "Python developer, 0 years of experience"):
+        expected = json.loads(plugin.rank_candidates(
+            [json.dumps(result.to_dict()) for result in plugin.analyze_resumes(pool, job_profile)], top_n=10
+        ))
+        ranking = plugin.rank_resumes(pool, job_profile, top_n=10)
+        assert ranking == expected, job_profile
+    assert plugin.rank_resumes(pool[:3], JOB_PROFILE, top_n=10)["total_candidates"] == 3
+    print("✅ Vectorized ranking matches per-candidate scoring")
+
+
+def test_heap_ranking_is_stable():
+    """Heap-based top N matches a full stable sort, including ties"""
+    scores = [CandidateScore(f"c{i}", float(i % 7)) for i in range(1000)]
+    expected = sorted(scores, key=lambda score: score.overall_score, reverse=True)[:25]
+    assert [s.candidate for s in rank_scores(iter(scores), 25)] == [s.candidate for s in expected]
+
+    plugin = ResumeScreeningPlugin()
+    ranking = plugin.rank((score for score in scores), top_n=3)
+    assert ranking["total_candidates"] == 1000
+    assert [row["candidate"] for row in ranking["ranking_summary"]] == ["c6", "c13", "c20"]
+    print("✅ Heap ranking keeps stable order")
+
+
+def test_candidate_score_round_trip():
+    """Scores survive the JSON boundary; unknown fields are rejected and instances are unhashable"""
+    score = CandidateScore("jane.pdf", 82.5, skill_score=90.0, extracted_skills=["python"])
+    assert CandidateScore.from_dict(json.loads(json.dumps(score.to_dict()))) == score
+    try:
+        CandidateScore.from_dict({"candidate": "jane.pdf", "overall_score": 82.5, "score": 82.5})
+    except ValueError as e:
+        assert "score" in str(e)
+    else:
+        raise AssertionError("unknown field accepted")
+    try:
+        hash(score)
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("CandidateScore is hashable")
+    print("✅ CandidateScore round-trips and rejects unknown fields")
+
+
+if __name__ == "__main__":
+    print("Resume Screening Plugin Test")
+    print("=" * 50)
+
+    try:
+        test_precompiled_matcher()
+        test_overlapping_terms_are_all_found()
+        test_analyze_resume_uses_matcher()
+        test_job_requirements_memoized()
+        test_job_requirements_memo_is_thread_safe()
+        test_vectorized_ranking_matches_per_candidate_scoring()
+        test_heap_ranking_is_stable()
+        test_candidate_score_round_trip()
+        print("\n✅ All resume screening tests completed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Test script for the orchestrator agent-roster cache
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+# Add src to path
+sys.path.append(os.path.dirname(__file__))
+
+from src.roster_cache import RosterCache
+
+ROSTER = [{"name": "Skills Analyst", "role": "Skills", "system_prompt": "You review skills."}]
+
+
+def test_roster_round_trip():
+    with tempfile.TemporaryDirectory() as cache_dir:
+        path = os.path.join(cache_dir, "rosters.json")
+        cache = RosterCache(path, ttl_seconds=3600, max_entries=10)
+        key = cache.key_for("Senior  Python Developer\n", 4, "gemini:gemini-1.5-flash", "v1")
+        assert key == cache.key_for("senior python developer", 4, "gemini:gemini-1.5-flash", "v1")
+        assert key != cache.key_for("senior python developer", 5, "gemini:gemini-1.5-flash", "v1")
+        assert key != cache.key_for("senior python developer", 4, "gemini:gemini-1.5-flash", "v2")
+
+        assert cache.get(key) is None
+        cache.put(key, ROSTER)
+        assert cache.get(key) == ROSTER
+        # Survives a restart
+        assert RosterCache(path).get(key) == ROSTER
+        assert cache.stats() == {"entries": 1, "hits": 1, "misses": 1}
+    print("✅ Rosters are cached by job profile, agent count, model and template")
+
+
+def test_roster_expiry_and_eviction():
+    with tempfile.TemporaryDirectory() as cache_dir:
+        path = os.path.join(cache_dir, "rosters.json")
+        expiring = RosterCache(path, ttl_seconds=0.05, max_entries=10)
+        expiring.put("old", ROSTER)
+        time.sleep(0.1)
+        assert expiring.get("old") is None
+
+        cache = RosterCache(path, ttl_seconds=3600, max_entries=2)
+        cache.put("a", ROSTER)
+        cache.put("b", ROSTER)
+        time.sleep(0.01)
+        cache.get("a")
+        cache.put("c", ROSTER)
+        assert cache.get("b") is None
+        assert cache.get("a") == ROSTER and cache.get("c") == ROSTER
+    print("✅ Expired and least recently used rosters are dropped")
+
+
+if __name__ == "__main__":
+    print("Roster Cache Test")
+    print("=" * 50)
+
+    try:
+        test_roster_round_trip()
+        test_roster_expiry_and_eviction()
+        print("\n✅ All roster cache tests completed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
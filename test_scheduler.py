@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Test script for the rate-limit aware model call scheduler (no API calls)
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+# Add src to path
+sys.path.append(os.path.dirname(__file__))
+
+from fake_clients import chat_client
+from src import scheduler as scheduler_module
+from src.scheduler import (AGENT, ORCHESTRATOR, TERMINATION, ModelScheduler, ScheduledChatCompletionMixin,
+                           ScheduledClient, TokenBucket, estimate_tokens, is_retryable)
+
+
+class FakeStatusError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+def test_token_bucket():
+    bucket = TokenBucket(60)
+    assert bucket.reserve(60) == 0.0
+    assert 0.9 < bucket.reserve(1) <= 1.0
+    assert TokenBucket(0).reserve(10 ** 6) == 0.0
+    print("✅ Token buckets allow bursts up to the limit, then pace requests")
+
+
+def test_max_in_flight():
+    scheduler = ModelScheduler("test", max_in_flight=2, max_retries=0)
+    running, peak = [0], [0]
+
+    async def call():
+        running[0] += 1
+        peak[0] = max(peak[0], running[0])
+        await asyncio.sleep(0.02)
+        running[0] -= 1
+        return "ok"
+
+    async def run():
+        return await asyncio.gather(*(scheduler.submit(call) for _ in range(6)))
+
+    assert asyncio.run(run()) == ["ok"] * 6
+    stats = scheduler.stats()
+    assert peak[0] == 2 and stats["completed"] == 6 and stats["in_flight"] == 0 and stats["queue_depth"] == 0
+    assert stats["max_wait_seconds"] > 0
+    print("✅ No more than max_in_flight calls run at once")
+
+
+def test_priority_order():
+    scheduler = ModelScheduler("test", max_in_flight=1, max_retries=0)
+    order = []
+
+    async def call(name):
+        order.append(name)
+        await asyncio.sleep(0.01)
+
+    async def run():
+        first = asyncio.create_task(scheduler.submit(lambda: call("first"), AGENT))
+        await asyncio.sleep(0)
+        waiting = [
+            asyncio.create_task(scheduler.submit(lambda: call("termination"), TERMINATION)),
+            asyncio.create_task(scheduler.submit(lambda: call("agent"), AGENT)),
+            asyncio.create_task(scheduler.submit(lambda: call("orchestrator"), ORCHESTRATOR)),
+        ]
+        await asyncio.sleep(0)
+        assert scheduler.stats()["queue_depth"] == 3
+        await asyncio.gather(first, *waiting)
+
+    asyncio.run(run())
+    assert order == ["first", "orchestrator", "agent", "termination"]
+    print("✅ Orchestrator calls go before agents, agents before termination checks")
+
+
+def test_retries_with_backoff():
+    scheduler = ModelScheduler("test", max_in_flight=4, max_retries=3, base_delay=0.01)
+    attempts = []
+
+    async def flaky():
+        attempts.append(time.perf_counter())
+        if len(attempts) < 3:
+            raise FakeStatusError(429 if len(attempts) == 1 else 503)
+        return "ok"
+
+    async def bad_request():
+        raise FakeStatusError(400)
+
+    assert asyncio.run(scheduler.submit(flaky)) == "ok"
+    try:
+        asyncio.run(scheduler.submit(bad_request))
+        assert False, "client errors must not be retried"
+    except FakeStatusError:
+        pass
+    stats = scheduler.stats()
+    assert len(attempts) == 3 and stats["retries"] == 2 and stats["throttled"] == 1 and stats["failed"] == 1
+    assert is_retryable(FakeStatusError(500)) and not is_retryable(ValueError("bad"))
+    print("✅ 429 and 5xx responses are retried with backoff, other errors are not")
+
+
+def test_scheduled_client():
+    scheduler = ModelScheduler("test", max_in_flight=1, max_retries=0)
+
+    def create(**kwargs):
+        return kwargs["model"]
+
+    async def create_stream(**kwargs):
+        async def chunks():
+            assert scheduler.stats()["in_flight"] == 1
+            yield "a"
+            yield "b"
+        return chunks()
+
+    async def run():
+        client = ScheduledClient(chat_client(create), scheduler)
+        assert await client.chat.completions.create(model="m", messages=[]) == "m"
+        stream_client = ScheduledClient(chat_client(create_stream), scheduler)
+        stream = await stream_client.chat.completions.create(model="m", messages=[], stream=True)
+        return [chunk async for chunk in stream]
+
+    assert asyncio.run(run()) == ["a", "b"]
+    assert scheduler.stats()["in_flight"] == 0
+    request = {"messages": [{"role": "user", "content": "x" * 400}], "max_completion_tokens": 100}
+    assert estimate_tokens(request) == 200
+    print("✅ Wrapped clients are scheduled and streams hold their slot until consumed")
+
+
+class _Settings:
+    def __init__(self):
+        self.stream = False
+
+    def prepare_settings_dict(self):
+        return {"model": "m", "max_completion_tokens": 100}
+
+
+class _FakeChatService:
+    """Stand-in for the Semantic Kernel OpenAI chat service the mixin sits on"""
+
+    service_id = "agents"
+
+    def __init__(self, scheduler):
+        self.scheduler = scheduler
+        self.sent = []
+
+    def _prepare_chat_history_for_request(self, chat_history):
+        return [{"role": "user", "content": message} for message in chat_history]
+
+    async def _send_request(self, settings):
+        self.sent.append(settings.stream)
+        return "completion"
+
+    async def _inner_get_streaming_chat_message_contents(self, chat_history, settings, function_invoke_attempt=0):
+        settings.stream = True
+        await self._send_request(settings)
+        for word in ("Strong ", "match"):
+            await asyncio.sleep(0.01)
+            assert self.scheduler.stats()["in_flight"] == 1
+            yield [word]
+
+
+class _ScheduledChatService(ScheduledChatCompletionMixin, _FakeChatService):
+    scheduler_service = "test-sk"
+
+
+def test_semantic_kernel_streams_hold_their_slot():
+    scheduler = scheduler_module._schedulers["test-sk"] = ModelScheduler("test-sk", max_in_flight=1, max_retries=0)
+    service = _ScheduledChatService(scheduler)
+
+    async def run():
+        assert await service._send_request(_Settings()) == "completion"
+        return [chunk async for chunk in service._inner_get_streaming_chat_message_contents(["Screen"], _Settings())]
+
+    assert asyncio.run(run()) == [["Strong "], ["match"]]
+    assert service.sent == [False, True]
+    stats = scheduler.stats()
+    assert stats["in_flight"] == 0 and stats["completed"] == 2
+    del scheduler_module._schedulers["test-sk"]
+    print("✅ Semantic Kernel streams keep their slot until the last chunk")
+
+
+if __name__ == "__main__":
+    print("Model Call Scheduler Test")
+    print("=" * 50)
+
+    try:
+        test_token_bucket()
+        test_max_in_flight()
+        test_priority_order()
+        test_retries_with_backoff()
+        test_scheduled_client()
+        test_semantic_kernel_streams_hold_their_slot()
+        print("\n✅ All scheduler tests completed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Test script for incremental rescreening through the screening ledger (no API calls)
+"""
+
+import asyncio
+import json
+import os
+import sys
+import tempfile
+
+# Add src to path
+sys.path.append(os.path.dirname(__file__))
+
+from fake_clients import FakeCompletions, chat_client, fake_agent
+from src.corpus_store import CorpusStore
+from src.map_reduce import AgentVerdict, MapReduceScreening, reduce_verdicts
+from src.screening_ledger import ScreeningLedger
+
+JOB_PROFILE = "Senior Python developer"
+
+
+class ScoringCompletions(FakeCompletions):
+    """Scores resumes mentioning Python higher and counts the resumes it saw"""
+
+    def __init__(self):
+        super().__init__()
+        self.screened = []
+
+    def reply(self, messages):
+        resume = messages[1]["content"].split("Resume (", 1)[1]
+        self.screened.append(resume.split(")", 1)[0])
+        return json.dumps({"filename": "", "score": 90 if "Python" in resume else 40, "summary": "Reviewed",
+                           "strengths": [], "concerns": []})
+
+
+AGENTS = [fake_agent("Skills"), fake_agent("Culture")]
+ROSTER = [{"name": agent.name, "role": "Reviewer", "system_prompt": agent.instructions} for agent in AGENTS]
+
+
+def _pool(count):
+    return [{"filename": f"resume_{i}.txt", "content": f"Candidate {i}: {'Python' if i % 2 else 'Java'} developer"}
+            for i in range(count)]
+
+
+def _rescreen(ledger, screening, resumes):
+    """What the app does: screen only what the ledger does not know, then rank the whole pool"""
+    requisition = ledger.requisition_key(JOB_PROFILE, ROSTER, "openai:fake-model")
+    stored, pending = ledger.lookup(requisition, resumes)
+    verdicts = asyncio.run(screening.screen(JOB_PROFILE, pending))
+    ledger.record(requisition, pending, verdicts, [agent.name for agent in AGENTS])
+    return reduce_verdicts(stored + verdicts, resumes), len(resumes) - len(pending)
+
+
+def test_rerun_costs_the_delta():
+    completions = ScoringCompletions()
+    client = chat_client(completions)
+    screening = MapReduceScreening(AGENTS, client, "fake-model", concurrency=4, max_chars=0)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        ledger = ScreeningLedger(os.path.join(cache_dir, "ledger.sqlite3"))
+        pool = _pool(20)
+        first, reused = _rescreen(ledger, screening, pool)
+        assert len(completions.screened) == 40 and len(ledger) == 20 and reused == 0
+
+        # Five new resumes and one edited resume: only those six reach the agents
+        completions.screened.clear()
+        pool = pool + _pool(25)[20:]
+        pool[0] = {"filename": "resume_0.txt", "content": "Candidate 0: Python developer, now with Django"}
+        second, reused = _rescreen(ledger, screening, pool)
+        assert sorted(set(completions.screened)) == sorted(["resume_0.txt"] + [f"resume_{i}.txt" for i in range(20, 25)])
+        assert len(completions.screened) == 12
+
+        assert len(second) == 25 and len(first) == 20
+        scores = {result["filename"]: result["score"] for result in second}
+        assert scores["resume_0.txt"] == 90 and scores["resume_1.txt"] == 90 and scores["resume_2.txt"] == 40
+        assert second[0]["agent_scores"] == {"Skills": 90, "Culture": 90}
+        assert reused == 19
+    print("✅ A rerun only screens new or modified resumes and ranks the whole pool")
+
+
+def test_requisition_key():
+    key = ScreeningLedger.requisition_key(JOB_PROFILE, ROSTER, "openai:gpt-4o")
+    assert ScreeningLedger.requisition_key("  senior python   DEVELOPER ", ROSTER, "openai:gpt-4o") == key
+    assert ScreeningLedger.requisition_key(JOB_PROFILE, ROSTER, "openai:gpt-4o-mini") != key
+    stricter = [dict(ROSTER[0], system_prompt="Be strict"), ROSTER[1]]
+    assert ScreeningLedger.requisition_key(JOB_PROFILE, stricter, "openai:gpt-4o") != key
+    assert ScreeningLedger.requisition_key("Java developer", ROSTER, "openai:gpt-4o") != key
+    print("✅ Job profile, agent roster and model key the requisition")
+
+
+def test_only_complete_resumes_are_recorded():
+    with tempfile.TemporaryDirectory() as cache_dir:
+        ledger = ScreeningLedger(os.path.join(cache_dir, "ledger.sqlite3"))
+        store = CorpusStore(os.path.join(cache_dir, "corpus"))
+        stored_resume = store.add_resume("jane.pdf", "Jane Doe, Python")
+        failed = {"filename": "john.pdf", "content": "John Smith, Java"}
+        # Culture never returned a verdict for Sam, e.g. it left him out of its report
+        partial = {"filename": "sam.pdf", "content": "Sam Lee, Go"}
+        verdicts = [
+            AgentVerdict("Skills", "jane.pdf", score=80, strengths=["Python"]),
+            AgentVerdict("Culture", "jane.pdf", score=70),
+            AgentVerdict("Skills", "john.pdf", score=50),
+            AgentVerdict("Culture", "john.pdf", error="Rate limited"),
+            AgentVerdict("Skills", "sam.pdf", score=60),
+        ]
+        assert ledger.record("requisition", [stored_resume, failed, partial], verdicts, ["Skills", "Culture"]) == 1
+
+        # Same content under another filename is reused; failed and partially screened resumes are screened again
+        renamed = {"filename": "jane_doe_2024.pdf", "content": "Jane Doe, Python"}
+        stored, pending = ledger.lookup("requisition", [renamed, failed, partial])
+        assert sorted((verdict.agent, verdict.filename, verdict.strengths) for verdict in stored) == \
+            [("Culture", "jane_doe_2024.pdf", []), ("Skills", "jane_doe_2024.pdf", ["Python"])]
+        assert pending == [failed, partial]
+        assert ledger.lookup("other requisition", [renamed])[1] == [renamed]
+        store.close()
+    print("✅ Only resumes every agent scored are recorded, by content")
+
+
+def test_same_filename_different_content_is_not_mixed_up():
+    """Verdicts for a filename shared by two different uploads are not recorded under either"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        ledger = ScreeningLedger(os.path.join(cache_dir, "ledger.sqlite3"))
+        old = {"filename": "resume.pdf", "content": "Jane Doe, Java"}
+        new = {"filename": "resume.pdf", "content": "John Smith, Python"}
+        other = {"filename": "sam.pdf", "content": "Sam Lee, Go"}
+        verdicts = [AgentVerdict("Skills", "resume.pdf", score=40), AgentVerdict("Skills", "resume.pdf", score=90),
+                    AgentVerdict("Skills", "sam.pdf", score=70)]
+        assert ledger.record("requisition", [old, new, other], verdicts, ["Skills"]) == 1
+        stored, pending = ledger.lookup("requisition", [old, new, other])
+        assert pending == [old, new] and [verdict.score for verdict in stored] == [70]
+    print("✅ Verdicts are recorded by resume content, never across uploads sharing a filename")
+
+
+if __name__ == "__main__":
+    print("Screening Ledger Test")
+    print("=" * 50)
+
+    try:
+        test_rerun_costs_the_delta()
+        test_requisition_key()
+        test_only_complete_resumes_are_recorded()
+        test_same_filename_different_content_is_not_mixed_up()
+        print("\n✅ All screening ledger tests completed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
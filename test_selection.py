@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Test script for rule-based agent selection and the parallel group chat (no API calls)
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+# Add src to path
+sys.path.append(os.path.dirname(__file__))
+
+from semantic_kernel.agents import ChatCompletionAgent
+from semantic_kernel.contents.chat_message_content import ChatMessageContent
+from semantic_kernel.contents.streaming_chat_message_content import StreamingChatMessageContent
+from semantic_kernel.contents.utils.author_role import AuthorRole
+from semantic_kernel.kernel import Kernel
+
+from src.mas import ParallelAgentGroupChat
+from src.progress import DONE, ProgressReporter
+from src.selection import CoverageSelectionStrategy, RoundRobinSelectionStrategy
+from src.termination import CONVERGED, LocalTerminationStrategy, TerminationPolicy
+
+CANDIDATES = ["jane_doe.pdf", "john_smith.docx"]
+
+
+class FakeAgent(ChatCompletionAgent):
+    """Streams a canned reply in two chunks after a delay"""
+
+    reply: str = ""
+    delay: float = 0.0
+
+    async def invoke_stream(self, history, arguments=None, kernel=None, **kwargs):
+        await asyncio.sleep(self.delay)
+        half = len(self.reply) // 2
+        for part in (self.reply[:half], self.reply[half:]):
+            yield StreamingChatMessageContent(role=AuthorRole.ASSISTANT, name=self.name, content=part, choice_index=0)
+        history.add_message(ChatMessageContent(role=AuthorRole.ASSISTANT, name=self.name, content=self.reply))
+
+
+def _agent(name, reply="", delay=0.0):
+    agent = FakeAgent(id=name, name=name, kernel=Kernel(), instructions="Review resumes")
+    agent.reply, agent.delay = reply, delay
+    return agent
+
+
+def _said(name, content):
+    return ChatMessageContent(role=AuthorRole.ASSISTANT, name=name, content=content)
+
+
+def test_round_robin():
+    agents = [_agent("Skills"), _agent("Experience"), _agent("Culture")]
+    strategy = RoundRobinSelectionStrategy()
+    user = ChatMessageContent(role=AuthorRole.USER, content="Screen these resumes")
+    assert asyncio.run(strategy.select_agent(agents, [user])).name == "Skills"
+    assert asyncio.run(strategy.select_agent(agents, [user, _said("Experience", "...")])).name == "Culture"
+    assert asyncio.run(strategy.select_agent(agents, [user, _said("Culture", "...")])).name == "Skills"
+    print("✅ Round robin follows the roster after the last speaker")
+
+
+def test_coverage():
+    agents = [_agent("Skills"), _agent("Experience"), _agent("Culture")]
+    strategy = CoverageSelectionStrategy(candidates=CANDIDATES)
+    history = [
+        _said("Skills", "jane_doe.pdf: 80, john_smith.docx: 70"),
+        _said("Experience", "jane_doe.pdf: 60"),
+        _said("Culture", "Still reading"),
+    ]
+    assert asyncio.run(strategy.select_agent(agents, history)).name == "Experience"
+    history.append(_said("Experience", "john_smith.docx: 75"))
+    assert asyncio.run(strategy.select_agent(agents, history)).name == "Culture"
+    print("✅ Coverage selection favours the agent with the most unscored candidates")
+
+
+def test_parallel_group_chat():
+    agents = [_agent("Skills", "Solid skills overall", 0.2), _agent("Experience", "Strong track record", 0.2),
+              _agent("Lead", "Recommend: yes", 0.3)]
+    group = ParallelAgentGroupChat(
+        agents=agents,
+        termination_strategy=LocalTerminationStrategy(policy=TerminationPolicy("yes", max_rounds=0), maximum_iterations=2),
+    )
+    reporter = ProgressReporter()
+    group.reporter = reporter
+
+    async def run():
+        await group.add_chat_message(ChatMessageContent(role=AuthorRole.USER, content="Screen these resumes"))
+        return [chunk async for chunk in group.invoke_stream()]
+
+    start = time.perf_counter()
+    chunks = asyncio.run(run())
+    elapsed = time.perf_counter() - start
+    assert elapsed < 0.6 and len(chunks) == 6
+    assert group.is_complete
+    assert [message.name for message in group.history.messages[1:]] == ["Skills", "Experience", "Lead"]
+    assert reporter.counts()[DONE] == 3 and set(group.stream_metrics) == {"Skills", "Experience", "Lead"}
+    print(f"✅ All agents answered in one parallel round ({elapsed:.2f}s) without a selection call")
+
+
+def test_parallel_rounds_converge_as_a_whole():
+    """Two fast agents agreeing do not end the round; the next round agreeing does"""
+    agents = [_agent("Skills", "jane_doe.pdf: 90, john_smith.docx: 40", 0.01),
+              _agent("Experience", "jane_doe.pdf: 80, john_smith.docx: 45", 0.02),
+              _agent("Culture", "john_smith.docx: 70, jane_doe.pdf: 75", 0.1)]
+    policy = TerminationPolicy("yes", CANDIDATES, max_rounds=0, patience=2, round_size=None)
+    strategy = LocalTerminationStrategy(policy=policy, maximum_iterations=2)
+    group = ParallelAgentGroupChat(agents=agents, termination_strategy=strategy)
+
+    async def run():
+        await group.add_chat_message(ChatMessageContent(role=AuthorRole.USER, content="Screen these resumes"))
+        [chunk async for chunk in group.invoke_stream()]
+        complete_after_first = group.is_complete
+        [chunk async for chunk in group.invoke_stream()]
+        return complete_after_first
+
+    assert not asyncio.run(run())
+    assert group.is_complete and strategy.reason == CONVERGED
+    assert [message.name for message in group.history.messages[1:]] == ["Skills", "Experience", "Culture"] * 2
+    assert LocalTerminationStrategy(policy=policy).rounds == []
+    print("✅ Parallel rounds are checked for convergence once every agent has answered")
+
+
+if __name__ == "__main__":
+    print("Agent Selection Test")
+    print("=" * 50)
+
+    try:
+        test_round_robin()
+        test_coverage()
+        test_parallel_group_chat()
+        test_parallel_rounds_converge_as_a_whole()
+        print("\n✅ All selection tests completed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Test script for structured model output and validated parsing (no API calls)
+"""
+
+import json
+import os
+import sys
+
+# Add src to path
+sys.path.append(os.path.dirname(__file__))
+
+from src.map_reduce import AgentVerdict, reduce_verdicts, verdicts_from_report
+from src.mas import GeminiModelCache, Orchestrator, _generation_config
+from src.structured import (AgentRoster, CandidateScoreSchema, ScreeningReport, StructuredOutputError,
+                            parse_structured, response_format)
+from src.termination import extract_scores, has_verdict
+
+RESUMES = [{"filename": "jane_doe.pdf", "content": ""}, {"filename": "john_smith.docx", "content": ""}]
+
+
+def _walk(schema):
+    yield schema
+    for value in schema.values():
+        if isinstance(value, dict):
+            yield from _walk(value)
+
+
+def test_strict_schema():
+    schema = response_format(ScreeningReport)["json_schema"]["schema"]
+    objects = [node for node in _walk(schema) if node.get("type") == "object"]
+    assert len(objects) == 2 and "$defs" not in schema
+    assert all(node["additionalProperties"] is False and node["required"] == list(node["properties"])
+               for node in objects)
+    assert not any("title" in node or "default" in node or "$ref" in node for node in _walk(schema))
+    print("✅ Schemas are self-contained and strict")
+
+
+def test_gemini_generation_config():
+    config = _generation_config(max_completion_tokens=400, response_format=response_format(CandidateScoreSchema))
+    assert config["response_mime_type"] == "application/json"
+    assert "additionalProperties" not in json.dumps(config["response_schema"])
+    assert config["response_schema"]["properties"]["score"]["type"] == "number"
+    assert GeminiModelCache.key_for("gemini", config, None) == GeminiModelCache.key_for("gemini", dict(config), None)
+    assert _generation_config(response_format={"type": "json_object"}) == {"response_mime_type": "application/json"}
+    print("✅ Gemini requests get a JSON mime type and response schema")
+
+
+def test_validated_parsing():
+    record = parse_structured(CandidateScoreSchema, '{"filename": "jane_doe.pdf", "score": 140, "summary": "Strong"}')
+    assert record.score == 100 and record.strengths == []
+    fenced = '```json\n{"agents": [{"name": "Skills", "role": "Skills", "system_prompt": "Review"}]}\n```'
+    assert parse_structured(AgentRoster, fenced).agents[0].name == "Skills"
+    for reply in ("Great candidate!", '{"summary": "no score"}', None):
+        try:
+            parse_structured(CandidateScoreSchema, reply)
+        except StructuredOutputError:
+            continue
+        raise AssertionError(f"accepted {reply!r}")
+    assert not AgentVerdict.from_text("Skills", "jane_doe.pdf", '{"score": "high"}').ok
+    print("✅ Replies are validated into typed records")
+
+
+def test_orchestrator_roster():
+    content = json.dumps({"agents": [{"name": "Skills Expert", "role": "Skills", "system_prompt": "Review skills"}]})
+    response = type("Response", (), {"model_dump_json": lambda self: json.dumps(
+        {"choices": [{"message": {"content": content}}]})})()
+    roster = Orchestrator.parse_response(None, response)
+    assert roster == {"agents": [{"name": "Skills Expert", "role": "Skills", "system_prompt": "Review skills"}]}
+    print("✅ The orchestrator roster is parsed without stripping code fences")
+
+
+def test_chat_reports_rank_candidates():
+    lead = ScreeningReport(analysis="Jane fits best.", complete=True, candidates=[
+        CandidateScoreSchema(filename="jane_doe.pdf", score=88, summary="Strong Python", strengths=["Python"]),
+        CandidateScoreSchema(filename="John_Smith", score=61, summary="Junior", concerns=["Little Python"]),
+        CandidateScoreSchema(filename="unknown.pdf", score=99),
+    ]).model_dump_json()
+    skills = ScreeningReport(candidates=[CandidateScoreSchema(filename="jane_doe.pdf", score=92)]).model_dump_json()
+    verdicts = verdicts_from_report("Lead", lead, RESUMES) + verdicts_from_report("Skills", skills, RESUMES)
+    assert verdicts_from_report("Lead", "Free text only", RESUMES) == []
+
+    results = reduce_verdicts(verdicts, RESUMES)
+    assert [(result["filename"], result["score"]) for result in results] == [("jane_doe.pdf", 90), ("john_smith.docx", 61)]
+    assert results[1]["concerns"] == ["Little Python"]
+
+    # Local termination, selection and history read the same replies
+    assert has_verdict(lead, "no-keyword") and not has_verdict(skills, "no-keyword")
+    assert extract_scores(lead, ["jane_doe.pdf"]) == {"jane_doe.pdf": 88}
+    print("✅ Structured chat reports flow straight into the ranking")
+
+
+if __name__ == "__main__":
+    print("Structured Output Test")
+    print("=" * 50)
+
+    try:
+        test_strict_schema()
+        test_gemini_generation_config()
+        test_validated_parsing()
+        test_orchestrator_roster()
+        test_chat_reports_rank_candidates()
+        print("\n✅ All structured output tests completed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()
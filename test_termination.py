@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test script for the local termination checks of agent group chats (no API calls)
+"""
+
+import asyncio
+import os
+import sys
+
+# Add src to path
+sys.path.append(os.path.dirname(__file__))
+
+from semantic_kernel.contents.chat_message_content import ChatMessageContent
+from semantic_kernel.contents.utils.author_role import AuthorRole
+
+from src.termination import (CONVERGED, MAX_ROUNDS, VERDICT, LocalTerminationStrategy, TerminationPolicy,
+                             extract_ranking, has_verdict)
+
+CANDIDATES = ["jane_doe.pdf", "john_smith.docx"]
+
+
+def test_keyword_and_structured_verdicts():
+    assert has_verdict("Recommendation: YES, move forward", "yes")
+    assert not has_verdict("The candidate's eyes are on growth", "yes")
+    assert has_verdict('Done reviewing. {"complete": true}', "yes")
+    assert has_verdict('{"verdict": "yes", "score": 80}', "yes")
+    assert not has_verdict('{"complete": false}', "yes") and not has_verdict("", "yes")
+    # "yes" inside the analysis, or inside a structured reply's text, is not a verdict
+    assert not has_verdict("Does she know Python? Yes, six years of it.\nStill comparing candidates.", "yes")
+    assert has_verdict("Both candidates reviewed.\nFinal answer: yes\n", "yes")
+    assert not has_verdict('{"analysis": "Yes, strong Python skills", "complete": false}', "yes")
+    print("✅ Keywords and structured verdicts end the chat")
+
+
+def test_ranking_extraction():
+    text = "jane_doe: 72/100 overall.\nJohn_Smith.docx - Score: 88"
+    assert extract_ranking(text, CANDIDATES) == ("john_smith.docx", "jane_doe.pdf")
+    assert extract_ranking("Only jane_doe scored 90", CANDIDATES) == ()
+    print("✅ Candidate rankings are read from agent messages")
+
+
+def test_policy_reasons():
+    policy = TerminationPolicy("yes", CANDIDATES, max_rounds=0, patience=2, round_size=2)
+    first = "jane_doe.pdf: 80, john_smith.docx: 60"
+    same = "Agreed. john_smith.docx 65 and jane_doe.pdf 85"
+    flipped = "john_smith.docx: 90, jane_doe.pdf: 70"
+    # Two agents agreeing within one round is not convergence, only two rounds agreeing is
+    assert policy.reason([first, same]) is None
+    assert policy.reason([first, "Needs more detail", same, "Still reviewing"]) == CONVERGED
+    assert policy.reason([first, "Needs more detail", flipped, "Still reviewing"]) is None
+    # Rounds are compared on their combined ranking, which the second round flips
+    assert policy.reason([first, same, "jane_doe.pdf: 90", "john_smith.docx: 100"]) is None
+    assert policy.reason([first, "Final answer: yes"]) == VERDICT
+    assert TerminationPolicy("yes", max_rounds=3).reason(["a", "b", "c"]) == MAX_ROUNDS
+    assert TerminationPolicy("yes", max_rounds=3).reason(["c"], earlier_turns=2) == MAX_ROUNDS
+    print("✅ Chats end on a verdict, the round limit or a converged ranking")
+
+
+def test_rounds_converge_on_the_combined_ranking():
+    policy = TerminationPolicy("yes", CANDIDATES, max_rounds=0, patience=2, round_size=None)
+    round_one = ["jane_doe.pdf: 80, john_smith.docx: 60", "john_smith.docx: 75, jane_doe.pdf 70"]
+    round_two = ["jane_doe.pdf: 90", "john_smith.docx 50"]
+    # Without a round size, single messages never converge, rounds are reported by the chat
+    assert policy.reason(round_one + round_two) is None
+    assert policy.round_reason([round_one]) is None
+    assert policy.round_reason([round_one, round_two]) == CONVERGED
+    assert policy.round_reason([round_one, ["john_smith.docx: 99, jane_doe.pdf: 10"]]) is None
+    print("✅ Convergence compares the combined ranking of whole rounds")
+
+
+def test_semantic_kernel_strategy():
+    agent = type("Agent", (), {"id": "Lead"})()
+    strategy = LocalTerminationStrategy(policy=TerminationPolicy("yes", CANDIDATES, max_rounds=0, patience=2))
+    history = [
+        ChatMessageContent(role=AuthorRole.USER, content="Screen: jane_doe.pdf 99, john_smith.docx 1"),
+        ChatMessageContent(role=AuthorRole.ASSISTANT, name="Lead", content="Still reviewing"),
+    ]
+    assert not asyncio.run(strategy.should_agent_terminate(agent, history))
+    history.append(ChatMessageContent(role=AuthorRole.ASSISTANT, name="Lead", content="Hire: yes"))
+    assert asyncio.run(strategy.should_agent_terminate(agent, history))
+    assert strategy.reason == VERDICT
+    print("✅ The Semantic Kernel strategy decides without a model call")
+
+
+if __name__ == "__main__":
+    print("Termination Checks Test")
+    print("=" * 50)
+
+    try:
+        test_keyword_and_structured_verdicts()
+        test_ranking_extraction()
+        test_policy_reasons()
+        test_rounds_converge_on_the_combined_ranking()
+        test_semantic_kernel_strategy()
+        print("\n✅ All termination tests completed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Test failed with error: {str(e)}")
+        import traceback
+        traceback.print_exc()